@@ -3,8 +3,10 @@
 """
 Module for moving operations in statistical analysis.
 
-This module provides functions to compute the moving sum and moving average
-of arrays, supporting operations on both one-dimensional and multi-dimensional arrays.
+This module provides functions to compute the moving sum, average, minimum,
+maximum, variance, standard deviation and quantiles of arrays, as well as
+exponentially weighted and streaming moving statistics, supporting
+operations on both one-dimensional and multi-dimensional arrays.
 These functions are designed to facilitate analysis across various
 domains, including finance, climate science, and more.
 """
@@ -13,63 +15,205 @@ domains, including finance, climate science, and more.
 # Import modules #
 #----------------#
 
+import json
+
 import numpy as np
-from scipy.signal import convolve
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from statflow.utils.helpers import batched_quantiles
 
 #------------------#
 # Define functions #
 #------------------#
 
-def window_sum(x: np.ndarray, N: int) -> np.ndarray:
+def window_sum(x: np.ndarray,
+               N: int,
+               axis: int = 0,
+               min_periods: int | None = None,
+               align: str | None = None) -> np.ndarray:
     """
     Computes the sum of elements in an array using a sliding window (moving sum).
     Applicable to any multidimensional array.
-    
+
     Parameters
     ----------
     x : numpy.ndarray
         Input array containing data.
     N : int
         Window size.
-    
+    axis : int, optional
+        Axis along which the window slides. Default is 0,
+        e.g. time for (time, lat, lon) arrays.
+    min_periods : int | None, optional
+        Minimum number of valid (non-NaN) values in a window for its sum
+        to be computed, over the valid values only; windows with fewer
+        are NaN. Defaults to None, which requires complete windows (N).
+    align : {"trailing", "centered"} | None, optional
+        Alignment of the windows with the output, which then has the length
+        of the input along `axis`, with partial windows at the edges:
+        - "trailing": each value sums the N values ending at its position,
+        - "centered": each value sums the N values centred on its position
+          (one more value before it than after it for even N, as in pandas).
+        Defaults to None, which only returns complete windows, the i-th one
+        summing the values from i to i+N-1 (length n-N+1 along `axis`,
+        as `numpy.convolve` in "valid" mode).
+
     Returns
     -------
     sum_window : numpy.ndarray
-        The moving sum of the elements.
-    
+        The moving sum of the elements. Integer input keeps its type
+        when every window is complete (`align=None`).
+
+    Raises
+    ------
+    ValueError
+        If the input is a scalar, the window size or `min_periods` is out
+        of range, or the alignment is unsupported.
+
     Notes
     -----
-    Designed for general use cases, including climate science, where typical array 
-    shape could be (time, lat, lon). Uses numpy for 1D arrays and switches to 
-    scipy.convolve for n-dimensional arrays.
-    """
-    dims = x.ndim
-    
-    if dims == 1:
-        try:
-            sum_window = np.convolve(x, np.ones(N, np.int64), mode="valid")
-        except:
-            sum_window = np.convolve(x, np.ones(N, np.float64), mode="valid")
-
-    elif dims > 1:   
-        number_of_ones = np.append(N, np.repeat(1, dims-1))
-        ones_size_tuple = tuple(number_of_ones)
-             
-        try:
-            sum_window = convolve(x, np.ones(ones_size_tuple, np.int64), mode="same")[1:]
-        except:
-            sum_window = convolve(x, np.ones(ones_size_tuple, np.float64), mode="same")[1:]
-            
+    Designed for general use cases, including climate science, where typical array
+    shape could be (time, lat, lon). Window sums are differences of a
+    cumulative sum along `axis`, which costs O(n) whatever the window size,
+    instead of O(n·N) for a convolution. Floating point values are
+    accumulated in double precision.
+    """
+    sum_window, count_window, min_periods = _window_sums_and_counts(x, N, axis, 
+                                                                    min_periods, align)
+    if count_window is not None:
+        masked_sums = np.where(count_window >= min_periods, sum_window, np.nan)
+        sum_window = masked_sums.astype(sum_window.dtype, copy=False)
+    return np.moveaxis(sum_window, 0, axis)
+
+
+def moving_average(x: np.ndarray,
+                   N: int,
+                   axis: int = 0,
+                   min_periods: int | None = None,
+                   align: str | None = None) -> np.ndarray:
+    """
+    Returns the moving average of an array, irrespective of dimension.
+    Uses the moving sum function and divides by the number of
+    valid values in each window (N if the window is complete).
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Input array containing data.
+    N : int
+        Window size.
+    axis : int, optional
+        Axis along which the window slides. Default is 0.
+    min_periods : int | None, optional
+        Minimum number of valid (non-NaN) values in a window for its
+        average to be computed, as in `window_sum`. Defaults to None (N).
+    align : {"trailing", "centered"} | None, optional
+        Alignment of the windows with the output, as in `window_sum`.
+        Defaults to None (complete windows only).
+
+    Returns
+    -------
+    numpy.ndarray
+        The moving average of the array.
+    """
+    sum_window, count_window, min_periods = _window_sums_and_counts(x, N, axis, 
+                                                                    min_periods, align)
+    if count_window is None:
+        avg_window = sum_window / N
     else:
-        raise ValueError("Scalar given, must be an array of N >= 1")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg_window = np.where(count_window >= min_periods, 
+                                  sum_window / count_window, 
+                                  np.nan)
+        avg_window = avg_window.astype(sum_window.dtype, copy=False)
+    return np.moveaxis(avg_window, 0, axis)
+
+
+def moving_min(x: np.ndarray,
+               N: int,
+               axis: int = 0,
+               min_periods: int | None = None,
+               align: str | None = None) -> np.ndarray:
+    """
+    Returns the moving minimum of an array, irrespective of dimension.
+    
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Input array containing data.
+    N : int
+        Window size.
+    axis : int, optional
+        Axis along which the window slides. Default is 0.
+    min_periods : int | None, optional
+        Minimum number of valid (non-NaN) values in a window for its
+        minimum to be computed, as in `window_sum`. Defaults to None (N).
+    align : {"trailing", "centered"} | None, optional
+        Alignment of the windows with the output, as in `window_sum`.
+        Defaults to None (complete windows only).
         
-    return sum_window
+    Returns
+    -------
+    numpy.ndarray
+        The moving minimum of the array.
+        
+    Notes
+    -----
+    Computed with the van Herk/Gil-Werman algorithm: the data is split into
+    blocks of N values, whose running minima from the start and from the 
+    end of each block are combined pairwise, at a cost of three comparisons
+    per value whatever the window size. Each step within the blocks is 
+    vectorised over all blocks and cells.
+    """
+    return _moving_extreme(x, N, axis, min_periods, align, np.minimum)
+
 
+def moving_max(x: np.ndarray,
+               N: int,
+               axis: int = 0,
+               min_periods: int | None = None,
+               align: str | None = None) -> np.ndarray:
+    """
+    Returns the moving maximum of an array, irrespective of dimension.
     
-def moving_average(x: np.ndarray, N: int) -> np.ndarray:
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Input array containing data.
+    N : int
+        Window size.
+    axis : int, optional
+        Axis along which the window slides. Default is 0.
+    min_periods : int | None, optional
+        Minimum number of valid (non-NaN) values in a window for its
+        maximum to be computed, as in `window_sum`. Defaults to None (N).
+    align : {"trailing", "centered"} | None, optional
+        Alignment of the windows with the output, as in `window_sum`.
+        Defaults to None (complete windows only).
+        
+    Returns
+    -------
+    numpy.ndarray
+        The moving maximum of the array.
+        
+    Notes
+    -----
+    Computed with the van Herk/Gil-Werman algorithm, as `moving_min`.
     """
-    Returns the moving average of an array, irrespective of dimension.
-    Uses the moving sum function and divides by the window size N.
+    return _moving_extreme(x, N, axis, min_periods, align, np.maximum)
+
+
+def moving_var(x: np.ndarray,
+               N: int,
+               axis: int = 0,
+               min_periods: int | None = None,
+               align: str | None = None,
+               ddof: int = 1) -> np.ndarray:
+    """
+    Returns the moving variance of an array, irrespective of dimension.
     
     Parameters
     ----------
@@ -77,10 +221,1084 @@ def moving_average(x: np.ndarray, N: int) -> np.ndarray:
         Input array containing data.
     N : int
         Window size.
+    axis : int, optional
+        Axis along which the window slides. Default is 0.
+    min_periods : int | None, optional
+        Minimum number of valid (non-NaN) values in a window for its
+        variance to be computed, as in `window_sum`. Defaults to None (N).
+    align : {"trailing", "centered"} | None, optional
+        Alignment of the windows with the output, as in `window_sum`.
+        Defaults to None (complete windows only).
+    ddof : int, default 1
+        Delta degrees of freedom: the divisor is the number of valid 
+        values minus `ddof` (windows with no more values than `ddof` are NaN).
+        
+    Returns
+    -------
+    numpy.ndarray
+        The moving variance of the array.
+        
+    Notes
+    -----
+    Windows are updated with Welford's algorithm, adding the incoming value
+    and removing the outgoing one from the running mean and sum of squared
+    deviations, which avoids the cancellation of the difference between the
+    moving sums of squares and the squared moving sums. The steps are 
+    vectorised over the cells and over segments of the window axis, the 
+    updates restarting at each segment, which also bounds the accumulation
+    of rounding errors over long series.
+    """
+    x, counts, min_periods = _window_input(x, N, axis, min_periods, align)
+    ndim, cell_shape = x.ndim, x.shape[1:]
+    n_out = len(x) - N + 1
+    
+    segments, segment_length = _segment_windows(x.reshape(len(x), -1), N)
+    n_values = np.zeros(segments.shape[1])
+    mean = np.zeros(segments.shape[1])
+    sq_dev_sum = np.zeros(segments.shape[1])
+    var_segments = np.empty((segment_length, segments.shape[1]))
+    
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for step, incoming in enumerate(segments):
+            _welford_update(incoming, n_values, mean, sq_dev_sum, 1)
+            if step >= N - 1:
+                var_segments[step-N+1] = sq_dev_sum / (n_values - ddof)
+                _welford_update(segments[step-N+1], n_values, mean, sq_dev_sum, -1)
+    
+    var_window = _unsegment_windows(var_segments, n_out, cell_shape)
+    n_valid = N if counts is None else counts
+    var_window = np.where((n_valid >= min_periods) & (n_valid > ddof), 
+                          np.maximum(var_window, 0), 
+                          np.nan)
+    var_window = var_window.astype(np.result_type(x.dtype, np.float16), copy=False)
+    return np.moveaxis(var_window, 0, axis % ndim)
+
+
+def moving_std(x: np.ndarray,
+               N: int,
+               axis: int = 0,
+               min_periods: int | None = None,
+               align: str | None = None,
+               ddof: int = 1) -> np.ndarray:
+    """
+    Returns the moving standard deviation of an array, irrespective of dimension,
+    as the square root of `moving_var`.
     
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Input array containing data.
+    N : int
+        Window size.
+    axis : int, optional
+        Axis along which the window slides. Default is 0.
+    min_periods : int | None, optional
+        Minimum number of valid (non-NaN) values in a window, 
+        as in `window_sum`. Defaults to None (N).
+    align : {"trailing", "centered"} | None, optional
+        Alignment of the windows with the output, as in `window_sum`.
+        Defaults to None (complete windows only).
+    ddof : int, default 1
+        Delta degrees of freedom, as in `moving_var`.
+        
     Returns
     -------
     numpy.ndarray
-        The moving average of the array.
+        The moving standard deviation of the array.
+    """
+    return np.sqrt(moving_var(x, N, axis=axis, min_periods=min_periods, 
+                              align=align, ddof=ddof))
+
+
+def moving_quantile(x: np.ndarray,
+                    N: int,
+                    quantile: float | list[float],
+                    axis: int = 0,
+                    min_periods: int | None = None,
+                    align: str | None = None) -> np.ndarray:
+    """
+    Returns the moving quantile(s) of an array, irrespective of dimension.
+    
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Input array containing data.
+    N : int
+        Window size.
+    quantile : float | list[float]
+        Quantile(s) to compute, between 0 and 1.
+    axis : int, optional
+        Axis along which the window slides. Default is 0.
+    min_periods : int | None, optional
+        Minimum number of valid (non-NaN) values in a window for its
+        quantiles to be computed, as in `window_sum`. Defaults to None (N).
+    align : {"trailing", "centered"} | None, optional
+        Alignment of the windows with the output, as in `window_sum`.
+        Defaults to None (complete windows only).
+        
+    Returns
+    -------
+    numpy.ndarray
+        The moving quantile of the array, preceded by a quantile axis 
+        if a list of quantiles is given.
+        
+    Notes
+    -----
+    The windows of batches of consecutive positions are gathered as 
+    contiguous rows and sorted in a single vectorised call, and the 
+    quantiles of all windows are read from the same order statistics,
+    linearly interpolated as in `numpy.quantile`'s default method 
+    (see `statflow.utils.helpers.batched_quantiles`). Each batch holds 
+    about `QUANTILE_BATCH_SIZE` values.
+    """
+    x, counts, min_periods = _window_input(x, N, axis, min_periods, align)
+    if not np.issubdtype(x.dtype, np.floating):
+        x = x.astype(np.float64)
+    quantiles = np.atleast_1d(np.asarray(quantile, dtype=np.float64))
+    n_out = len(x) - N + 1
+    
+    windows = np.lib.stride_tricks.sliding_window_view(x, N, axis=0)
+    batch_size = max(1, QUANTILE_BATCH_SIZE // (N * max(x[0].size, 1)))
+    quantile_window = np.empty((len(quantiles), n_out) + x.shape[1:], dtype=x.dtype)
+    for batch_start in range(0, n_out, batch_size):
+        batch = slice(batch_start, batch_start + batch_size)
+        quantile_window[:, batch] = batched_quantiles(windows[batch], quantiles)
+    
+    if counts is not None:
+        quantile_window[:, counts < min_periods] = np.nan
+    quantile_window = np.moveaxis(quantile_window, 1, axis % x.ndim + 1)
+    return quantile_window if np.ndim(quantile) else quantile_window[0]
+
+
+def moving_median(x: np.ndarray,
+                  N: int,
+                  axis: int = 0,
+                  min_periods: int | None = None,
+                  align: str | None = None) -> np.ndarray:
+    """
+    Returns the moving median of an array, irrespective of dimension,
+    as the 0.5 quantile of `moving_quantile`.
+    
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Input array containing data.
+    N : int
+        Window size.
+    axis : int, optional
+        Axis along which the window slides. Default is 0.
+    min_periods : int | None, optional
+        Minimum number of valid (non-NaN) values in a window, 
+        as in `window_sum`. Defaults to None (N).
+    align : {"trailing", "centered"} | None, optional
+        Alignment of the windows with the output, as in `window_sum`.
+        Defaults to None (complete windows only).
+        
+    Returns
+    -------
+    numpy.ndarray
+        The moving median of the array.
+    """
+    return moving_quantile(x, N, 0.5, axis=axis, min_periods=min_periods, align=align)
+
+
+def ewm_mean(x: np.ndarray,
+             com: float | None = None,
+             span: float | None = None,
+             halflife: float | None = None,
+             alpha: float | None = None,
+             axis: int = 0,
+             adjust: bool = True,
+             ignore_na: bool = False,
+             min_periods: int = 0,
+             state: dict | None = None,
+             return_state: bool = False) -> np.ndarray | tuple[np.ndarray, dict]:
+    """
+    Returns the exponentially weighted moving average of an array, 
+    irrespective of dimension.
+    
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Input array containing data. NaN values are treated as missing.
+    com : float | None, optional
+        Decay in terms of centre of mass, alpha = 1 / (1 + com), com >= 0.
+    span : float | None, optional
+        Decay in terms of span, alpha = 2 / (span + 1), span >= 1.
+    halflife : float | None, optional
+        Decay in terms of half-life, alpha = 1 - exp(-ln(2) / halflife), halflife > 0.
+    alpha : float | None, optional
+        Smoothing factor, 0 < alpha <= 1. Exactly one of `com`, `span`, 
+        `halflife` and `alpha` must be given.
+    axis : int, optional
+        Axis along which the weights decay. Default is 0.
+    adjust : bool, default True
+        Whether to divide by the decaying sum of weights of the values
+        seen so far (True) or to use the recursive form 
+        y_t = (1 - alpha) y_{t-1} + alpha x_t (False), as in `pandas.DataFrame.ewm`.
+    ignore_na : bool, default False
+        Whether to ignore NaN values when computing the weights (True) or to 
+        weight the values by their absolute positions (False), 
+        as in `pandas.DataFrame.ewm`.
+    min_periods : int, default 0
+        Minimum number of valid values seen so far for a value to be computed.
+    state : dict | None, optional
+        State returned by a previous call on the preceding chunk of the 
+        same series (with the same parameters), from which the calculation resumes.
+        Defaults to None, starting afresh.
+    return_state : bool, default False
+        Whether to also return the state at the end of the input, 
+        to be passed on to the call on the next chunk.
+        
+    Returns
+    -------
+    numpy.ndarray | tuple[numpy.ndarray, dict]
+        The exponentially weighted moving average of the array, 
+        and the state at its end if `return_state` is True.
+        
+    Notes
+    -----
+    The results equal those of `pandas.DataFrame.ewm(...).mean()` applied to
+    every series along `axis`. The weights are updated step by step along 
+    that axis, vectorised over all the other dimensions, so a (time, lat, lon)
+    field is smoothed at once in its own layout. Since the state holds
+    everything needed to resume, splitting the input into chunks along 
+    `axis` and carrying the state over gives the same result as a single call.
+    
+    Examples
+    --------
+    >>> smoothed, state = ewm_mean(anom_chunk_1, span=30, return_state=True)
+    >>> smoothed, state = ewm_mean(anom_chunk_2, span=30, state=state, 
+    ...                            return_state=True)
+    """
+    return _ewm_statistic(x, "mean", com, span, halflife, alpha, axis, adjust, 
+                          ignore_na, min_periods, False, state, return_state)
+
+
+def ewm_var(x: np.ndarray,
+            com: float | None = None,
+            span: float | None = None,
+            halflife: float | None = None,
+            alpha: float | None = None,
+            axis: int = 0,
+            adjust: bool = True,
+            ignore_na: bool = False,
+            min_periods: int = 0,
+            bias: bool = False,
+            state: dict | None = None,
+            return_state: bool = False) -> np.ndarray | tuple[np.ndarray, dict]:
     """
-    return window_sum(x, N) / N
\ No newline at end of file
+    Returns the exponentially weighted moving variance of an array, 
+    irrespective of dimension.
+    
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Input array containing data. NaN values are treated as missing.
+    com : float | None, optional
+        Decay in terms of centre of mass, alpha = 1 / (1 + com), com >= 0.
+    span : float | None, optional
+        Decay in terms of span, alpha = 2 / (span + 1), span >= 1.
+    halflife : float | None, optional
+        Decay in terms of half-life, alpha = 1 - exp(-ln(2) / halflife), halflife > 0.
+    alpha : float | None, optional
+        Smoothing factor, 0 < alpha <= 1. Exactly one of `com`, `span`, 
+        `halflife` and `alpha` must be given.
+    axis : int, optional
+        Axis along which the weights decay. Default is 0.
+    adjust : bool, default True
+        Whether to divide by the decaying sum of weights of the values
+        seen so far (True) or to use the recursive form 
+        y_t = (1 - alpha) y_{t-1} + alpha x_t (False), as in `pandas.DataFrame.ewm`.
+    ignore_na : bool, default False
+        Whether to ignore NaN values when computing the weights (True) or to 
+        weight the values by their absolute positions (False), 
+        as in `pandas.DataFrame.ewm`.
+    min_periods : int, default 0
+        Minimum number of valid values seen so far for a value to be computed.
+    state : dict | None, optional
+        State returned by a previous call on the preceding chunk of the 
+        same series (with the same parameters), from which the calculation resumes.
+        Defaults to None, starting afresh.
+    return_state : bool, default False
+        Whether to also return the state at the end of the input, 
+        to be passed on to the call on the next chunk.
+    bias : bool, default False
+        Whether to return the biased (weighted population) variance instead
+        of the one corrected for the effective number of values.
+        
+    Returns
+    -------
+    numpy.ndarray | tuple[numpy.ndarray, dict]
+        The exponentially weighted moving variance of the array, 
+        and the state at its end if `return_state` is True.
+        
+    Notes
+    -----
+    The results equal those of `pandas.DataFrame.ewm(...).var()` applied to
+    every series along `axis`, computed step by step as in `ewm_mean`.
+    The weighted sum of squared deviations is updated together with the 
+    weighted mean (West's algorithm), avoiding the cancellation of the 
+    difference between weighted moments.
+    """
+    return _ewm_statistic(x, "var", com, span, halflife, alpha, axis, adjust, 
+                          ignore_na, min_periods, bias, state, return_state)
+
+
+def ewm_std(x: np.ndarray,
+            com: float | None = None,
+            span: float | None = None,
+            halflife: float | None = None,
+            alpha: float | None = None,
+            axis: int = 0,
+            adjust: bool = True,
+            ignore_na: bool = False,
+            min_periods: int = 0,
+            bias: bool = False,
+            state: dict | None = None,
+            return_state: bool = False) -> np.ndarray | tuple[np.ndarray, dict]:
+    """
+    Returns the exponentially weighted moving standard deviation of an array,
+    irrespective of dimension, as the square root of `ewm_var`.
+    
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Input array containing data. NaN values are treated as missing.
+    com : float | None, optional
+        Decay in terms of centre of mass, alpha = 1 / (1 + com), com >= 0.
+    span : float | None, optional
+        Decay in terms of span, alpha = 2 / (span + 1), span >= 1.
+    halflife : float | None, optional
+        Decay in terms of half-life, alpha = 1 - exp(-ln(2) / halflife), halflife > 0.
+    alpha : float | None, optional
+        Smoothing factor, 0 < alpha <= 1. Exactly one of `com`, `span`, 
+        `halflife` and `alpha` must be given.
+    axis : int, optional
+        Axis along which the weights decay. Default is 0.
+    adjust : bool, default True
+        Whether to divide by the decaying sum of weights of the values
+        seen so far (True) or to use the recursive form 
+        y_t = (1 - alpha) y_{t-1} + alpha x_t (False), as in `pandas.DataFrame.ewm`.
+    ignore_na : bool, default False
+        Whether to ignore NaN values when computing the weights (True) or to 
+        weight the values by their absolute positions (False), 
+        as in `pandas.DataFrame.ewm`.
+    min_periods : int, default 0
+        Minimum number of valid values seen so far for a value to be computed.
+    state : dict | None, optional
+        State returned by a previous call on the preceding chunk of the 
+        same series (with the same parameters), from which the calculation resumes.
+        Defaults to None, starting afresh.
+    return_state : bool, default False
+        Whether to also return the state at the end of the input, 
+        to be passed on to the call on the next chunk.
+    bias : bool, default False
+        Whether to use the biased variance, as in `ewm_var`.
+        
+    Returns
+    -------
+    numpy.ndarray | tuple[numpy.ndarray, dict]
+        The exponentially weighted moving standard deviation of the array, 
+        and the state at its end if `return_state` is True.
+    """
+    return _ewm_statistic(x, "std", com, span, halflife, alpha, axis, adjust, 
+                          ignore_na, min_periods, bias, state, return_state)
+
+
+def _ewm_alpha(com: float | None,
+               span: float | None,
+               halflife: float | None,
+               alpha: float | None) -> float:
+    """Smoothing factor of the exponential weights from any of the decay parameters."""
+    decay_args = dict(com=com, span=span, halflife=halflife, alpha=alpha)
+    given_args = [arg_name for arg_name, arg_value in decay_args.items() 
+                  if arg_value is not None]
+    if len(given_args) != 1:
+        raise ValueError("Exactly one of 'com', 'span', 'halflife' and 'alpha' "
+                         f"must be given, got {given_args or 'none'}.")
+    
+    if com is not None:
+        if com < 0:
+            raise ValueError(f"Parameter 'com' must be >= 0, got {com}.")
+        return 1 / (1 + com)
+    elif span is not None:
+        if span < 1:
+            raise ValueError(f"Parameter 'span' must be >= 1, got {span}.")
+        return 2 / (span + 1)
+    elif halflife is not None:
+        if halflife <= 0:
+            raise ValueError(f"Parameter 'halflife' must be > 0, got {halflife}.")
+        return 1 - np.exp(-np.log(2) / halflife)
+    else:
+        if not 0 < alpha <= 1:
+            raise ValueError(f"Parameter 'alpha' must be in (0, 1], got {alpha}.")
+        return alpha
+
+
+def _ewm_statistic(x: np.ndarray,
+                   statistic: str,
+                   com: float | None,
+                   span: float | None,
+                   halflife: float | None,
+                   alpha: float | None,
+                   axis: int,
+                   adjust: bool,
+                   ignore_na: bool,
+                   min_periods: int,
+                   bias: bool,
+                   state: dict | None,
+                   return_state: bool) -> np.ndarray | tuple[np.ndarray, dict]:
+    """
+    Exponentially weighted moving mean, variance or standard deviation, 
+    following the algorithms of pandas' `ewma` and `ewmcov` stepped along 
+    the window axis and vectorised over the remaining dimensions.
+    """
+    alpha = _ewm_alpha(com, span, halflife, alpha)
+    x = np.asarray(x)
+    if x.ndim == 0:
+        raise ValueError("Scalar given, must be an array of N >= 1")
+    x = np.moveaxis(x, axis, 0)
+    cell_shape = x.shape[1:]
+    
+    decay = 1 - alpha
+    new_weight = 1.0 if adjust else alpha
+    compute_var = statistic != "mean"
+    
+    # Running state per cell: the weighted mean (NaN until the first valid
+    # value), the weighted mean of squared deviations, the sums of weights 
+    # and of squared weights, the weight of the values seen so far
+    # and the number of valid values
+    if state is None:
+        state = dict(mean=np.full(cell_shape, np.nan),
+                     sq_dev_mean=np.zeros(cell_shape),
+                     sum_weights=np.ones(cell_shape),
+                     sum_sq_weights=np.ones(cell_shape),
+                     old_weight=np.ones(cell_shape),
+                     n_obs=np.zeros(cell_shape, dtype=np.int64))
+    else:
+        state = {key: np.array(state[key], copy=True) for key in EWM_STATE_KEYS}
+        if state["mean"].shape != cell_shape:
+            raise ValueError(f"State shape {state['mean'].shape} does not match the "
+                             f"shape of the input cells {cell_shape}.")
+    mean, sq_dev_mean = state["mean"], state["sq_dev_mean"]
+    sum_weights, sum_sq_weights = state["sum_weights"], state["sum_sq_weights"]
+    old_weight, n_obs = state["old_weight"], state["n_obs"]
+    
+    # Steps with a valid value in every cell, once every series has started,
+    # skip the masking of missing values
+    complete_steps = ~np.isnan(x.reshape(len(x), -1)).any(axis=1)
+    all_started = not np.isnan(mean).any()
+    
+    stat_values = np.empty(x.shape, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for step, values in enumerate(x):
+            if all_started and complete_steps[step]:
+                n_obs += 1
+                sum_weights *= decay
+                sum_sq_weights *= decay ** 2
+                old_weight *= decay
+                
+                total_weight = old_weight + new_weight
+                new_mean = (old_weight * mean + new_weight * values) / total_weight
+                if compute_var:
+                    sq_dev_mean[...] = (old_weight * (sq_dev_mean 
+                                                      + (mean - new_mean) ** 2)
+                                        + new_weight * (values - new_mean) ** 2
+                                        ) / total_weight
+                mean[...] = new_mean
+                
+                sum_weights += new_weight
+                sum_sq_weights += new_weight ** 2
+                old_weight += new_weight
+                if not adjust:
+                    sum_weights /= old_weight
+                    sum_sq_weights /= old_weight ** 2
+                    old_weight[...] = 1
+                    
+            else:
+                observed = ~np.isnan(values)
+                n_obs += observed
+                started = ~np.isnan(mean)
+                
+                # Decay of the weights of the values seen so far
+                step_decay = np.where(started & (observed | (not ignore_na)), 
+                                      decay, 
+                                      1.0)
+                sum_weights *= step_decay
+                sum_sq_weights *= step_decay ** 2
+                old_weight *= step_decay
+                
+                # Inclusion of the new value (the first one of each series
+                # just sets the mean, its weight being in the initial state)
+                updated = started & observed
+                total_weight = old_weight + new_weight
+                new_mean = np.where(updated, 
+                                    (old_weight * mean + new_weight * values) 
+                                    / total_weight, 
+                                    mean)
+                if compute_var:
+                    updated_sq_dev_mean = (old_weight * (sq_dev_mean 
+                                                         + (mean - new_mean) ** 2)
+                                           + new_weight * (values - new_mean) ** 2
+                                           ) / total_weight
+                    sq_dev_mean[...] = np.where(updated, 
+                                                updated_sq_dev_mean, 
+                                                sq_dev_mean)
+                mean[...] = np.where(~started & observed, values, new_mean)
+                
+                sum_weights += new_weight * updated
+                sum_sq_weights += new_weight ** 2 * updated
+                old_weight += new_weight * updated
+                if not adjust:
+                    sum_weights[...] = np.where(updated, 
+                                                sum_weights / old_weight, 
+                                                sum_weights)
+                    sum_sq_weights[...] = np.where(updated, 
+                                                   sum_sq_weights / old_weight ** 2, 
+                                                   sum_sq_weights)
+                    old_weight[updated] = 1
+                all_started = all_started or not np.isnan(mean).any()
+            
+            if not compute_var:
+                step_values = mean
+            elif bias:
+                step_values = sq_dev_mean
+            else:
+                sq_sum_weights = sum_weights ** 2
+                correction_denom = sq_sum_weights - sum_sq_weights
+                step_values = np.where(correction_denom > 0, 
+                                       sq_sum_weights / correction_denom * sq_dev_mean, 
+                                       np.nan)
+            stat_values[step] = np.where(n_obs >= max(min_periods, 1), 
+                                         step_values, 
+                                         np.nan)
+    
+    if statistic == "std":
+        stat_values = np.sqrt(stat_values)
+    stat_values = stat_values.astype(np.result_type(x.dtype, np.float16), copy=False)
+    stat_values = np.moveaxis(stat_values, 0, axis % x.ndim)
+    return (stat_values, state) if return_state else stat_values
+
+
+def _check_window_args(x: np.ndarray,
+                       N: int,
+                       axis: int,
+                       min_periods: int | None,
+                       align: str | None) -> tuple[np.ndarray, int, int, int]:
+    """
+    Check the moving window parameters, and return the input with the 
+    window axis first, the minimum number of valid values per window and
+    the number of positions by which windows overhang the start and the end
+    of the input for the given alignment.
+    """
+    x = np.asarray(x)
+    if x.ndim == 0:
+        raise ValueError("Scalar given, must be an array of N >= 1")
+    if align is not None and align not in WINDOW_ALIGNMENTS:
+        raise ValueError(f"Unsupported alignment '{align}'. "
+                         f"Options are {WINDOW_ALIGNMENTS}.")
+
+    x = np.moveaxis(x, axis, 0)
+    n = x.shape[0]
+    if not 1 <= N <= n:
+        raise ValueError("Window size must be between 1 and the length "
+                         f"of the data ({n}), got {N}.")
+    min_periods = N if min_periods is None else min_periods
+    if not 1 <= min_periods <= N:
+        raise ValueError("Parameter 'min_periods' must be between 1 "
+                         f"and the window size ({N}), got {min_periods}.")
+    
+    if align is None:
+        left_pad, right_pad = 0, 0
+    elif align == "trailing":
+        left_pad, right_pad = N - 1, 0
+    else:
+        left_pad, right_pad = N // 2, (N - 1) // 2
+    return x, min_periods, left_pad, right_pad
+
+
+def _window_input(x: np.ndarray,
+                  N: int,
+                  axis: int,
+                  min_periods: int | None,
+                  align: str | None
+                  ) -> tuple[np.ndarray, np.ndarray | None, int]:
+    """
+    Input of the moving window kernels, with the window axis first and padded
+    with NaN by the overhang of the windows, so that every output comes from
+    a complete window, together with the number of valid values of each 
+    window (None if there are no NaN values) and the minimum required.
+    Integer input is kept as such unless padded.
+    """
+    x, min_periods, left_pad, right_pad = _check_window_args(x, N, axis, 
+                                                             min_periods, align)
+    if left_pad or right_pad:
+        x = np.pad(x.astype(np.result_type(x.dtype, np.float16), copy=False), 
+                   [(left_pad, right_pad)] + [(0, 0)] * (x.ndim - 1), 
+                   constant_values=np.nan)
+    
+    counts = None
+    if np.issubdtype(x.dtype, np.inexact):
+        valid = ~np.isnan(x)
+        if not valid.all():
+            counts = _padded_window_difference(_cumsum_from_zero(valid, np.int64), 
+                                               N, len(x) - N + 1, 0, 0)
+    return x, counts, min_periods
+
+
+def _moving_extreme(x: np.ndarray,
+                    N: int,
+                    axis: int,
+                    min_periods: int | None,
+                    align: str | None,
+                    ufunc) -> np.ndarray:
+    """
+    Moving minimum or maximum (`ufunc` being `numpy.minimum` or `numpy.maximum`)
+    with the van Herk/Gil-Werman algorithm.
+    """
+    x, counts, min_periods = _window_input(x, N, axis, min_periods, align)
+    ndim, cell_shape = x.ndim, x.shape[1:]
+    n_out = len(x) - N + 1
+    
+    # Neutral value of the ufunc, which also replaces NaN values
+    if np.issubdtype(x.dtype, np.floating):
+        fill_value = np.inf if ufunc is np.minimum else -np.inf
+    else:
+        dtype_info = np.iinfo(x.dtype)
+        fill_value = dtype_info.max if ufunc is np.minimum else dtype_info.min
+    
+    # Blocks of N values, with running extremes from the start (prefix)
+    # and from the end (suffix) of each block
+    n_blocks = -(-len(x) // N)
+    suffix = np.full((n_blocks * N,) + cell_shape, fill_value, dtype=x.dtype)
+    suffix[:len(x)] = x if counts is None else np.where(np.isnan(x), fill_value, x)
+    suffix = suffix.reshape((n_blocks, N) + cell_shape)
+    prefix = suffix.copy()
+    
+    for k in range(1, N):
+        ufunc(prefix[:, k-1], prefix[:, k], out=prefix[:, k])
+    for k in range(N - 2, -1, -1):
+        ufunc(suffix[:, k+1], suffix[:, k], out=suffix[:, k])
+    
+    # A window starting at position i spans the end of one block 
+    # and the start of the next one (or a whole block)
+    prefix = prefix.reshape((-1,) + cell_shape)
+    suffix = suffix.reshape((-1,) + cell_shape)
+    extreme_window = ufunc(suffix[:n_out], prefix[N-1:N-1+n_out])
+    
+    if counts is not None:
+        extreme_window = np.where(counts >= min_periods, extreme_window, np.nan)
+        extreme_window = extreme_window.astype(x.dtype, copy=False)
+    return np.moveaxis(extreme_window, 0, axis % ndim)
+
+
+def _segment_windows(x_2d: np.ndarray, N: int) -> tuple[np.ndarray, int]:
+    """
+    Split the complete windows of a (step, cell) array into segments of
+    consecutive windows, laid out side by side as further cells, so that
+    algorithms stepping along the windows are vectorised over the segments
+    as well. Returns the (segment_length + N - 1, n_segments * n_cells) 
+    float64 array of the values of each segment, NaN-padded at the end, 
+    and the number of windows per segment.
+    """
+    n_out = len(x_2d) - N + 1
+    segment_length = min(max(MOVING_WINDOW_SEGMENT_LENGTH, N), n_out)
+    n_segments = -(-n_out // segment_length)
+    
+    padded = np.full((n_segments * segment_length + N - 1, x_2d.shape[1]), np.nan)
+    padded[:len(x_2d)] = x_2d
+    segment_values = np.lib.stride_tricks.sliding_window_view(padded, 
+                                                              segment_length + N - 1, 
+                                                              axis=0)[::segment_length]
+    
+    # (segment, cell, step) -> (step, segment * cell)
+    segments = np.ascontiguousarray(np.moveaxis(segment_values, -1, 0))
+    segments = segments.reshape(segment_length + N - 1, -1)
+    return segments, segment_length
+
+
+def _unsegment_windows(segment_results: np.ndarray, 
+                       n_out: int, 
+                       cell_shape: tuple) -> np.ndarray:
+    """
+    Lay the (window, segment * cell) results of `_segment_windows` 
+    back out as (window, *cells), dropping the windows of the padding.
+    """
+    segment_length = len(segment_results)
+    results = segment_results.reshape(segment_length, -1, int(np.prod(cell_shape)))
+    results = np.moveaxis(results, 1, 0).reshape((-1,) + cell_shape)
+    return results[:n_out]
+
+
+def _welford_update(values: np.ndarray, 
+                    n_values: np.ndarray, 
+                    mean: np.ndarray, 
+                    sq_dev_sum: np.ndarray, 
+                    sign: int) -> None:
+    """
+    Add (sign=1) or remove (sign=-1) values to or from running counts, 
+    means and sums of squared deviations in place, skipping NaN values.
+    """
+    valid = ~np.isnan(values)
+    n_values += sign * valid
+    deviation = np.where(valid, values - mean, 0)
+    mean += sign * deviation / np.maximum(n_values, 1)
+    sq_dev_sum += sign * deviation * np.where(valid, values - mean, 0)
+    
+    # Reset emptied windows, so that no rounding error is carried over
+    empty = n_values == 0
+    mean[empty] = 0
+    sq_dev_sum[empty] = 0
+
+
+def _window_sums_and_counts(x: np.ndarray,
+                            N: int,
+                            axis: int,
+                            min_periods: int | None,
+                            align: str | None
+                            ) -> tuple[np.ndarray, np.ndarray | None, int]:
+    """
+    Moving sums of the valid values of an array and number of valid values
+    of each window, both with the window axis first, through cumulative sums.
+
+    The counts are None if every window is complete, i.e. without alignment 
+    nor NaN values; otherwise, the sums are floating point.
+    """
+    x, min_periods, left_pad, right_pad = _check_window_args(x, N, axis, 
+                                                             min_periods, align)
+    n = x.shape[0]
+
+    # Cumulative sums (from zero) of the valid values
+    is_float = np.issubdtype(x.dtype, np.inexact)
+    valid = ~np.isnan(x) if is_float else None
+    has_gaps = valid is not None and not valid.all()
+
+    accum_dtype = np.result_type(x.dtype, np.float64) if is_float else np.int64
+    cumsum = _cumsum_from_zero(np.where(valid, x, 0) if has_gaps else x, accum_dtype)
+
+    # Each window takes the difference of the cumulative sum between its bounds,
+    # which are clamped to the edges for partial windows (edge padding)
+    n_out = n - N + 1 + left_pad + right_pad
+    sum_window = _padded_window_difference(cumsum, N, n_out, left_pad, right_pad)
+
+    if has_gaps:
+        valid_cumsum = _cumsum_from_zero(valid, np.int64)
+        count_window = _padded_window_difference(valid_cumsum, N, n_out, 
+                                                 left_pad, right_pad)
+    elif align is not None:
+        # Window lengths clamped to the edges, the same for every cell
+        positions = np.arange(n_out)
+        count_window = (np.minimum(positions + N - left_pad, n) 
+                        - np.maximum(positions - left_pad, 0))
+        count_window = count_window.reshape((-1,) + (1,) * (x.ndim - 1))
+    else:
+        count_window = None
+
+    if is_float:
+        out_dtype = x.dtype
+    else:
+        out_dtype = np.int64 if count_window is None else np.float64
+    return sum_window.astype(out_dtype, copy=False), count_window, min_periods
+
+
+def _cumsum_from_zero(x: np.ndarray, dtype) -> np.ndarray:
+    """
+    Cumulative sum along the first axis, preceded by zeros.
+    
+    Arrays with many cells per step (e.g. (time, lat, lon) fields) are 
+    accumulated step by step, each step adding a whole contiguous slice, 
+    which is several times faster than `numpy.cumsum` along a 
+    non-contiguous axis.
+    """
+    cumsum = np.empty((len(x) + 1,) + x.shape[1:], dtype=dtype)
+    cumsum[0] = 0
+    if x[0].size >= CUMSUM_STEPPING_MIN_CELLS:
+        for i, x_step in enumerate(x):
+            np.add(cumsum[i], x_step, out=cumsum[i+1])
+    else:
+        np.cumsum(x, axis=0, dtype=dtype, out=cumsum[1:])
+    return cumsum
+
+
+def _padded_window_difference(cumsum: np.ndarray,
+                              N: int,
+                              n_out: int,
+                              left_pad: int,
+                              right_pad: int) -> np.ndarray:
+    """
+    Differences cumsum[i+N] - cumsum[i] of a cumulative sum along its first
+    axis, edge-padded at the start and end so that windows are clamped there.
+    """
+    if left_pad or right_pad:
+        cumsum = np.pad(cumsum, 
+                        [(left_pad, right_pad)] + [(0, 0)] * (cumsum.ndim - 1), 
+                        mode="edge")
+    return cumsum[N:N+n_out] - cumsum[:n_out]
+
+
+# Streaming windows #
+#-------------------#
+
+class StreamingWindow:
+    """
+    Moving window statistics of series fed step by step, as in real-time
+    station feeds.
+    
+    Keeps the last N values of every series in a ring buffer, together with
+    their count, mean and sum of squared deviations, which are updated for 
+    each new step by removing the outgoing value and adding the incoming one
+    (Welford's algorithm), vectorised over all series. Each step thus costs
+    O(1) per series whatever the window size or the length of the history.
+    
+    Parameters
+    ----------
+    N : int
+        Window size.
+    shape : tuple[int, ...], optional
+        Shape of the series at each step, e.g. (n_stations,) or (lat, lon).
+        Default is (), a single series.
+    statistic : {"sum", "mean", "var", "std", "count"} | list, default "mean"
+        Statistic(s) returned by `push` and `result`: a single array for 
+        a statistic given as a string, a list of arrays for any sequence 
+        of statistics.
+    min_periods : int | None, optional
+        Minimum number of valid (non-NaN) values in the window for a 
+        statistic to be computed, otherwise it is NaN. Defaults to None (N).
+    ddof : int, default 1
+        Delta degrees of freedom of the variance and standard deviation.
+        
+    Attributes
+    ----------
+    statistics : list[str]
+        Statistics returned by `push`.
+    buffer : numpy.ndarray
+        (N, *shape) ring buffer with the values of the window, NaN-filled 
+        until N steps have been pushed.
+    position : int
+        Index of the buffer row to be overwritten by the next step.
+    n_steps : int
+        Number of steps pushed so far.
+        
+    Examples
+    --------
+    >>> window = StreamingWindow(144, shape=(n_stations,), statistic=["mean", "std"])
+    >>> mean, std = window.push(latest_obs)  # (n_stations,) or (n_steps, n_stations)
+    >>> window.save("feed_window.npz")
+    >>> window = StreamingWindow.load("feed_window.npz")
+    
+    Notes
+    -----
+    Pushing a whole series step by step gives the same statistics as the 
+    trailing-aligned moving functions, e.g. `moving_average(x, N, 
+    min_periods=min_periods, align="trailing")`. The running aggregates are 
+    recomputed from the buffer every time it wraps around, so that rounding 
+    errors of the updates do not accumulate, at an amortised cost of O(1) 
+    per step.
+    """
+    
+    def __init__(self,
+                 N: int,
+                 shape: tuple[int, ...] = (),
+                 statistic: str | list[str] = "mean",
+                 min_periods: int | None = None,
+                 ddof: int = 1):
+        single_statistic = isinstance(statistic, str)
+        statistics = [statistic] if single_statistic else list(statistic)
+        for stat in statistics:
+            if stat not in STREAMING_WINDOW_STATISTICS:
+                raise ValueError(f"Unsupported statistic '{stat}'. "
+                                 f"Options are {STREAMING_WINDOW_STATISTICS}.")
+        if N < 1:
+            raise ValueError(f"Window size must be at least 1, got {N}.")
+        min_periods = N if min_periods is None else min_periods
+        if not 1 <= min_periods <= N:
+            raise ValueError("Parameter 'min_periods' must be between 1 "
+                             f"and the window size ({N}), got {min_periods}.")
+        
+        self.N = N
+        self.shape = tuple(shape)
+        self.statistics = statistics
+        self._single_statistic = single_statistic
+        self.min_periods = min_periods
+        self.ddof = ddof
+        self.buffer = np.full((N,) + self.shape, np.nan)
+        self.position = 0
+        self.n_steps = 0
+        self._n_values = np.zeros(self.shape)
+        self._mean = np.zeros(self.shape)
+        self._sq_dev_sum = np.zeros(self.shape)
+        
+    def push(self, new_values: np.ndarray) -> np.ndarray | list[np.ndarray]:
+        """
+        Feed new steps into the window.
+        
+        Parameters
+        ----------
+        new_values : numpy.ndarray
+            Values of a single step, with the shape of the series, 
+            or of several steps, stacked along a new first axis.
+            NaN values are treated as missing.
+            
+        Returns
+        -------
+        numpy.ndarray | list[numpy.ndarray]
+            Statistic of the window after each new step, with the shape of 
+            `new_values`; a list of them if several statistics were requested.
+        """
+        new_values = np.asarray(new_values, dtype=np.float64)
+        single_step = new_values.shape == self.shape
+        if not single_step and new_values.shape[1:] != self.shape:
+            raise ValueError("New values must have the shape of the series "
+                             f"{self.shape}, optionally preceded by a step axis, "
+                             f"got {new_values.shape}.")
+        
+        steps = new_values[np.newaxis] if single_step else new_values
+        outputs = [np.empty(steps.shape) for _ in self.statistics]
+        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for step_idx, step_values in enumerate(steps):
+                _welford_update(self.buffer[self.position], 
+                                self._n_values, self._mean, self._sq_dev_sum, -1)
+                _welford_update(step_values, 
+                                self._n_values, self._mean, self._sq_dev_sum, 1)
+                self.buffer[self.position] = step_values
+                self.position = (self.position + 1) % self.N
+                self.n_steps += 1
+                if self.position == 0:
+                    self._refresh()
+                
+                for output, stat in zip(outputs, self.statistics):
+                    output[step_idx] = self._compute(stat)
+        
+        if single_step:
+            outputs = [output[0] for output in outputs]
+        return outputs[0] if self._single_statistic else outputs
+    
+    def result(self, statistic: str | None = None) -> np.ndarray:
+        """
+        Statistic of the current window.
+        
+        Parameters
+        ----------
+        statistic : {"sum", "mean", "var", "std", "count"} | None, optional
+            Statistic to compute. Defaults to None, the (first) 
+            statistic of the window.
+            
+        Returns
+        -------
+        numpy.ndarray
+            Statistic of every series, with the shape of the series.
+        """
+        statistic = self.statistics[0] if statistic is None else statistic
+        if statistic not in STREAMING_WINDOW_STATISTICS:
+            raise ValueError(f"Unsupported statistic '{statistic}'. "
+                             f"Options are {STREAMING_WINDOW_STATISTICS}.")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._compute(statistic)
+    
+    def save(self, path: str) -> None:
+        """
+        Save the window state to disk, as a NumPy .npz archive,
+        so that a restarted process resumes without replaying the history.
+        
+        Parameters
+        ----------
+        path : str
+            Output file path.
+        """
+        statistic = self.statistics[0] if self._single_statistic else self.statistics
+        meta = dict(N=self.N,
+                    shape=self.shape,
+                    statistic=statistic,
+                    min_periods=self.min_periods,
+                    ddof=self.ddof,
+                    position=self.position,
+                    n_steps=self.n_steps)
+        np.savez(path,
+                 buffer=self.buffer,
+                 n_values=self._n_values,
+                 mean=self._mean,
+                 sq_dev_sum=self._sq_dev_sum,
+                 meta=np.array(json.dumps(meta)))
+        
+    @classmethod
+    def load(cls, path: str) -> "StreamingWindow":
+        """
+        Load a window saved with `save`.
+        
+        Parameters
+        ----------
+        path : str
+            Path to the .npz archive.
+            
+        Returns
+        -------
+        StreamingWindow
+            Window with the restored state, ready to be pushed further.
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(archive["meta"].item())
+            window = cls(meta["N"], 
+                         shape=tuple(meta["shape"]), 
+                         statistic=meta["statistic"],
+                         min_periods=meta["min_periods"], 
+                         ddof=meta["ddof"])
+            window.position = meta["position"]
+            window.n_steps = meta["n_steps"]
+            window.buffer = archive["buffer"]
+            window._n_values = archive["n_values"]
+            window._mean = archive["mean"]
+            window._sq_dev_sum = archive["sq_dev_sum"]
+        return window
+    
+    def _compute(self, statistic: str) -> np.ndarray:
+        """Statistic of the current window from the running aggregates."""
+        if statistic == "count":
+            return self._n_values.copy()
+        elif statistic == "sum":
+            stat_values = self._mean * self._n_values
+        elif statistic == "mean":
+            stat_values = self._mean
+        else:
+            stat_values = np.where(self._n_values > self.ddof, 
+                                   np.maximum(self._sq_dev_sum, 0) 
+                                   / (self._n_values - self.ddof),
+                                   np.nan)
+            if statistic == "std":
+                stat_values = np.sqrt(stat_values)
+        return np.where(self._n_values >= self.min_periods, stat_values, np.nan)
+    
+    def _refresh(self) -> None:
+        """Recompute the running aggregates from the values of the buffer."""
+        valid = ~np.isnan(self.buffer)
+        self._n_values = np.asarray(valid.sum(axis=0), dtype=np.float64)
+        valid_sum = np.where(valid, self.buffer, 0).sum(axis=0)
+        self._mean = np.asarray(valid_sum / np.maximum(self._n_values, 1))
+        sq_devs = np.where(valid, self.buffer - self._mean, 0) ** 2
+        self._sq_dev_sum = np.asarray(sq_devs.sum(axis=0))
+
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Alignments of the windows with the output #
+WINDOW_ALIGNMENTS = ["trailing", "centered"]
+
+# Number of cells per step from which cumulative sums are accumulated step by step #
+CUMSUM_STEPPING_MIN_CELLS = 256
+
+# Number of windows per segment of the algorithms stepping along the windows #
+MOVING_WINDOW_SEGMENT_LENGTH = 1024
+
+# Approximate number of values gathered per batch of moving quantile windows #
+QUANTILE_BATCH_SIZE = 2**24
+
+# Statistics of streaming windows #
+STREAMING_WINDOW_STATISTICS = ["sum", "mean", "var", "std", "count"]
+
+# Keys of the state of the exponentially weighted moving statistics #
+EWM_STATE_KEYS = [
+    "mean", "sq_dev_mean", "sum_weights", "sum_sq_weights", "old_weight", "n_obs"
+]
@@ -5,6 +5,8 @@
 # Import modules #
 #----------------#
 
+from functools import lru_cache
+
 import numpy as np
 
 #------------------------#
@@ -26,6 +28,277 @@ from pygenutils.strings.text_formatters import format_string
 # Noise handling #
 #-#-#-#-#-#-#-#-#-
     
+class Whitener:
+    """
+    Signal whitening (decorrelation) transform, fitted once and applied to 
+    any number of new data batches.
+    
+    The mean and the covariance matrix of the data are accumulated (possibly
+    over several chunks, with `partial_fit`), and their eigendecomposition
+    and the resulting whitening matrix are computed once, when first needed,
+    and cached until more data is accumulated.
+    
+    Parameters
+    ----------
+    method : {"classic", "zca", "sklearn"}, default "classic"
+        The whitening method to apply:
+        - "classic": projects the data onto the principal axes of the 
+          covariance matrix, scaled to unit variance (PCA whitening).
+          This used to be the symmetric transform now given by "zca".
+        - "zca": rotates the PCA-whitened data back to the original axes
+          (Zero Component Analysis), which keeps the whitened data 
+          as close as possible to the original one.
+        - "sklearn": uses `sklearn.decomposition.IncrementalPCA` with 
+          `whiten=True` (`fit` being a single exact batch), so that `fit`
+          and `partial_fit` can be combined as for the other methods;
+          sklearn is only imported when this method is used.
+    n_components : int | None, optional
+        Number of principal components kept (those of largest variance).
+        Defaults to None, keeping all of them.
+    solver : {"auto", "full", "randomized"}, default "auto"
+        Eigendecomposition solver: "full" for the exact one, "randomized" 
+        for a randomized range finder of the leading `n_components` 
+        (Halko et al., 2011), and "auto" for the latter only when there are
+        at least `RANDOMIZED_SOLVER_MIN_FEATURES` features and less than 
+        80% of the components are kept, as in sklearn's PCA. Not used by
+        the "sklearn" method.
+    epsilon : float, default 0.0
+        Regularisation added to the eigenvalues before inverting their 
+        square roots, for near-singular covariance matrices.
+    random_state : int | None, optional
+        Seed of the randomized solver.
+        
+    Attributes
+    ----------
+    n_samples : int
+        Number of samples accumulated so far.
+    mean : numpy.ndarray | None
+        Mean of every feature, None until data is accumulated.
+    eigenvalues : numpy.ndarray
+        Eigenvalues of the covariance matrix of the kept components,
+        in decreasing order.
+    eigenvectors : numpy.ndarray
+        (n_features, n_components) eigenvectors of the covariance matrix.
+    whitening_matrix : numpy.ndarray
+        (n_features, n_components) matrix by which centred data is whitened
+        ((n_features, n_features) for ZCA).
+        
+    Examples
+    --------
+    >>> whitener = Whitener("zca").fit(calibration_batch)
+    >>> whitened_batch = whitener.transform(sensor_batch)
+    >>> for chunk in archive_chunks:
+    ...     whitener.partial_fit(chunk)
+    """
+    
+    def __init__(self,
+                 method: str = "classic",
+                 n_components: int | None = None,
+                 solver: str = "auto",
+                 epsilon: float = 0.0,
+                 random_state: int | None = None):
+        if method not in SIGNAL_FORCING_METHODS:
+            format_args_whitening = (f"whitening method '{method}'", 
+                                     SIGNAL_FORCING_METHODS)
+            raise ValueError(format_string(UNSUPPORTED_OPTION_ERROR_TEMPLATE, 
+                                           format_args_whitening))
+        if solver not in WHITENING_SOLVERS:
+            format_args_whitening = (f"eigendecomposition solver '{solver}'", 
+                                     WHITENING_SOLVERS)
+            raise ValueError(format_string(UNSUPPORTED_OPTION_ERROR_TEMPLATE, 
+                                           format_args_whitening))
+            
+        self.method = method
+        self.n_components = n_components
+        self.solver = solver
+        self.epsilon = epsilon
+        self.random_state = random_state
+        
+        self.n_samples = 0
+        self.mean = None
+        self._scatter = None
+        self._pca = None
+        self._eigen_cache = None
+        
+    def fit(self, data: np.ndarray) -> "Whitener":
+        """
+        Fit the transform to the data, discarding any previous fit.
+        
+        Parameters
+        ----------
+        data : numpy.ndarray
+            (n_samples, n_features) data, or 1D for a single feature.
+            
+        Returns
+        -------
+        Whitener
+            The fitted whitener itself.
+        """
+        self.n_samples = 0
+        self.mean = None
+        self._scatter = None
+        self._pca = None
+        self._eigen_cache = None
+        
+        return self.partial_fit(data)
+    
+    def partial_fit(self, data: np.ndarray) -> "Whitener":
+        """
+        Accumulate a chunk of data into the mean and covariance matrix
+        (Chan et al. pairwise update), invalidating the cached transform.
+        
+        Parameters
+        ----------
+        data : numpy.ndarray
+            (n_samples, n_features) data chunk, or 1D for a single feature.
+            
+        Returns
+        -------
+        Whitener
+            The updated whitener itself.
+        """
+        data_2d = _as_feature_columns(data)
+        
+        if self.method == "sklearn":
+            from sklearn.decomposition import IncrementalPCA
+            
+            if self._pca is None:
+                self._pca = IncrementalPCA(n_components=self.n_components, whiten=True)
+            self._pca.partial_fit(data_2d)
+            self.n_samples = int(self._pca.n_samples_seen_)
+            self.mean = self._pca.mean_
+            return self
+        
+        n_new = len(data_2d)
+        if n_new == 0:
+            return self
+        new_mean = data_2d.mean(axis=0)
+        centred = data_2d - new_mean
+        new_scatter = centred.T @ centred
+        
+        if self.mean is None:
+            self.mean, self._scatter = new_mean, new_scatter
+        else:
+            n_total = self.n_samples + n_new
+            delta = new_mean - self.mean
+            self._scatter = (self._scatter + new_scatter 
+                             + np.outer(delta, delta) 
+                             * (self.n_samples * n_new / n_total))
+            self.mean = self.mean + delta * (n_new / n_total)
+        self.n_samples += n_new
+        self._eigen_cache = None
+        return self
+    
+    def transform(self, data: np.ndarray) -> np.ndarray:
+        """
+        Whiten data with the fitted transform.
+        
+        Parameters
+        ----------
+        data : numpy.ndarray
+            (n_samples, n_features) data, or 1D for a single feature.
+            
+        Returns
+        -------
+        numpy.ndarray
+            The whitened data, (n_samples, n_components) for the 
+            "classic" and "sklearn" methods, (n_samples, n_features) for ZCA
+            (1D for 1D input with a single output column).
+        """
+        if self.mean is None:
+            raise ValueError("The whitener has not been fitted yet.")
+        data_2d = _as_feature_columns(data)
+        
+        if self.method == "sklearn":
+            whitened_data = self._pca.transform(data_2d)
+        else:
+            whitened_data = (data_2d - self.mean) @ self.whitening_matrix
+        if np.ndim(data) == 1 and whitened_data.shape[1] == 1:
+            return whitened_data[:, 0]
+        return whitened_data
+    
+    def fit_transform(self, data: np.ndarray) -> np.ndarray:
+        """
+        Fit the transform to the data and whiten it.
+        
+        Parameters
+        ----------
+        data : numpy.ndarray
+            (n_samples, n_features) data, or 1D for a single feature.
+            
+        Returns
+        -------
+        numpy.ndarray
+            The whitened data, as in `transform`.
+        """
+        return self.fit(data).transform(data)
+    
+    @property
+    def eigenvalues(self) -> np.ndarray:
+        """
+        Eigenvalues of the covariance matrix of the kept components, 
+        in decreasing order.
+        """
+        if self.method == "sklearn":
+            return self._pca.explained_variance_
+        return self._eigendecomposition()[0]
+    
+    @property
+    def eigenvectors(self) -> np.ndarray:
+        """Eigenvectors of the covariance matrix of the kept components, as columns."""
+        if self.method == "sklearn":
+            return self._pca.components_.T
+        return self._eigendecomposition()[1]
+    
+    @property
+    def whitening_matrix(self) -> np.ndarray:
+        """Matrix by which the centred data is whitened."""
+        if self.method == "sklearn":
+            return self._pca.components_.T / np.sqrt(self._pca.explained_variance_)
+        return self._eigendecomposition()[2]
+    
+    def _eigendecomposition(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Eigenvalues and eigenvectors of the covariance matrix, and the 
+        whitening matrix, computed once per accumulated data.
+        """
+        if self.mean is None:
+            raise ValueError("The whitener has not been fitted yet.")
+        if self.n_samples < 2:
+            raise ValueError("At least 2 samples are needed to estimate "
+                             "the covariance matrix.")
+        
+        if self._eigen_cache is None:
+            cov_matrix = self._scatter / (self.n_samples - 1)
+            n_features = len(cov_matrix)
+            if self.n_components is None:
+                n_components = n_features
+            else:
+                n_components = self.n_components
+            
+            if self._use_randomized_solver(n_features):
+                eigvals, eigvecs = _randomized_eigh(cov_matrix, n_components, 
+                                                    self.random_state)
+            else:
+                eigvals, eigvecs = np.linalg.eigh(cov_matrix)
+                eigvals = eigvals[::-1][:n_components]
+                eigvecs = eigvecs[:, ::-1][:, :n_components]
+                
+            whitening_matrix = eigvecs / np.sqrt(eigvals + self.epsilon)
+            if self.method == "zca":
+                whitening_matrix = whitening_matrix @ eigvecs.T
+            self._eigen_cache = (eigvals, eigvecs, whitening_matrix)
+        return self._eigen_cache
+    
+    def _use_randomized_solver(self, n_features: int) -> bool:
+        """Whether the leading components are found with the randomized solver."""
+        if self.solver == "auto":
+            return (self.n_components is not None 
+                    and n_features >= RANDOMIZED_SOLVER_MIN_FEATURES
+                    and self.n_components < 0.8 * n_features)
+        return self.solver == "randomized" and self.n_components is not None
+        
+        
 def signal_whitening(data: np.ndarray, method: str = "classic") -> np.ndarray:
     """
     Function to perform signal whitening (decorrelation) on the input data.
@@ -48,45 +321,350 @@ def signal_whitening(data: np.ndarray, method: str = "classic") -> np.ndarray:
     
     Notes
     -----
-    - Classic whitening: It ensures that the data has unit variance, and no correlations between dimensions.
+    - Classic whitening: It ensures that the data has unit variance, 
+      and no correlations between dimensions, on the principal axes 
+      of the covariance matrix (PCA whitening).
     - sklearn whitening: This uses PCA from the sklearn library to perform decorrelation.
     - ZCA whitening: Zero Component Analysis whitening retains data structure while decorrelating.
+    
+    The "classic" method used to return the symmetric (ZCA) transform, with
+    the columns on the original axes; that output is now given by "zca", 
+    whereas "classic" returns the data on the principal axes.
+    
+    This is a one-off shortcut for `Whitener(method).fit_transform(data)`;
+    use a `Whitener` directly to apply a fitted transform to new data.
+    """
+    return Whitener(method).fit_transform(data)
+
+
+def _as_feature_columns(data: np.ndarray) -> np.ndarray:
+    """
+    Data as an (n_samples, n_features) float array, 
+    1D data being a single feature.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    if data.ndim == 1:
+        return data[:, np.newaxis]
+    elif data.ndim != 2:
+        raise ValueError(f"Data must be a 1D or 2D array, got {data.ndim} dimensions.")
+    return data
+
+
+def _randomized_eigh(matrix: np.ndarray, 
+                     n_components: int, 
+                     random_state: int | None) -> tuple[np.ndarray, np.ndarray]:
     """
+    Leading eigenpairs of a symmetric positive semi-definite matrix, in 
+    decreasing order, from a randomized range finder with power iterations.
+    """
+    rng = np.random.default_rng(random_state)
+    n_features = len(matrix)
+    n_probes = min(n_components + RANDOMIZED_SOLVER_OVERSAMPLES, n_features)
     
-    from scipy import linalg
-    from sklearn.decomposition import PCA
+    basis, _ = np.linalg.qr(matrix @ rng.standard_normal((n_features, n_probes)))
+    for _ in range(RANDOMIZED_SOLVER_POWER_ITERATIONS):
+        basis, _ = np.linalg.qr(matrix @ basis)
     
-    # Classic whitening method using covariance matrix
-    if method == "classic":
-        data_mean = data - np.mean(data, axis=0)
-        cov_matrix = np.cov(data_mean, rowvar=False)
-        eigvals, eigvecs = linalg.eigh(cov_matrix)
-        whitening_matrix = eigvecs @ np.diag(1.0 / np.sqrt(eigvals)) @ eigvecs.T
-        whitened_data = data_mean @ whitening_matrix
-        return whitened_data
+    eigvals, small_eigvecs = np.linalg.eigh(basis.T @ matrix @ basis)
+    order = np.argsort(eigvals)[::-1][:n_components]
+    return eigvals[order], basis @ small_eigvecs[:, order]
     
-    # Whitening using PCA from sklearn
-    elif method == "sklearn":
-        pca = PCA(whiten=True)
-        whitened_data = pca.fit_transform(data)
-        return whitened_data
     
-    # ZCA whitening
-    elif method == "zca":
-        data_mean = data - np.mean(data, axis=0)
-        cov_matrix = np.cov(data_mean, rowvar=False)
-        eigvals, eigvecs = linalg.eigh(cov_matrix)
-        whitening_matrix = eigvecs @ np.diag(1.0 / np.sqrt(eigvals)) @ eigvecs.T
-        zca_whitening_matrix = eigvecs @ np.diag(np.sqrt(eigvals)) @ eigvecs.T
-        whitened_data = data_mean @ zca_whitening_matrix
-        return whitened_data
+# Filtering #
+#~~~~~~~~~~~#
+
+# Filter design and application #
+#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-
+
+def design_filter(cutoff: float | list[float],
+                  fs: float = 1.0,
+                  btype: str = "lowpass",
+                  method: str = "butterworth",
+                  order: int = 4,
+                  ripple: float = 1.0,
+                  attenuation: float = 40.0) -> np.ndarray:
+    """
+    Designs a digital filter, cached by its parameters, so that filtering
+    many fields with the same filter designs it only once.
+    
+    Parameters
+    ----------
+    cutoff : float | list[float]
+        Cutoff frequency, or [low, high] frequencies for band filters, 
+        in the units of `fs` (both below the Nyquist frequency fs/2).
+    fs : float, default 1.0
+        Sampling frequency, e.g. 1 for daily data and frequencies in 
+        cycles per day.
+    btype : {"lowpass", "highpass", "bandpass", "bandstop"}, default "lowpass"
+        Band type of the filter.
+    method : {"butterworth", "chebyshev1", "chebyshev2", "lanczos"}
+        Filter design: Butterworth or Chebyshev type I/II IIR filters, 
+        or a Lanczos-windowed FIR filter (Duchon, 1979). 
+        Default is "butterworth".
+    order : int, default 4
+        Order of IIR filters; half-width of the Lanczos window, i.e. the 
+        number of weights on each side of the central one.
+    ripple : float, default 1.0
+        Maximum passband ripple of Chebyshev type I filters, in dB.
+    attenuation : float, default 40.0
+        Minimum stopband attenuation of Chebyshev type II filters, in dB.
+        
+    Returns
+    -------
+    numpy.ndarray
+        Read-only second-order sections ((n_sections, 6) array, 
+        as in `scipy.signal.sosfilt`) of IIR filters, 
+        or the (2 * order + 1) symmetric weights of Lanczos filters.
+        
+    Notes
+    -----
+    IIR filters are designed as second-order sections, which are 
+    numerically stable at orders and cutoffs where the transfer function
+    coefficients of `scipy.signal.butter(..., output="ba")` are not.
+    """
+    cutoff = tuple(float(freq) for freq in np.atleast_1d(cutoff))
+    return _design_filter_cached(cutoff, float(fs), btype, method, int(order), 
+                                 float(ripple), float(attenuation))
+
+
+def zero_phase_filter(data: np.ndarray,
+                      cutoff: float | list[float],
+                      fs: float = 1.0,
+                      btype: str = "lowpass",
+                      method: str = "butterworth",
+                      order: int = 4,
+                      axis: int = 0,
+                      ripple: float = 1.0,
+                      attenuation: float = 40.0) -> np.ndarray:
+    """
+    Filters an array along an axis without phase shift, irrespective of 
+    dimension, e.g. band-passing every grid cell of a (time, lat, lon) 
+    field in a single call.
     
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Input array containing data.
+    cutoff : float | list[float]
+        Cutoff frequency, or [low, high] frequencies for band filters, 
+        in the units of `fs`.
+    fs : float, default 1.0
+        Sampling frequency.
+    btype : {"lowpass", "highpass", "bandpass", "bandstop"}, default "lowpass"
+        Band type of the filter.
+    method : {"butterworth", "chebyshev1", "chebyshev2", "lanczos"}
+        Filter design, as in `design_filter`. Default is "butterworth".
+    order : int, default 4
+        Order of IIR filters; half-width of the Lanczos window.
+    axis : int, optional
+        Axis along which to filter. Default is 0.
+    ripple : float, default 1.0
+        Maximum passband ripple of Chebyshev type I filters, in dB.
+    attenuation : float, default 40.0
+        Minimum stopband attenuation of Chebyshev type II filters, in dB.
+        
+    Returns
+    -------
+    numpy.ndarray
+        The filtered array, with the shape of the input. For Lanczos 
+        filters, the `order` values at each end, whose windows are 
+        incomplete, are NaN.
+        
+    Notes
+    -----
+    IIR filters are applied forwards and backwards (`scipy.signal.sosfiltfilt`),
+    which cancels their phase shift and squares their magnitude response; 
+    the symmetric Lanczos weights are applied once, as a centred convolution 
+    computed with FFTs. NaN values propagate through the filters, so gaps
+    should be filled beforehand.
+    """
+    from scipy import signal
+    
+    data = np.asarray(data)
+    if data.ndim == 0:
+        raise ValueError("Scalar given, must be an array of N >= 1")
+    coefs = design_filter(cutoff, fs=fs, btype=btype, method=method, order=order, 
+                          ripple=ripple, attenuation=attenuation)
+    
+    if method != "lanczos":
+        # scipy's sosfilt only takes writable sections
+        return signal.sosfiltfilt(coefs.copy(), data, axis=axis)
+    
+    n = data.shape[axis]
+    if n < len(coefs):
+        raise ValueError(f"Data length along the axis ({n}) must be at least "
+                         f"the number of filter weights ({len(coefs)}).")
+    weights_shape = [1] * data.ndim
+    weights_shape[axis] = len(coefs)
+    valid_part = signal.fftconvolve(data, coefs.reshape(weights_shape), 
+                                    mode="valid", axes=axis)
+    
+    pad_width = [(0, 0)] * data.ndim
+    pad_width[axis] = (order, order)
+    return np.pad(valid_part, pad_width, constant_values=np.nan)
+
+
+@lru_cache(maxsize=128)
+def _design_filter_cached(cutoff: tuple[float, ...],
+                          fs: float,
+                          btype: str,
+                          method: str,
+                          order: int,
+                          ripple: float,
+                          attenuation: float) -> np.ndarray:
+    """Filter design of `design_filter`, cached by its hashable parameters."""
+    from scipy import signal
+    
+    if method not in FILTER_DESIGN_METHODS:
+        format_args_filter = (f"filter design method '{method}'", FILTER_DESIGN_METHODS)
+        raise ValueError(format_string(UNSUPPORTED_OPTION_ERROR_TEMPLATE, 
+                                       format_args_filter))
+    if btype not in FILTER_BAND_TYPES:
+        format_args_filter = (f"filter band type '{btype}'", FILTER_BAND_TYPES)
+        raise ValueError(format_string(UNSUPPORTED_OPTION_ERROR_TEMPLATE, 
+                                       format_args_filter))
+    
+    n_cutoffs = 2 if btype in ["bandpass", "bandstop"] else 1
+    if len(cutoff) != n_cutoffs:
+        raise ValueError(f"A '{btype}' filter needs {n_cutoffs} cutoff frequencies, "
+                         f"got {len(cutoff)}.")
+    if not all(0 < freq < fs / 2 for freq in cutoff) or sorted(cutoff) != list(cutoff):
+        raise ValueError(f"Cutoff frequencies must be increasing and between 0 and "
+                         f"the Nyquist frequency ({fs / 2}), got {list(cutoff)}.")
+    if order < 1:
+        raise ValueError(f"Filter order must be a positive integer, got {order}.")
+    
+    Wn = cutoff[0] if n_cutoffs == 1 else list(cutoff)
+    if method == "butterworth":
+        coefs = signal.butter(order, Wn, btype=btype, output="sos", fs=fs)
+    elif method == "chebyshev1":
+        coefs = signal.cheby1(order, ripple, Wn, btype=btype, output="sos", fs=fs)
+    elif method == "chebyshev2":
+        coefs = signal.cheby2(order, attenuation, Wn, btype=btype, output="sos", fs=fs)
+    else:
+        coefs = _lanczos_weights(cutoff, fs, btype, order)
+    
+    coefs.flags.writeable = False
+    return coefs
+
+
+def _lanczos_weights(cutoff: tuple[float, ...], 
+                     fs: float, 
+                     btype: str, 
+                     half_width: int) -> np.ndarray:
+    """
+    Weights of a Lanczos-windowed FIR filter (Duchon, 1979): sinc weights of 
+    the ideal low-pass filter tapered by the Lanczos sigma factors, 
+    combined with a unit impulse for the other band types.
+    """
+    k = np.arange(-half_width, half_width + 1)
+    sigma = np.sinc(k / half_width)
+    
+    def lowpass_weights(freq):
+        norm_freq = freq / fs
+        return 2 * norm_freq * np.sinc(2 * norm_freq * k) * sigma
+    
+    impulse = (k == 0).astype(np.float64)
+    if btype == "lowpass":
+        return lowpass_weights(cutoff[0])
+    elif btype == "highpass":
+        return impulse - lowpass_weights(cutoff[0])
+    elif btype == "bandpass":
+        return lowpass_weights(cutoff[1]) - lowpass_weights(cutoff[0])
     else:
-        format_args_whitening = ("whitening method", method, SIGNAL_FORCING_METHODS)
-        raise ValueError(format_string(UNSUPPORTED_OPTION_ERROR_TEMPLATE, format_args_whitening))
+        return impulse - lowpass_weights(cutoff[1]) + lowpass_weights(cutoff[0])
+
+
+# Spectral filters #
+#-#-#-#-#-#-#-#-#-#-
+
+def spectral_filter(data: np.ndarray,
+                    timestep: float,
+                    low_freq: float,
+                    high_freq: float,
+                    axis: int = 0,
+                    fast_length: bool = True,
+                    workers: int | None = None) -> np.ndarray:
+    """
+    Band-pass filter in the frequency domain along an axis, irrespective 
+    of dimension, keeping the Fourier coefficients between two frequencies.
+    
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Input array containing real data.
+    timestep : float
+        Time step between successive data points along the axis.
+    low_freq : float
+        The lower frequency bound of the band (0 or lower keeps the mean).
+    high_freq : float
+        The upper frequency bound of the band.
+    axis : int, optional
+        Axis along which to filter. Default is 0.
+    fast_length : bool, default True
+        Whether to zero-pad the data to the next length that factorises
+        into small primes, for which FFTs are fastest, instead of 
+        transforming the exact length.
+    workers : int | None, optional
+        Number of workers of `scipy.fft` over the other dimensions.
+        Defaults to None (one).
         
-# Filtering #
-#~~~~~~~~~~~#
+    Returns
+    -------
+    numpy.ndarray
+        The band-pass filtered array, with the shape of the input.
+        
+    Notes
+    -----
+    Real input is transformed with real FFTs (`scipy.fft.rfft`/`irfft`), 
+    which compute only the non-negative frequencies, about half the work 
+    of complex FFTs, for every series along the axis in a single call. 
+    The frequency mask of each (transform length, time step, band) is 
+    cached, so repeatedly filtering series of the same length (one per 
+    grid cell, ensemble member or file) reuses it. 
+    Zero-padding (`fast_length`) only lengthens the series by a few 
+    percent, but slightly changes the frequency grid and the periodic 
+    extension of the data; set it to False to reproduce the exact 
+    N-point transform.
+    """
+    from scipy import fft as sp_fft
+    
+    data = np.asarray(data)
+    if data.ndim == 0:
+        raise ValueError("Scalar given, must be an array of N >= 1")
+    
+    n = data.shape[axis]
+    n_fft = sp_fft.next_fast_len(n, real=True) if fast_length else n
+    mask = _spectral_mask(n_fft, float(timestep), float(low_freq), float(high_freq))
+    
+    mask_shape = [1] * data.ndim
+    mask_shape[axis] = len(mask)
+    spectrum = sp_fft.rfft(data, n=n_fft, axis=axis, workers=workers)
+    spectrum *= mask.reshape(mask_shape)
+    band_filtered = sp_fft.irfft(spectrum, n=n_fft, axis=axis, workers=workers)
+    
+    if n_fft != n:
+        band_filtered = np.take(band_filtered, np.arange(n), axis=axis)
+    return band_filtered
+
+
+@lru_cache(maxsize=128)
+def _spectral_mask(n_fft: int, 
+                   timestep: float, 
+                   low_freq: float, 
+                   high_freq: float) -> np.ndarray:
+    """
+    Read-only mask of the non-negative FFT frequencies of an `n_fft`-point
+    real transform within [low_freq, high_freq], cached by its parameters.
+    """
+    freqs = np.fft.rfftfreq(n_fft, timestep)
+    mask = (freqs >= low_freq) & (freqs <= high_freq)
+    mask.flags.writeable = False
+    return mask
+
+
+# Simple filters #
+#-#-#-#-#-#-#-#-#-
 
 def low_pass_filter(data: np.ndarray, window_size: int = 3) -> np.ndarray:
     """
@@ -178,25 +756,12 @@ def band_pass1(original: np.ndarray, timestep: float, low_freq: float, high_freq
     -----
     This function processes the data entirely in the frequency domain. 
     Do not work directly with the time-domain signal.
+    
+    It is `spectral_filter` on the exact length of the series, which 
+    also filters N-dimensional arrays along an axis.
     """
 
-    # Convert original time series to frequency domain
-    fourier_orig = np.fft.fft(original)
-    n = len(fourier_orig)
-
-    # Get the corresponding frequency values
-    freqs_orig = np.fft.fftfreq(n, timestep)
-
-    # Create a mask for the desired frequency range
-    freq_mask = (freqs_orig >= low_freq) & (freqs_orig <= high_freq)
-
-    # Zero out Fourier coefficients outside the desired frequency range
-    new_fourier = np.zeros_like(fourier_orig)
-    new_fourier[freq_mask] = fourier_orig[freq_mask]
-
-    # Convert the filtered signal back to the time domain
-    band_filtered = np.real(np.fft.ifft(new_fourier))
-    return band_filtered
+    return spectral_filter(original, timestep, low_freq, high_freq, fast_length=False)
 
 
 def band_pass2(original: np.ndarray, low_filtered_all_highfreq: np.ndarray, low_filtered_all_lowfreq: np.ndarray) -> np.ndarray:
@@ -288,5 +853,18 @@ def band_pass3(original: np.ndarray, low_filtered_all: np.ndarray, high_filtered
 # Parameters and constants #
 #--------------------------#
 
+# Signal whitening #
 SIGNAL_FORCING_METHODS = ["classic", "sklearn", "zca"]
-UNSUPPORTED_OPTION_ERROR_TEMPLATE = "Unsupported {}. Choose one from {}."
\ No newline at end of file
+WHITENING_SOLVERS = ["auto", "full", "randomized"]
+
+# Randomized eigendecomposition of high-dimensional covariance matrices #
+RANDOMIZED_SOLVER_MIN_FEATURES = 500
+RANDOMIZED_SOLVER_OVERSAMPLES = 10
+RANDOMIZED_SOLVER_POWER_ITERATIONS = 4
+
+# Filter design #
+FILTER_DESIGN_METHODS = ["butterworth", "chebyshev1", "chebyshev2", "lanczos"]
+FILTER_BAND_TYPES = ["lowpass", "highpass", "bandpass", "bandstop"]
+
+# Error template strings #
+UNSUPPORTED_OPTION_ERROR_TEMPLATE = "Unsupported {}. Choose one from {}."
@@ -6,13 +6,23 @@
 #----------------#
 
 import numpy as np
+import pandas as pd
+import xarray as xr
 
 #------------------------#
 # Import project modules #
 #------------------------#
 
-from pygenutils.arrays_and_lists.patterns import count_consecutive
 from statflow.core.time_series import consec_occurrences_maxdata, consec_occurrences_mindata
+from statflow.utils.helpers import (
+    YEAR_CODE_FACTOR,
+    batched_quantiles,
+    get_calendar_index,
+    normalise_season_set,
+    run_length_encode,
+    run_length_statistics,
+    season_end_dates
+)
 
 #------------------#
 # Define functions #
@@ -23,7 +33,7 @@ from statflow.core.time_series import consec_occurrences_maxdata, consec_occurre
 
 def calculate_WSDI(season_daily_tmax: np.ndarray | list, 
                    tmax_threshold: float, 
-                   min_consec_days: int) -> int:
+                   min_consec_days: int) -> int | np.ndarray:
     """
     Function that calculates the WSDI (Warm Spell Duration Index).
     
@@ -31,6 +41,7 @@ def calculate_WSDI(season_daily_tmax: np.ndarray | list,
     ----------
     season_daily_tmax : numpy.ndarray | list
         Daily maximum temperature data of the corresponding season in units ºC.
+        Time comes first; gridded (time, lat, lon) data yields one value per grid cell.
     tmax_threshold : float
         Upper limit of the maximum temperature in units ºC.
     min_consec_days : int
@@ -38,7 +49,7 @@ def calculate_WSDI(season_daily_tmax: np.ndarray | list,
     
     Returns
     -------
-    int
+    int | numpy.ndarray
         Number of days forming warm spells.
     """
     return consec_occurrences_maxdata(season_daily_tmax, 
@@ -47,7 +58,7 @@ def calculate_WSDI(season_daily_tmax: np.ndarray | list,
 
 
 def calculate_SU(season_daily_tmax: np.ndarray | list, 
-                 tmax_threshold: float = 25) -> int:
+                 tmax_threshold: float = 25) -> int | np.ndarray:
     """
     Function that calculates the SU (Summer Days).
     
@@ -55,13 +66,14 @@ def calculate_SU(season_daily_tmax: np.ndarray | list,
     ----------
     season_daily_tmax : numpy.ndarray | list
         Daily maximum temperature data of the corresponding season in units ºC.
+        Time comes first; gridded (time, lat, lon) data yields one value per grid cell.
     
     tmax_threshold : float, default 25
         Upper limit of the maximum temperature in units ºC. Default is 25ºC.
     
     Returns
     -------
-    int
+    int | numpy.ndarray
         Number of days in which the
         maximum temperature has risen above the threshold.
     """
@@ -69,7 +81,7 @@ def calculate_SU(season_daily_tmax: np.ndarray | list,
 
 
 def calculate_CSU(season_daily_tmax: np.ndarray | list, 
-                  tmax_threshold: float = 25) -> int:
+                  tmax_threshold: float = 25) -> int | np.ndarray:
     """
     Function that calculates the CSU (Consecutive Summer Days).
     
@@ -77,13 +89,14 @@ def calculate_CSU(season_daily_tmax: np.ndarray | list,
     ----------
     season_daily_tmax : numpy.ndarray | list
         Daily maximum temperature data of the season in units ºC.
+        Time comes first; gridded (time, lat, lon) data yields one value per grid cell.
     
     tmax_threshold : float, default 25
         Upper limit of the maximum temperature in units ºC. Default is 25ºC.
     
     Returns
     -------
-    int
+    int | numpy.ndarray
         Number of maximum consecutive days in which
         the temperature has risen above the threshold.
     """
@@ -94,7 +107,7 @@ def calculate_CSU(season_daily_tmax: np.ndarray | list,
 
 
 def calculate_FD(season_daily_tmin: np.ndarray | list, 
-                 tmin_threshold: float = 0) -> int:
+                 tmin_threshold: float = 0) -> int | np.ndarray:
     """
     Function that calculates the FD (Frost Days).
     
@@ -102,13 +115,14 @@ def calculate_FD(season_daily_tmin: np.ndarray | list,
     ----------
     season_daily_tmin : numpy.ndarray | list
         Daily minimum temperature data of the corresponding season in units ºC.
+        Time comes first; gridded (time, lat, lon) data yields one value per grid cell.
     
     tmin_threshold : float, default 0
         Upper limit of the minimum temperature in units ºC. Defaults to 0ºC.
     
     Returns
     -------
-    int
+    int | numpy.ndarray
         Number of days in which the
         minimum temperature has fallen below the threshold.
     """
@@ -116,7 +130,7 @@ def calculate_FD(season_daily_tmin: np.ndarray | list,
 
 
 def calculate_TN(season_daily_tmin: np.ndarray | list, 
-                 tmin_threshold: float = 20) -> int:
+                 tmin_threshold: float = 20) -> int | np.ndarray:
     """
     Function that calculates the TN (Tropical Night Days).
     
@@ -124,13 +138,14 @@ def calculate_TN(season_daily_tmin: np.ndarray | list,
     ----------
     season_daily_tmin : numpy.ndarray | list
         Daily minimum temperature data of the corresponding season in units ºC.
+        Time comes first; gridded (time, lat, lon) data yields one value per grid cell.
     
     tmin_threshold : float, default 20
         Lower limit of the minimum temperature in units ºC. Default is 20ºC.
     
     Returns
     -------
-    int
+    int | numpy.ndarray
         Number of nights in which the
         minimum temperature has risen above the threshold.
     """
@@ -140,7 +155,7 @@ def calculate_TN(season_daily_tmin: np.ndarray | list,
 
 
 def calculate_RR(season_daily_precip: np.ndarray | list, 
-                 precip_threshold: float) -> int:
+                 precip_threshold: float) -> int | np.ndarray:
     """
     Function that calculates the RR parameter (Wet Days).
     It is defined as the number of days in which the precipitation
@@ -150,13 +165,14 @@ def calculate_RR(season_daily_precip: np.ndarray | list,
     ----------
     season_daily_precip : numpy.ndarray | list
         Daily precipitation data of the corresponding season in units mm.
+        Time comes first; gridded (time, lat, lon) data yields one value per grid cell.
     
     precip_threshold : float
         Upper limit of the daily precipitation, 1 mm in this case.
     
     Returns
     -------
-    int
+    int | numpy.ndarray
         Number of days in which the
         precipitation has risen above the threshold.   
     """
@@ -164,7 +180,7 @@ def calculate_RR(season_daily_precip: np.ndarray | list,
 
 
 def calculate_CWD(season_daily_precip: np.ndarray | list, 
-                  precip_threshold: float) -> int:
+                  precip_threshold: float) -> int | np.ndarray:
     """
     Function that calculates the CWD (Consecutive Wet Days),
     i.e. the number of maximum consecutive days in which
@@ -174,13 +190,14 @@ def calculate_CWD(season_daily_precip: np.ndarray | list,
     ----------
     season_daily_precip : numpy.ndarray | list
         Daily precipitation data of the season in units mm.
+        Time comes first; gridded (time, lat, lon) data yields one value per grid cell.
     
     precip_threshold : float
         Upper limit of the daily precipitation, 1 mm in this case.
     
     Returns
     -------
-    int
+    int | numpy.ndarray
         Number of maximum consecutive days in which
         the precipitation has risen above the threshold.
     """
@@ -195,7 +212,7 @@ def calculate_hwd(tmax: np.ndarray | list,
                   max_thresh: float, 
                   min_thresh: float, 
                   dates: np.ndarray | list, 
-                  min_days: int) -> tuple[list[tuple], int]:
+                  min_days: int) -> tuple[pd.DataFrame, int | np.ndarray]:
     """
     Calculate the total heat wave days (HWD) based on daily data.
     
@@ -206,13 +223,18 @@ def calculate_hwd(tmax: np.ndarray | list,
     Parameters
     ----------
     tmax : numpy.ndarray | list
-        Array of daily maximum temperatures.
+        Array of daily maximum temperatures. Time comes first; gridded 
+        (time, lat, lon) data yields the events of every grid cell.
     tmin : numpy.ndarray | list
-        Array of daily minimum temperatures.
-    max_thresh : float
+        Array of daily minimum temperatures, with the same shape as `tmax`.
+    max_thresh : float | numpy.ndarray
         Threshold for maximum temperature (95th percentile).
-    min_thresh : float
+        It can also be given per day, e.g. from `doy_thresholds_for_dates`,
+        or per grid cell.
+    min_thresh : float | numpy.ndarray
         Threshold for minimum temperature (90th percentile).
+        It can also be given per day, e.g. from `doy_thresholds_for_dates`,
+        or per grid cell.
     dates : numpy.ndarray | list
         Array of dates corresponding to the temperature data.
     min_days : int
@@ -220,11 +242,16 @@ def calculate_hwd(tmax: np.ndarray | list,
     
     Returns
     -------
-    tuple[list[tuple], int]
-        hwd_events : list of tuples
-            Each heat wave event's duration, global intensity, peak intensity, and start date.
-        total_hwd : int
-            Total number of heat wave days.
+    tuple[pandas.DataFrame, int | numpy.ndarray]
+        hwd_events : pandas.DataFrame
+            One row per heat wave event, sorted by grid cell and start date,
+            with columns 'start_date', 'duration' (days), 'global_intensity'
+            (mean maximum temperature) and 'peak_intensity' (highest maximum
+            temperature), preceded by 'cell' (flat index of the grid cell, 
+            see `numpy.unravel_index`) for gridded data. Empty if there is 
+            no heat wave.
+        total_hwd : int | numpy.ndarray
+            Total number of heat wave days, per grid cell for gridded data.
     
     Examples
     --------
@@ -235,40 +262,474 @@ def calculate_hwd(tmax: np.ndarray | list,
     >>> dates = pd.date_range('2023-07-01', periods=8)
     >>> hwd_events, total_hwd = calculate_hwd(tmax, tmin, 34.5, 24.5, dates, 3)
     >>> print(f"Total heat wave days: {total_hwd}")
+    Total heat wave days: 3
     
     Notes
     -----
-    - The function uses consecutive occurrence analysis to identify heat wave periods
+    - Heat waves are the runs of days exceeding both thresholds, found for 
+      every grid cell at once with `run_length_encode`.
     - Heat wave intensity is calculated as the average maximum temperature during the event
     - Peak intensity represents the highest maximum temperature within the heat wave
+    - Event intensities are segmented reductions (`numpy.ufunc.reduceat`) 
+      over the events laid out along each grid cell's time series, 
+      so there is no loop over events.
     """
-    # Create a boolean array where both thresholds are satisfied
-    heatwave_mask = (tmax > max_thresh) & (tmin > min_thresh)
+    tmax = np.asarray(tmax)
+    heatwave_mask = (tmax > max_thresh) & (np.asarray(tmin) > min_thresh)
     
-    # Find consecutive blocks of heat wave days
-    conv_result = np.convolve(heatwave_mask, np.ones(min_days, dtype=int), mode='valid') >= min_days
-    consecutive_indices = np.flatnonzero(conv_result)
+    # Heat wave events: runs of at least `min_days` days
+    cells, starts, durations, _ = run_length_encode(heatwave_mask, axis=0)
+    is_event = durations >= min_days
+    cells, starts, durations = cells[is_event], starts[is_event], durations[is_event]
     
-    hwd_events = []
-    total_hwd = 0
+    cell_shape = tmax.shape[1:]
+    total_hwd = np.bincount(cells, weights=durations, 
+                            minlength=int(np.prod(cell_shape)))
+    total_hwd = total_hwd.astype(np.int64).reshape(cell_shape)
     
-    if consecutive_indices.size > 0:
-        consecutive_lengths = count_consecutive(consecutive_indices)
+    # Event segments over the (cell, time) layout of the data, 
+    # [start, end) bounds interleaved for reduceat
+    n_times = tmax.shape[0]
+    tmax_flat = np.append(np.moveaxis(tmax, 0, -1).ravel(), 0)
+    bounds = np.empty(2 * len(starts), dtype=np.int64)
+    bounds[0::2] = cells * n_times + starts
+    bounds[1::2] = bounds[0::2] + durations
+    
+    if len(starts):
+        global_intensity = np.add.reduceat(tmax_flat, bounds)[0::2] / durations
+        peak_intensity = np.maximum.reduceat(tmax_flat, bounds)[0::2]
+    else:
+        intensity_dtype = np.result_type(tmax.dtype, np.float64)
+        global_intensity = peak_intensity = np.empty(0, dtype=intensity_dtype)
+        
+    hwd_events = pd.DataFrame({"start_date": np.asarray(dates)[starts],
+                               "duration": durations,
+                               "global_intensity": global_intensity,
+                               "peak_intensity": peak_intensity})
+    if cell_shape:
+        hwd_events.insert(0, "cell", cells)
+        
+    return hwd_events, total_hwd if cell_shape else int(total_hwd)
+
+
+# Percentile thresholds #
+#-----------------------#
+
+def calculate_doy_percentile_thresholds(data: np.ndarray, 
+                                        dates, 
+                                        percentiles: float | list[float], 
+                                        window: int = 5,
+                                        base_period: tuple[int, int] | None = None,
+                                        leap_day: str = "merge",
+                                        batch_size: int = 32) -> np.ndarray:
+    """
+    Calculate day-of-year percentile thresholds over a moving window,
+    e.g. the 90th and 95th percentiles of daily temperatures used to 
+    define heat waves, for every grid cell at once.
+    
+    The threshold of each calendar day is the percentile of all the base
+    period samples within ±`window` days of it, with the window wrapping
+    around the end of the year.
+    
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Daily data, with time along the first axis and any number of 
+        further (e.g. grid) dimensions. NaN values are skipped.
+        Single precision data is kept as such.
+    dates : array-like
+        Dates of the first axis of `data`.
+    percentiles : float | list[float]
+        Percentile(s) to compute, between 0 and 100.
+    window : int, default 5
+        Half-width of the moving window in days, so that each window 
+        holds 2*window+1 calendar days of every base period year.
+    base_period : tuple[int, int] | None, optional
+        First and last year (both included) of the base period.
+        Defaults to None, which uses every year in the data.
+    leap_day : {"merge", "drop"}, default "merge"
+        How to handle 29 February samples: pool them with 28 February's
+        ones, or leave them out. In both cases, the 29 February threshold
+        is that of 28 February.
+    batch_size : int, default 32
+        Number of calendar days whose window samples are gathered 
+        at once, which bounds memory use to about 
+        batch_size × (2*window+1) × n_years × grid size values.
+    
+    Returns
+    -------
+    numpy.ndarray
+        Thresholds with shape (366, *data.shape[1:]), the first axis 
+        running over the calendar days of a leap year (1 January to 
+        31 December), preceded by a percentile axis if a list of 
+        percentiles is given.
+        
+    Raises
+    ------
+    ValueError
+        If `window` is negative, the leap day option is unsupported, 
+        or no date falls within the base period.
+    
+    Examples
+    --------
+    >>> tmax_p95 = calculate_doy_percentile_thresholds(tmax, dates, 95, 
+    ...                                                base_period=(1991, 2020))
+    >>> max_thresh = doy_thresholds_for_dates(tmax_p95, dates)
+    
+    Notes
+    -----
+    - Window samples are gathered for a batch of days at a time, and the 
+      percentiles of all days, grid cells and percentiles in the batch are
+      read from the order statistics of a single sort call along contiguous
+      memory, which vectorised sorting makes faster than partitioning 
+      around several order statistics. Cells with NaN values use their 
+      own number of valid samples.
+    - Percentiles are linearly interpolated between order statistics,
+      as in `numpy.percentile`'s default method.
+    """
+    if window < 0:
+        raise ValueError(f"Window half-width must be non-negative, got {window}.")
+    if leap_day not in LEAP_DAY_OPTIONS:
+        raise ValueError(f"Unsupported leap day option '{leap_day}'. "
+                         f"Options are {LEAP_DAY_OPTIONS}.")
+    
+    data = np.asarray(data)
+    if not np.issubdtype(data.dtype, np.floating):
+        data = data.astype(np.float64)
+    quantiles = np.atleast_1d(np.asarray(percentiles, dtype=np.float64)) / 100
+    
+    # Calendar day of each sample in a 365-day year, 29 February pooled with 28 February
+    calendar_index = get_calendar_index(dates)
+    leap_calendar_day = (LEAP_YEAR_MONTH_OFFSETS[calendar_index.month - 1] 
+                         + calendar_index.day - 1)
+    noleap_day = leap_calendar_day - (leap_calendar_day >= FEB29_CALENDAR_DAY)
+    
+    in_base = np.ones(len(noleap_day), dtype=bool)
+    if base_period is not None:
+        in_base &= ((calendar_index.year >= base_period[0]) 
+                    & (calendar_index.year <= base_period[1]))
+    if leap_day == "drop":
+        in_base &= leap_calendar_day != FEB29_CALENDAR_DAY
+    if not in_base.any():
+        raise ValueError("No dates fall within the base period.")
+    
+    # Sample positions of each calendar day
+    base_pos = np.flatnonzero(in_base)
+    sort_order = base_pos[np.argsort(noleap_day[base_pos], kind="stable")]
+    day_offsets = np.r_[0, np.cumsum(np.bincount(noleap_day[base_pos], minlength=365))]
+    day_samples = [sort_order[day_offsets[d]:day_offsets[d+1]] for d in range(365)]
+    
+    # Sample positions of each (circular) window, grouped by window size
+    # so that each group can be gathered as a regular array
+    window_samples = [np.concatenate([day_samples[(d + offset) % 365] 
+                                      for offset in range(-window, window + 1)])
+                      for d in range(365)]
+    window_sizes = np.array([len(samples) for samples in window_samples])
+    
+    # Time as the last (contiguous) axis, so that window samples
+    # are gathered and partitioned along contiguous memory
+    data_t = np.ascontiguousarray(np.moveaxis(data, 0, -1))
+    
+    thresholds = np.full((len(quantiles), 365) + data.shape[1:], np.nan, 
+                         dtype=data.dtype)
+    for size in np.unique(window_sizes):
+        if size == 0:
+            continue
+        days = np.flatnonzero(window_sizes == size)
+        for batch_start in range(0, len(days), batch_size):
+            batch_days = days[batch_start:batch_start+batch_size]
+            window_idx = np.stack([window_samples[d] for d in batch_days])
+            batch_thresholds = batched_quantiles(data_t[..., window_idx], quantiles)
+            thresholds[:, batch_days] = np.moveaxis(batch_thresholds, -1, 1)
+    
+    # Expand to the calendar days of a leap year
+    thresholds = thresholds[:, LEAP_TO_NOLEAP_DAY]
+    return thresholds if np.ndim(percentiles) else thresholds[0]
+
+
+def doy_thresholds_for_dates(thresholds: np.ndarray, dates) -> np.ndarray:
+    """
+    Align day-of-year thresholds with a series of dates.
+    
+    Parameters
+    ----------
+    thresholds : numpy.ndarray
+        Thresholds with the 366 calendar days of a leap year along the
+        first axis, as returned by `calculate_doy_percentile_thresholds`
+        for a single percentile.
+    dates : array-like
+        Dates to get the thresholds for.
+        
+    Returns
+    -------
+    numpy.ndarray
+        Thresholds with shape (len(dates), *thresholds.shape[1:]),
+        which can be compared directly with data over the same dates.
+    """
+    calendar_index = get_calendar_index(dates)
+    leap_calendar_day = (LEAP_YEAR_MONTH_OFFSETS[calendar_index.month - 1] 
+                         + calendar_index.day - 1)
+    return np.asarray(thresholds)[leap_calendar_day]
+
+
+# Indicator suite #
+#-----------------#
+
+class IndicatorSuite:
+    """
+    Climate indicators computed together over every season or year of
+    daily data, for every grid cell at once.
+    
+    The data is traversed once, period by period: each variable is gathered
+    once per period, each distinct threshold mask (variable, comparison and 
+    threshold) is computed once on it, and all the indicators built on that
+    mask are derived from a single run-length pass over it, e.g. SU and CSU
+    share the mask of the maximum temperature above 25 ºC. This replaces 
+    one scan per indicator, period and grid cell.
+    
+    Parameters
+    ----------
+    tmax : numpy.ndarray | xarray.DataArray | None
+        Daily maximum temperature in units ºC.
+    tmin : numpy.ndarray | xarray.DataArray | None
+        Daily minimum temperature in units ºC.
+    precip : numpy.ndarray | xarray.DataArray | None
+        Daily precipitation in units mm.
+    dates : array-like | None
+        Dates of the daily data. Defaults to None, which takes the 
+        time coordinate of xarray input (required for NumPy input).
+    season_months : list[int] | list[list[int]] | dict[str, list[int]] | None
+        Season or set of seasons over which the indicators are computed,
+        as in `periodic_statistics`; seasons spanning the end of the year
+        are assigned to the year of their last month. Defaults to None, 
+        which computes them per calendar year.
+    time_dim : str, default "time"
+        Name of the time dimension of xarray input.
+        
+    Attributes
+    ----------
+    period_dates : numpy.ndarray
+        Last day of each period (datetime64[ns]).
+    period_labels : numpy.ndarray | None
+        Season label of each period, None for yearly periods.
+        
+    Examples
+    --------
+    >>> suite = IndicatorSuite(tmax=tmax_da, tmin=tmin_da, precip=precip_da,
+    ...                        season_months=STANDARD_SEASONS)
+    >>> indices_ds = suite.compute(["SU", "CSU", "FD", "TN", "RR", "CWD", "WSDI"],
+    ...                            thresholds={"WSDI": tmax_p90})
+    
+    Notes
+    -----
+    Only the variables needed by the requested indicators have to be given.
+    All of them must share the same shape, with time first for NumPy input 
+    (e.g. (time, lat, lon)); xarray input is transposed so that time comes
+    first. Missing values never exceed a threshold.
+    """
+    
+    def __init__(self,
+                 tmax: np.ndarray | xr.DataArray | None = None,
+                 tmin: np.ndarray | xr.DataArray | None = None,
+                 precip: np.ndarray | xr.DataArray | None = None,
+                 dates=None,
+                 season_months=None,
+                 time_dim: str = "time"):
+        self._data = {}
+        self._template = None
+        self._time_dim = time_dim
+        
+        for var_name, data in dict(tmax=tmax, tmin=tmin, precip=precip).items():
+            if data is None:
+                continue
+            if isinstance(data, xr.DataArray):
+                data = data.transpose(time_dim, ...)
+                if dates is None:
+                    dates = data[time_dim].values
+                if self._template is None:
+                    self._template = data.isel({time_dim: 0}, drop=True)
+                data = data.values
+            self._data[var_name] = np.asarray(data)
+            
+        if not self._data:
+            raise ValueError("At least one of 'tmax', 'tmin' or 'precip' "
+                             "must be given.")
+        if dates is None:
+            raise ValueError("Dates must be given for NumPy input.")
+        
+        data_shapes = {data.shape for data in self._data.values()}
+        if len(data_shapes) > 1:
+            raise ValueError("All variables must have the same shape, "
+                             f"got {sorted(data_shapes)}.")
+        self._shape = data_shapes.pop()
+        if len(dates) != self._shape[0]:
+            raise ValueError(f"Got {len(dates)} dates for {self._shape[0]} time steps.")
+        
+        # Period of each date: calendar year or season of each year
+        calendar_index = get_calendar_index(dates)
+        if season_months is None:
+            self._season_set = None
+            codes = calendar_index.year.astype(np.int64)
+        else:
+            self._season_set = normalise_season_set(season_months)
+            codes = calendar_index.season_codes(list(self._season_set.values()), 
+                                                include_year=True)
+            
+        in_period = np.flatnonzero(codes >= 0)
+        if not len(in_period):
+            raise ValueError("No dates fall within the given seasons.")
+        
+        # Dates of each period, as slices of the time axis when contiguous
+        order = in_period[np.argsort(codes[in_period], kind="stable")]
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        self._period_positions = []
+        for period_pos in np.split(order, starts[1:]):
+            if np.all(np.diff(period_pos) == 1):
+                period_pos = slice(period_pos[0], period_pos[-1] + 1)
+            self._period_positions.append(period_pos)
         
-        for count in consecutive_lengths:
-            hw_event_indices = np.arange(consecutive_indices[0], consecutive_indices[0] + count)
-            hw_max_temps = tmax[hw_event_indices]
+        period_codes = sorted_codes[starts]
+        if self._season_set is None:
+            december_idx = np.zeros(len(period_codes), dtype=int)
+            self.period_dates = season_end_dates([[12]], december_idx, period_codes)
+            self.period_labels = None
+        else:
+            season_idx = period_codes % YEAR_CODE_FACTOR
+            self.period_dates = season_end_dates(list(self._season_set.values()), 
+                                                 season_idx, 
+                                                 period_codes // YEAR_CODE_FACTOR)
+            self.period_labels = np.array(list(self._season_set))[season_idx]
             
-            # Calculate heat wave characteristics
-            duration = hw_event_indices.size
-            global_intensity = hw_max_temps.sum() / duration
-            peak_intensity = hw_max_temps.max()
-            start_date = dates[hw_event_indices[0]]
+    def compute(self,
+                indices: list[str] | None = None,
+                thresholds: dict | None = None,
+                min_consec_days: int = 6):
+        """
+        Compute a set of climate indicators for every period and grid cell.
+        
+        Parameters
+        ----------
+        indices : list[str] | None
+            Indicators to compute, out of "SU", "CSU", "FD", "TN", "RR", 
+            "CWD" and "WSDI" (as defined by the `calculate_*` functions). 
+            Defaults to None, which computes all those whose variables 
+            and thresholds are available.
+        thresholds : dict | None
+            Thresholds keyed by indicator, overriding the defaults 
+            (SU, CSU: 25 ºC; FD: 0 ºC; TN: 20 ºC; RR, CWD: 1 mm).
+            WSDI has no default threshold: it is usually the 90th percentile 
+            of the maximum temperature, see `calculate_doy_percentile_thresholds`.
+            Thresholds can be scalars, arrays broadcastable against the 
+            grid cells, or arrays with the shape of the data (time first), 
+            e.g. from `doy_thresholds_for_dates`.
+        min_consec_days : int, default 6
+            Minimum number of consecutive days of a warm spell (WSDI).
             
-            hwd_events.append((duration, global_intensity, peak_intensity, start_date))
-            total_hwd += duration
+        Returns
+        -------
+        dict[str, numpy.ndarray] | xarray.Dataset
+            Indicators with shape (period, *cells), as a dictionary of
+            arrays for NumPy input, or as a Dataset with the period end dates 
+            along the time dimension (and a 'season' coordinate for 
+            seasonal periods) for xarray input.
+            
+        Raises
+        ------
+        ValueError
+            If an indicator is unsupported, or its variable or threshold 
+            is missing.
+        """
+        thresholds = thresholds or {}
+        if indices is None:
+            indices = [index 
+                       for index, (var_name, _, default_threshold, _) 
+                       in INDICATOR_DEFINITIONS.items()
+                       if var_name in self._data
+                       and (default_threshold is not None or index in thresholds)]
+        
+        # Run statistics requested of each distinct mask, so that indicators
+        # with the same variable, comparison and threshold share it
+        mask_requests = {}
+        for index in indices:
+            if index not in INDICATOR_DEFINITIONS:
+                raise ValueError(f"Unsupported indicator '{index}'. "
+                                 f"Options are {list(INDICATOR_DEFINITIONS)}.")
+            var_name, comparison, default_threshold, _ = INDICATOR_DEFINITIONS[index]
+            if var_name not in self._data:
+                raise ValueError(f"Indicator '{index}' requires '{var_name}' data.")
+            threshold = thresholds.get(index, default_threshold)
+            if threshold is None:
+                raise ValueError(f"Indicator '{index}' requires a threshold.")
             
-            # Remove used indices
-            consecutive_indices = consecutive_indices[count:]
+            mask_key = (var_name, comparison, 
+                        float(threshold) if np.ndim(threshold) == 0 else id(threshold))
+            mask_request = mask_requests.setdefault(mask_key, 
+                                                    (np.asarray(threshold), []))
+            mask_request[1].append(index)
+            
+        cell_shape = self._shape[1:]
+        results = {index: np.zeros((len(self.period_dates),) + cell_shape, 
+                                   dtype=np.int64)
+                   for index in indices}
+        
+        # One pass over the periods: each variable is gathered once per period, 
+        # and each mask is computed and reduced into all of its indicators at once
+        for period_idx, period_pos in enumerate(self._period_positions):
+            for var_name, data in self._data.items():
+                var_masks = [(mask_key, request) 
+                             for mask_key, request in mask_requests.items()
+                             if mask_key[0] == var_name]
+                if not var_masks:
+                    continue
+                period_data = data[period_pos]
+                
+                for (_, comparison, _), (threshold, mask_indices) in var_masks:
+                    if threshold.ndim == data.ndim:
+                        threshold = threshold[period_pos]
+                    period_mask = (period_data > threshold if comparison == "above" 
+                                   else period_data < threshold)
+                    
+                    stats = [INDICATOR_DEFINITIONS[index][3] for index in mask_indices]
+                    min_lengths = [min_consec_days if index == "WSDI" else 1 
+                                   for index in mask_indices]
+                    mask_stats = run_length_statistics(period_mask, stats, min_lengths)
+                    for index, values in zip(mask_indices, mask_stats):
+                        results[index][period_idx] = values
+            
+        if self._template is None:
+            return results
+        
+        time_coords = {self._time_dim: self.period_dates}
+        if self.period_labels is not None:
+            time_coords["season"] = (self._time_dim, self.period_labels)
+        dims = (self._time_dim,) + self._template.dims
+        return xr.Dataset({index: (dims, values) for index, values in results.items()},
+                          coords={**self._template.coords, **time_coords})
+
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Leap day handling options for percentile thresholds #
+LEAP_DAY_OPTIONS = ["merge", "drop"]
+
+# Calendar days (0-based) of a leap year #
+LEAP_YEAR_MONTH_OFFSETS = np.cumsum([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30])
+FEB29_CALENDAR_DAY = 59
+
+# 365-day calendar position of each calendar day of a leap year #
+# (29 February pooled with 28 February) #
+LEAP_TO_NOLEAP_DAY = np.arange(366) - (np.arange(366) >= FEB29_CALENDAR_DAY)
 
-    return hwd_events, total_hwd if hwd_events else ([(0, None, None, None)], 0)
+# Indicators of the suite: variable, comparison, default threshold and run statistic #
+INDICATOR_DEFINITIONS = {
+    "SU": ("tmax", "above", 25, "n_occurrences"),
+    "CSU": ("tmax", "above", 25, "max_length"),
+    "FD": ("tmin", "below", 0, "n_occurrences"),
+    "TN": ("tmin", "above", 20, "n_occurrences"),
+    "RR": ("precip", "above", 1, "n_occurrences"),
+    "CWD": ("precip", "above", 1, "max_length"),
+    "WSDI": ("tmax", "above", None, "n_occurrences")
+}
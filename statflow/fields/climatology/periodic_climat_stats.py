@@ -32,9 +32,13 @@ Notes
 #----------------#
 
 import calendar
+import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 
 import numpy as np
 import pandas as pd
+import xarray as xr
 
 #------------------------#
 # Import project modules #
@@ -42,27 +46,38 @@ import pandas as pd
 
 from filewise.general.introspection_utils import get_caller_args, get_type_str
 from paramlib.global_parameters import (
-    BASIC_TIME_FORMAT_STRS,
     MONTH_NUMBER_DICT,
-    TIME_FREQUENCIES_COMPLETE,
     TIME_FREQUENCIES_ABBREVIATED
 )
 from pygenutils.strings.string_handler import find_substring_index
 from pygenutils.strings.text_formatters import format_string
 from pygenutils.time_handling.date_and_time_utils import find_dt_key
-from pygenutils.time_handling.time_formatters import datetime_obj_converter
-from statflow.core.time_series import periodic_statistics
+from pygenutils.time_handling.time_formatters import parse_dt_string
+from statflow.utils.helpers import (
+    CALENDAR_CODE_FACTORS,
+    PARTIAL_AGGREGATE_KEYS,
+    finalise_partial_aggregates,
+    get_calendar_index,
+    get_table_columns,
+    iter_table_batches,
+    merge_partial_aggregates,
+    normalise_season_set,
+    parallel_group_partial_aggregates,
+    season_end_dates
+)
 
 #------------------#
 # Define functions #
 #------------------#
 
 def climat_periodic_statistics(obj,
-                               statistic: str,
+                               statistic: str | list[str],
                                time_freq: str,
                                keep_std_dates: bool = False, 
                                drop_date_idx_col: bool = False,
-                               season_months: list[int] | None = None):
+                               season_months: list[int] | None = None,
+                               output_layout: str = "wide",
+                               n_workers: int | None = None):
     """
     Function that calculates climatologic statistics for a time-frequency.
     
@@ -70,8 +85,10 @@ def climat_periodic_statistics(obj,
     ----------
     obj : pandas.DataFrame | xarray.Dataset | xarray.DataArray
         The data object for climatological statistics calculation.
-    statistic : {"max", "min", "mean", "std", "sum"}
-        The statistic to calculate.
+    statistic : {"max", "min", "mean", "std", "sum"} | list[str]
+        The statistic to calculate, or a list of them. In the latter case,
+        all statistics are derived from a single traversal of the data
+        and laid out according to `output_layout`.
     time_freq : str
         Time frequency to which data will be filtered.
     keep_std_dates : bool
@@ -84,16 +101,36 @@ def climat_periodic_statistics(obj,
         Whether to drop the date index column. Default is False.
         If True, the dates will be kept, but the corresponding array
         will be an index, instead of a column.
+        Only applies to yearly DataFrame climatologies.
         Defaults to False
-    season_months : list[int] | None
+    season_months : list[int] | list[list[int]] | dict[str, list[int]] | None
         List containing the month numbers to later refer to the time array,
         whatever the object is among the mentioned three types.
+        A set of seasons can also be given, either as a list of month lists
+        or as month lists keyed by season label (e.g. 
+        `statflow.utils.helpers.STANDARD_SEASONS`), in which case all 
+        seasons are computed in a single grouping pass, with one row 
+        (DataFrame) or one element along a 'season' dimension (xarray)
+        per season.
         Defaults to None.
+    output_layout : {"wide", "long"}
+        Layout of the output when a list of statistics is given.
+        "wide" adds one column (DataFrame) or variable (xarray) per input 
+        column or variable and statistic, suffixed with the statistic name.
+        "long" stacks the statistics, in a 'statistic' column (DataFrame)
+        or along a new leading 'statistic' dimension (xarray).
+        Ignored for a single statistic. Default is "wide".
+    n_workers : int | None
+        Number of worker processes among which the reduction is split 
+        by variable and spatial tile (DataFrame columns, or the variables 
+        and grid cells of xarray objects), with the input shared through 
+        shared memory instead of being pickled per worker. Results are 
+        identical to the serial ones. Default is None (serial execution).
     
     Returns
     -------
     obj_climat : pandas.DataFrame | xarray.Dataset | xarray.DataArray
-        Calculated climatological average.
+        Calculated climatological statistic(s).
     
     Notes
     -----
@@ -102,61 +139,90 @@ def climat_periodic_statistics(obj,
     """
     
     # Input validation
-    _validate_inputs(time_freq, season_months, statistic)
+    _validate_inputs(time_freq, season_months, statistic, output_layout)
+    statistics = [statistic] if isinstance(statistic, str) else list(statistic)
     
-    # Determine object type and get time frequency abbreviation
+    # Determine object type
     obj_type = get_type_str(obj, lowercase=True)
-    freq_abbr = FREQ_ABBRS[TIME_FREQUENCIES_ABBREVIATED.index(time_freq)]
     
     # Identify the time dimension
     date_key = _get_time_dimension(obj, obj_type)
     
-    # Get date array and parts of it
-    dates = obj[date_key]
-    years = np.unique(dates.dt.year)
-    days = np.unique(dates.dt.day)
-    months = np.unique(dates.dt.month)
-    hours = np.unique(dates.dt.hour)
+    # Get the (cached) calendar index of the date array and the years it spans
+    calendar_index = get_calendar_index(obj[date_key])
+    years = np.unique(calendar_index.year).astype(int)
     
     # Get the latest year (preferably a leap year)
     latest_year = _get_latest_year(years)
     
     # Process based on object type
     if obj_type == "dataframe":
-        return _process_dataframe(obj, date_key, statistic, time_freq, keep_std_dates, 
-                                drop_date_idx_col, season_months, freq_abbr, 
-                                latest_year, months, days, hours)
+        climat_objs = _process_dataframe(obj, date_key, statistics, time_freq, 
+                                         keep_std_dates, season_months, latest_year, 
+                                         n_workers)
     elif obj_type in ["dataset", "dataarray"]:
-        return _process_xarray(obj, date_key, statistic, time_freq, keep_std_dates, 
-                             season_months, freq_abbr, latest_year)
+        climat_objs = _process_xarray(obj, date_key, statistics, time_freq, 
+                                      keep_std_dates, season_months, latest_year, 
+                                      n_workers)
     else:
         raise TypeError(f"Unsupported object type: {obj_type}")
+    
+    static_vars = _static_vars(obj, date_key) if obj_type == "dataset" else []
+    obj_climat = _combine_statistics(climat_objs, statistic, output_layout, 
+                                     obj_type, static_vars)
+    
+    if obj_type == "dataframe" and time_freq == "yearly" and drop_date_idx_col:
+        obj_climat = obj_climat.set_index(obj_climat.columns[0])
+    
+    return obj_climat
 
 
-def _validate_inputs(time_freq: str, season_months: list[int] | None, statistic: str | None = None) -> None:
+def _validate_inputs(time_freq: str, 
+                     season_months: list[int] | None, 
+                     statistic: str | list[str] | None = None,
+                     output_layout: str = "wide") -> None:
     """Validate input parameters."""
     if time_freq not in TIME_FREQUENCIES_ABBREVIATED:
         format_args_climat_stats = ("time-frequency", time_freq, TIME_FREQUENCIES_ABBREVIATED)
         raise ValueError(format_string(UNSUPPORTED_OPTION_ERROR_TEMPLATE, format_args_climat_stats))
     
-    if statistic is not None and statistic not in STATISTICS:
-        format_args_stat = ("statistic", statistic, STATISTICS)
-        raise ValueError(format_string(UNSUPPORTED_OPTION_ERROR_TEMPLATE, format_args_stat))
+    if statistic is not None:
+        statistics = [statistic] if isinstance(statistic, str) else list(statistic)
+        if not statistics:
+            raise ValueError("At least one statistic must be given.")
+        for stat in statistics:
+            if stat not in STATISTICS:
+                format_args_stat = ("statistic", stat, STATISTICS)
+                raise ValueError(format_string(UNSUPPORTED_OPTION_ERROR_TEMPLATE, 
+                                               format_args_stat))
+            
+    if output_layout not in OUTPUT_LAYOUTS:
+        format_args_layout = ("output layout", output_layout, OUTPUT_LAYOUTS)
+        raise ValueError(format_string(UNSUPPORTED_OPTION_ERROR_TEMPLATE, 
+                                       format_args_layout))
     
     if time_freq == "seasonal":
         param_keys = get_caller_args()
         seas_months_arg_pos = find_substring_index(param_keys, "season_months")
         seas_mon_arg_type = get_type_str(season_months)
         
-        if seas_mon_arg_type != "list":
-            raise TypeError("Expected a list for parameter "
+        if seas_mon_arg_type not in ["list", "dict"]:
+            raise TypeError("Expected a list or dictionary for parameter "
                             f"'{param_keys[seas_months_arg_pos]}', "
                             f"got '{seas_mon_arg_type}'.")
         
-        if (season_months and len(season_months) != 3):
+        if _is_season_set(season_months):
+            normalise_season_set(season_months)
+        elif (season_months and len(season_months) != 3):
             raise ValueError(SEASON_MONTH_FMT_ERROR_TEMPLATE)
 
 
+def _is_season_set(season_months) -> bool:
+    """Whether a set of seasons is given, instead of a single season's months."""
+    return (isinstance(season_months, dict) 
+            or any(np.ndim(months) for months in season_months))
+
+
 def _get_time_dimension(obj, obj_type: str) -> str:
     """Get the time dimension key from the object."""
     if obj_type in ["dataframe", "dataset", "dataarray"]:
@@ -168,9 +234,8 @@ def _get_time_dimension(obj, obj_type: str) -> str:
 def _get_latest_year(years: np.ndarray) -> int:
     """Get the latest year, preferably a leap year."""
     leapyear_bool_arr = [calendar.isleap(year) for year in years]
-    llba = len(leapyear_bool_arr)
     
-    if llba > 0:
+    if any(leapyear_bool_arr):
         return years[leapyear_bool_arr][-1]
     else:
         return years[-1]
@@ -178,159 +243,195 @@ def _get_latest_year(years: np.ndarray) -> int:
 
 def _process_dataframe(obj: pd.DataFrame, 
                       date_key: str, 
-                      statistic: str, 
+                      statistics: list[str], 
                       time_freq: str, 
                       keep_std_dates: bool, 
-                      drop_date_idx_col: bool, 
                       season_months: list[int] | None, 
-                      freq_abbr: str, 
-                      latest_year: int, 
-                      months: np.ndarray, 
-                      days: np.ndarray, 
-                      hours: np.ndarray):
-    """Process pandas DataFrame objects."""
+                      latest_year: int,
+                      n_workers: int | None = None) -> dict[str, pd.DataFrame]:
+    """Process pandas DataFrame objects, returning the climatology of each statistic."""
     # Define the climatologic statistical data frame columns
     climat_obj_cols = [date_key] + [obj.columns[i]+"_climat" for i in range(1, len(obj.columns))]
     
     # Process based on time frequency
-    if time_freq == "hourly":
-        climat_vals, climat_dates, climat_obj_cols = _process_hourly_dataframe(
-            obj, date_key, statistic, keep_std_dates, freq_abbr, latest_year, 
-            months, days, hours, climat_obj_cols
-        )
-    elif time_freq == "daily":
-        climat_vals, climat_dates, climat_obj_cols = _process_daily_dataframe(
-            obj, date_key, statistic, keep_std_dates, freq_abbr, latest_year, 
-            months, days, climat_obj_cols
-        )
-    elif time_freq == "monthly":
-        climat_vals, climat_dates, climat_obj_cols = _process_monthly_dataframe(
-            obj, date_key, statistic, keep_std_dates, freq_abbr, latest_year, 
-            months, climat_obj_cols
+    if time_freq in CALENDAR_CODE_FACTORS:
+        climat_vals, climat_dates, climat_obj_cols = _process_calendar_dataframe(
+            obj, date_key, statistics, time_freq, keep_std_dates, latest_year, 
+            climat_obj_cols, n_workers
         )
     elif time_freq == "seasonal":
         climat_vals, climat_dates, climat_obj_cols = _process_seasonal_dataframe(
-            obj, date_key, statistic, keep_std_dates, season_months, climat_obj_cols
+            obj, date_key, statistics, keep_std_dates, season_months, climat_obj_cols,
+            n_workers
         )
     elif time_freq == "yearly":
-        climat_vals, climat_dates = _process_yearly_dataframe(
-            obj, statistic, freq_abbr, drop_date_idx_col
-        )
+        climat_vals, climat_dates = _process_yearly_dataframe(obj, date_key, 
+                                                              statistics, n_workers)
     
-    # Format the output DataFrame
-    return _format_dataframe_output(climat_vals, climat_dates, climat_obj_cols)
-
-
-def _process_hourly_dataframe(obj: pd.DataFrame, 
-                            date_key: str, 
-                            statistic: str, 
-                            keep_std_dates: bool, 
-                            freq_abbr: str, 
-                            latest_year: int, 
-                            months: np.ndarray, 
-                            days: np.ndarray, 
-                            hours: np.ndarray, 
-                            climat_obj_cols: list[str]) -> tuple[list, np.ndarray, list[str]]:
-    """Process hourly data for DataFrame."""
-    climat_vals = []
-    for m in months:
-        for d in days:
-            for h in hours:
-                subset = obj[(obj[date_key].dt.month == m) & 
-                             (obj[date_key].dt.day == d) & 
-                             (obj[date_key].dt.hour == h)].iloc[:, 1:]
-                if len(subset) > 0:
-                    climat_vals.append(subset[statistic]())
-    
-    if keep_std_dates:
-        climat_dates = pd.date_range(f"{latest_year}-01-01 0:00",
-                                     f"{latest_year}-12-31 23:00",
-                                     freq=freq_abbr)
-    else:    
-        climat_dates = np.arange(len(climat_vals))
-        climat_obj_cols[0] = "hour_of_year"
-    
-    return climat_vals, climat_dates, climat_obj_cols
+    # Format the output DataFrames
+    return {stat: _format_dataframe_output(climat_vals[stat], 
+                                           climat_dates, 
+                                           climat_obj_cols)
+            for stat in statistics}
 
 
-def _process_daily_dataframe(obj: pd.DataFrame, 
-                           date_key: str, 
-                           statistic: str, 
-                           keep_std_dates: bool, 
-                           freq_abbr: str, 
-                           latest_year: int, 
-                           months: np.ndarray, 
-                           days: np.ndarray, 
-                           climat_obj_cols: list[str]) -> tuple[list, np.ndarray, list[str]]:
-    """Process daily data for DataFrame."""
-    climat_vals = []
-    for m in months:
-        for d in days:
-            subset = obj[(obj[date_key].dt.month == m) & 
-                         (obj[date_key].dt.day == d)].iloc[:, 1:]
-            if len(subset) > 0:
-                climat_vals.append(subset[statistic]())
+def _process_calendar_dataframe(obj: pd.DataFrame, 
+                                date_key: str, 
+                                statistics: list[str], 
+                                time_freq: str, 
+                                keep_std_dates: bool, 
+                                latest_year: int, 
+                                climat_obj_cols: list[str],
+                                n_workers: int | None = None
+                                ) -> tuple[dict[str, np.ndarray], 
+                                           pd.DatetimeIndex | np.ndarray, 
+                                           list[str]]:
+    """
+    Process hourly, daily and monthly data for DataFrame.
     
-    if keep_std_dates:
-        climat_dates = pd.date_range(f"{latest_year}-01-01 0:00",
-                                     f"{latest_year}-12-31 23:00",
-                                     freq=freq_abbr)
-    else:    
-        climat_dates = np.arange(1, len(climat_vals) + 1)
-        climat_obj_cols[0] = "day_of_year"
+    All calendar keys (hour of year, day of year or month of year)
+    are computed in a single grouping pass over the integer calendar codes
+    of the cached calendar index, instead of masking the whole frame once per key.
+    Every requested statistic is derived from the same partial aggregates.
+    
+    Parameters
+    ----------
+    obj : pd.DataFrame
+        Input DataFrame, with the dates in the first column.
+    date_key : str
+        Name of the date column.
+    statistics : list[str]
+        Statistical operations to perform ('mean', 'max', 'min', 'std', 'sum').
+    time_freq : {"hourly", "daily", "monthly"}
+        Time frequency of the climatology.
+    keep_std_dates : bool
+        Whether to label the keys with standard dates of `latest_year`.
+    latest_year : int
+        Year used to build the standard dates.
+    climat_obj_cols : list[str]
+        Output column names.
+    n_workers : int | None
+        Number of worker processes among which the columns are split.
+        Defaults to None (serial execution).
+        
+    Returns
+    -------
+    tuple[dict[str, np.ndarray], pd.DatetimeIndex | np.ndarray, list[str]]
+        climat_vals : dict[str, np.ndarray]
+            Values per calendar key and data column, for each statistic.
+        climat_dates : pd.DatetimeIndex | np.ndarray
+            Standard dates or calendar key indices.
+        climat_obj_cols : list[str]
+            Output column names, with the first one renamed if
+            calendar key indices are used.
+    """
+    calendar_index = get_calendar_index(obj[date_key])
+    sort_order, _, _ = calendar_index.group_offsets(time_freq)
+    data_vals = obj.iloc[:, 1:].to_numpy(dtype=np.float64)
+    calendar_codes = calendar_index.codes(time_freq)
+    group_codes, [partials] = parallel_group_partial_aggregates([data_vals], 
+                                                                calendar_codes,
+                                                                n_workers,
+                                                                sort_order=sort_order)
+    climat_vals = {stat: finalise_partial_aggregates(partials, stat) 
+                   for stat in statistics}
+    
+    climat_dates = _calendar_key_labels(group_codes, time_freq, 
+                                        keep_std_dates, latest_year)
+    if not keep_std_dates:
+        climat_obj_cols[0] = CALENDAR_KEY_NAMES[time_freq]
     
     return climat_vals, climat_dates, climat_obj_cols
 
 
-def _process_monthly_dataframe(obj: pd.DataFrame, 
-                             date_key: str, 
-                             statistic: str, 
-                             keep_std_dates: bool, 
-                             freq_abbr: str, 
-                             latest_year: int, 
-                             months: np.ndarray, 
-                             climat_obj_cols: list[str]) -> tuple[list, np.ndarray, list[str]]:
-    """Process monthly data for DataFrame."""
-    climat_vals = []
-    for m in months:
-        subset = obj[obj[date_key].dt.month == m].iloc[:, 1:]
-        if len(subset) > 0:
-            climat_vals.append(subset[statistic]())
-    
+def _calendar_key_labels(group_codes: np.ndarray, 
+                         time_freq: str, 
+                         keep_std_dates: bool, 
+                         latest_year: int) -> pd.DatetimeIndex | np.ndarray:
+    """
+    Label calendar keys either with standard dates of `latest_year`
+    or with hour, day or month of year indices.
+    """
     if keep_std_dates:
-        climat_dates = pd.date_range(f"{latest_year}-01-01 0:00",
-                                     f"{latest_year}-12-31 23:00",
-                                     freq=freq_abbr)
+        return _calendar_codes_to_dates(group_codes, time_freq, latest_year)
+    elif time_freq == "hourly":
+        return np.arange(len(group_codes))
+    elif time_freq == "daily":
+        return np.arange(1, len(group_codes) + 1)
     else:
-        climat_dates = np.arange(1, 13)
-        climat_obj_cols[0] = "month_of_year"
+        return group_codes.astype(np.int64)
+
+
+def _calendar_codes_to_dates(group_codes: np.ndarray, 
+                             time_freq: str, 
+                             latest_year: int) -> pd.DatetimeIndex:
+    """Convert calendar codes back to standard dates within the given year."""
+    month_factor, day_factor, hour_factor = CALENDAR_CODE_FACTORS[time_freq]
+    months = group_codes // month_factor
     
-    return climat_vals, climat_dates, climat_obj_cols
+    if time_freq == "monthly":
+        # Month-end dates, as given by the monthly frequency alias
+        month_starts = pd.to_datetime(dict(year=np.full(len(months), latest_year), 
+                                           month=months, 
+                                           day=1))
+        return pd.DatetimeIndex(month_starts + pd.offsets.MonthEnd(0))
+    
+    days = (group_codes % month_factor) // day_factor
+    hours = (group_codes % day_factor) // hour_factor if hour_factor else 0
+    return pd.DatetimeIndex(pd.to_datetime(dict(year=np.full(len(months), latest_year), 
+                                                month=months, 
+                                                day=days, 
+                                                hour=hours)))
 
 
 def _process_seasonal_dataframe(obj: pd.DataFrame, 
                               date_key: str, 
-                              statistic: str, 
+                              statistics: list[str], 
                               keep_std_dates: bool, 
-                              season_months: list[int] | None, 
-                              climat_obj_cols: list[str]) -> tuple[list, list, list[str]]:
-    """Process seasonal data for DataFrame."""
-    climat_vals = [obj[obj[date_key].dt.month.isin(season_months)].iloc[:, 1:][statistic]()]
-    
-    if keep_std_dates:                
-        climat_dates = [obj[obj[date_key].dt.month==season_months[-1]].
-                        iloc[-1][date_key].strftime(DAYTIME_FMT_STR)]
+                              season_months: (list[int] 
+                                              | list[list[int]] 
+                                              | dict[str, list[int]]), 
+                              climat_obj_cols: list[str],
+                              n_workers: int | None = None
+                              ) -> tuple[dict[str, np.ndarray], list, list[str]]:
+    """
+    Process seasonal data for DataFrame.
+    
+    Dates are labelled with their season through the month-to-season lookup 
+    of the calendar index, so a whole set of seasons is reduced 
+    in a single grouping pass.
+    """
+    calendar_index = get_calendar_index(obj[date_key])
+    season_set = normalise_season_set(season_months)
+    season_codes = calendar_index.season_codes(list(season_set.values()))
+    in_season = np.flatnonzero(season_codes >= 0)
+    
+    data_vals = obj.iloc[:, 1:].to_numpy(dtype=np.float64)[in_season]
+    group_codes, [partials] = parallel_group_partial_aggregates([data_vals], 
+                                                                season_codes[in_season],
+                                                                n_workers)
+    climat_vals = {stat: finalise_partial_aggregates(partials, stat) 
+                   for stat in statistics}
+    
+    if keep_std_dates:
+        # Latest date of each season's last month
+        season_last_months = [list(season_set.values())[code][-1] 
+                              for code in group_codes]
+        last_pos = [np.flatnonzero(calendar_index.month == month)[-1] 
+                    for month in season_last_months]
+        climat_dates = pd.DatetimeIndex(obj[date_key].iloc[last_pos]).normalize()
     else:
-        climat_dates = [MONTH_NUMBER_DICT[m] for m in season_months]
+        climat_dates = np.array(list(season_set))[group_codes]
         climat_obj_cols[0] = "season"
     
     return climat_vals, climat_dates, climat_obj_cols
 
 
 def _process_yearly_dataframe(obj: pd.DataFrame, 
-                            statistic: str, 
-                            freq_abbr: str, 
-                            drop_date_idx_col: bool) -> tuple[list, list]:
+                              date_key: str, 
+                              statistics: list[str],
+                              n_workers: int | None = None
+                              ) -> tuple[dict[str, np.ndarray], list]:
     """
     Process yearly data for DataFrame.
     
@@ -338,211 +439,866 @@ def _process_yearly_dataframe(obj: pd.DataFrame,
     ----------
     obj : pd.DataFrame
         Input DataFrame containing time series data.
-    statistic : str
-        Statistical operation to perform ('mean', 'max', 'min', 'std', 'sum').
-    freq_abbr : str
-        Frequency abbreviation for time resampling.
-    drop_date_idx_col : bool
-        Whether to drop the date index column from the results.
+    date_key : str
+        Name of the date column.
+    statistics : list[str]
+        Statistical operations to perform ('mean', 'max', 'min', 'std', 'sum').
+    n_workers : int | None
+        Number of worker processes among which the columns are split.
+        Defaults to None (serial execution).
         
     Returns
     -------
-    tuple[list, list]
-        climat_vals : list
-            List containing the calculated statistical values.
+    tuple[dict[str, np.ndarray], list]
+        climat_vals : dict[str, np.ndarray]
+            Statistic of the yearly statistics, for each statistic.
         climat_dates : list
-            List containing the corresponding dates.
+            List containing the end date of the latest year.
     """
-    climat_df = periodic_statistics(obj, statistic, freq_abbr, drop_date_idx_col)
-    climat_vals = [climat_df.iloc[:, 1:][statistic]()]
-    climat_dates = [climat_df.iloc[-1,0]]
+    calendar_index = get_calendar_index(obj[date_key])
+    data_vals = obj.iloc[:, 1:].to_numpy(dtype=np.float64)
+    _, [partials] = parallel_group_partial_aggregates([data_vals], 
+                                                      calendar_index.year,
+                                                      n_workers)
+    climat_vals = {}
+    for stat in statistics:
+        yearly_vals = finalise_partial_aggregates(partials, stat)
+        climat_vals[stat] = _statistic_of_periods(yearly_vals, stat, ddof=1)
+    climat_dates = [pd.Timestamp(int(calendar_index.year.max()), 12, 31)]
     
     return climat_vals, climat_dates
 
 
-def _format_dataframe_output(climat_vals: list, climat_dates: list | np.ndarray, climat_obj_cols: list[str]) -> pd.DataFrame:
-    """Format the output DataFrame."""
+def _statistic_of_periods(period_vals: np.ndarray, 
+                          statistic: str, 
+                          ddof: int) -> np.ndarray:
+    """
+    Statistic across periodic (e.g. yearly) statistics along the first axis, 
+    skipping NaNs.
+    """
+    if statistic == "std":
+        return np.nanstd(period_vals, axis=0, ddof=ddof, keepdims=True)
+    return getattr(np, "nan" + statistic)(period_vals, axis=0, keepdims=True)
+
+
+def _format_dataframe_output(climat_vals: list | np.ndarray, 
+                             climat_dates: list | np.ndarray | pd.DatetimeIndex, 
+                             climat_obj_cols: list[str]) -> pd.DataFrame:
+    """
+    Format the output DataFrame.
+    
+    The date (or calendar key) column and the value columns are stored
+    with their own types, instead of going through a common object array.
+    """
     # Check climatological value array's shape to later fit into the df
-    climat_vals = np.array(climat_vals)
+    climat_vals = np.asarray(climat_vals, dtype=np.float64)
     climat_vals_ndims = climat_vals.ndim
      
     if climat_vals_ndims == 1:
         climat_vals = climat_vals[:, np.newaxis]    
     
-    climat_dates = np.array(climat_dates, 'O')[:, np.newaxis]
-    
     # Store climatological data into the data frame
-    climat_arr = np.append(climat_dates, climat_vals, axis=1)
-    obj_climat = pd.DataFrame(climat_arr, columns=climat_obj_cols)
-    obj_climat.iloc[:, 0] = datetime_obj_converter(obj_climat.iloc[:, 0], "pandas")
+    obj_climat = pd.DataFrame(climat_vals, columns=climat_obj_cols[1:])
+    obj_climat.insert(0, climat_obj_cols[0], climat_dates)
     
     return obj_climat
 
 
 def _process_xarray(obj, 
                   date_key: str, 
-                  statistic: str, 
+                  statistics: list[str], 
                   time_freq: str, 
                   keep_std_dates: bool, 
                   season_months: list[int] | None, 
-                  freq_abbr: str, 
-                  latest_year: int):
-    """Process xarray objects (Dataset or DataArray)."""
+                  latest_year: int,
+                  n_workers: int | None = None) -> dict:
+    """
+    Process xarray objects (Dataset or DataArray), returning the climatology 
+    of each statistic.
+    
+    All time frequencies are reduced chunk by chunk along the time dimension
+    into per-group partial aggregates, which are then combined, so that
+    dask-backed objects larger than memory can be processed with memory use
+    bounded by their time chunk size. Every requested statistic is derived 
+    from the same partial aggregates.
+    """
+    calendar_index = get_calendar_index(obj[date_key])
+    
     # Process based on time frequency
-    if time_freq == "hourly":
-        obj_climat = _process_hourly_xarray(obj, date_key, statistic)
+    if time_freq in CALENDAR_CODE_FACTORS:
+        calendar_codes = calendar_index.codes(time_freq)
+        group_codes, climat_vals = _reduce_xarray_chunks(obj, date_key, calendar_codes,
+                                                         statistics, n_workers)
+        occ_time_name = date_key if keep_std_dates else CALENDAR_KEY_NAMES[time_freq]
+        climat_dates = _calendar_key_labels(group_codes, time_freq, 
+                                            keep_std_dates, latest_year)
+        
+        return {stat: _build_xarray_output(obj, date_key, climat_vals[stat], 
+                                           occ_time_name, climat_dates)
+                for stat in statistics}
+        
     elif time_freq == "seasonal":
-        obj_climat = _process_seasonal_xarray(obj, date_key, statistic, season_months)
-    else:
-        # For other time frequencies, use the original logic
-        obj_climat = _process_other_xarray(obj, date_key, statistic, time_freq)
+        # Dates out of every season are flagged with a negative code
+        season_set = normalise_season_set(season_months)
+        seasons = list(season_set.values())
+        season_codes = calendar_index.season_codes(seasons)
+        group_codes, climat_vals = _reduce_xarray_chunks(obj, date_key, season_codes, 
+                                                         statistics, n_workers)
+        
+        # A set of seasons keeps a season dimension
+        if _is_season_set(season_months):
+            if keep_std_dates:
+                occ_time_name = date_key
+                season_years = np.full(len(group_codes), latest_year)
+                climat_dates = season_end_dates(seasons, group_codes, season_years)
+            else:
+                occ_time_name = time_freq[:-2]
+                climat_dates = np.array(list(season_set))[group_codes]
+                
+            return {stat: _build_xarray_output(obj, date_key, climat_vals[stat], 
+                                               occ_time_name, climat_dates)
+                    for stat in statistics}
+        
+    elif time_freq == "yearly":
+        # Statistic of the yearly statistics
+        _, yearly_vals = _reduce_xarray_chunks(obj, date_key, calendar_index.year, 
+                                               statistics, n_workers)
+        climat_vals = {stat: {var_name: _statistic_of_periods(var_vals, stat, ddof=0)
+                              for var_name, var_vals in yearly_vals[stat].items()}
+                       for stat in statistics}
     
     # Format the time dimension
-    return _format_xarray_time_dimension(obj_climat, time_freq, keep_std_dates, 
-                                       season_months, freq_abbr, latest_year, date_key)
-
-
-def _process_hourly_xarray(obj, date_key: str, statistic: str):
-    """Process hourly data for xarray."""
-    # Define the hourly climatology pattern
-    obj_climat_nonstd_times = obj['time.hour'] / 24 + obj['time.dayofyear']
-    return obj.groupby(obj_climat_nonstd_times).statistic(dim=date_key)
-
-
-def _process_seasonal_xarray(obj, date_key: str, statistic: str, season_months: list[int] | None):
-    """Process seasonal data for xarray."""
-    obj_seas_sel = obj.sel({date_key: obj[date_key].dt.month.isin(season_months)})
-    return obj_seas_sel[statistic](dim=date_key)
+    climat_objs = {stat: _build_xarray_output(obj, date_key, climat_vals[stat], 
+                                              None, None)
+                   for stat in statistics}
+    return {stat: _format_xarray_time_dimension(climat_obj, time_freq, keep_std_dates, 
+                                                season_months, latest_year, date_key, 
+                                                calendar_index)
+            for stat, climat_obj in climat_objs.items()}
 
 
-def _process_other_xarray(obj, date_key: str, statistic: str, time_freq: str):
+def _reduce_xarray_chunks(obj, 
+                          date_key: str, 
+                          codes: np.ndarray, 
+                          statistics: list[str],
+                          n_workers: int | None = None
+                          ) -> tuple[np.ndarray, dict[str, dict[str, np.ndarray]]]:
     """
-    Process other time frequencies for xarray objects.
-    
-    This function handles time frequencies that are not specifically 
-    implemented in dedicated functions (hourly, seasonal).
+    Reduce the time dimension of an xarray object by group codes, chunk by chunk.
     
     Parameters
     ----------
     obj : xarray.Dataset | xarray.DataArray
-        Input xarray object containing time series data.
+        Input xarray object. If it is dask-backed, its chunks along the time 
+        dimension are loaded one at a time; otherwise it is reduced at once.
     date_key : str
-        Name of the time dimension in the xarray object.
-    statistic : str
-        Statistical operation to perform ('mean', 'max', 'min', 'std', 'sum').
-    time_freq : str
-        Time frequency for grouping ('daily', 'monthly', 'yearly').
+        Name of the time dimension.
+    codes : np.ndarray
+        Group code of each time step. Negative codes are left out.
+    statistics : list[str]
+        Statistical operations to perform ('mean', 'max', 'min', 'std', 'sum').
+    n_workers : int | None
+        Number of worker processes among which the variables and grid cells
+        of each chunk are split. Defaults to None (serial execution).
         
     Returns
     -------
-    xarray.Dataset | xarray.DataArray
-        Processed xarray object with applied statistical operation.
-        
+    tuple[np.ndarray, dict[str, dict[str, np.ndarray]]]
+        group_codes : np.ndarray
+            Sorted unique group codes.
+        climat_vals : dict[str, dict[str, np.ndarray]]
+            For each statistic, its values per group for each variable 
+            depending on time, with the groups along the first axis and 
+            the remaining dimensions in their original order.
+            
     Notes
     -----
-    This is a placeholder function for time frequencies that require
-    specific implementations. In a complete implementation, you would
-    add specific logic for each supported time frequency.
+    Standard deviations follow the xarray convention (ddof=0).
     """
-    # This is a placeholder for other time frequencies
-    # In a complete refactoring, you would implement specific functions for each
-    return obj.groupby(time_freq)[statistic](dim=date_key)
+    group_codes, partials = _xarray_partial_aggregates(obj, date_key, codes, n_workers)
+    climat_vals = {stat: {var_name: finalise_partial_aggregates(var_partials, stat, 
+                                                                ddof=0)
+                          for var_name, var_partials in partials.items()}
+                   for stat in statistics}
+    
+    return group_codes, climat_vals
 
 
-def _format_xarray_time_dimension(obj_climat, 
-                                time_freq: str, 
-                                keep_std_dates: bool, 
-                                season_months: list[int] | None, 
-                                freq_abbr: str, 
-                                latest_year: int, 
-                                date_key: str):
-    """Format the time dimension for xarray objects."""
-    if time_freq in TIME_FREQUENCIES_COMPLETE[2:]:
-        # Get the analogous dimension of 'time', usually label 'group'
-        occ_time_name_temp = find_dt_key(obj_climat)
-        
-        if keep_std_dates:                          
-            climat_dates = pd.date_range(f"{latest_year}-1-1 0:00",
-                                         f"{latest_year}-12-31 23:00",
-                                         freq=freq_abbr)
-            occ_time_name = date_key 
-          
-        else:
-            climat_dates = obj_climat[occ_time_name_temp].values
-            lcd = len(climat_dates)
+def _xarray_partial_aggregates(obj, 
+                               date_key: str, 
+                               codes: np.ndarray,
+                               n_workers: int | None = None
+                               ) -> tuple[np.ndarray | None, 
+                                          dict[str, dict[str, np.ndarray]]]:
+    """
+    Reduce the time dimension of an xarray object into per-group 
+    partial aggregates.
+    
+    Each time chunk is reduced into partial aggregates (count, sum, mean, 
+    sum of squared deviations, min and max) per group, which are merged
+    with the previous chunks' ones, so memory stays bounded by the chunk size
+    plus the size of the output. Negative codes are left out. 
+    If `n_workers` is greater than one, the variables and grid cells 
+    of each chunk are split among that number of worker processes, 
+    started once for all the chunks.
+    
+    Returns the sorted unique group codes (None if no code is kept)
+    and the partial aggregates of each variable depending on time.
+    """
+    time_chunks = obj.chunksizes.get(date_key, (obj.sizes[date_key],))
+    chunk_bounds = np.cumsum((0,) + tuple(time_chunks))
+    
+    group_codes = None
+    partials = {}
+    
+    # A single worker pool for all the chunks
+    use_pool = bool(n_workers) and n_workers > 1 and len(time_chunks) > 1
+    if use_pool:
+        pool_context = ProcessPoolExecutor(max_workers=n_workers)
+    else:
+        pool_context = nullcontext()
+    with pool_context as executor:
+        for start, stop in zip(chunk_bounds[:-1], chunk_bounds[1:]):
+            chunk_codes = codes[start:stop]
+            chunk_pos = np.flatnonzero(chunk_codes >= 0)
+            if len(chunk_pos) == 0:
+                continue
             
-            occ_time_name = occ_time_name_temp
+            # Load only the current chunk, with time as the first dimension
+            # and the remaining dimensions flattened
+            obj_chunk = _time_dependent_vars(obj.isel({date_key: slice(start, stop)}), 
+                                             date_key)
+            var_blocks = {var_name: var_chunk.transpose(date_key, ...).values[chunk_pos]
+                          for var_name, var_chunk in obj_chunk.items()}
             
-            if time_freq in TIME_FREQUENCIES_COMPLETE[-2:]:
-                occ_time_name = time_freq[:-2] + "ofyear"    
-                climat_dates = np.arange(lcd) 
+            chunk_group_codes, block_partials = parallel_group_partial_aggregates(
+                [var_vals.reshape(len(chunk_pos), -1) 
+                 for var_vals in var_blocks.values()],
+                chunk_codes[chunk_pos],
+                n_workers,
+                executor=executor
+            )
             
-        # 'time' dimension renaming and its assignment
-        obj_climat = _rename_xarray_dimension(obj_climat, occ_time_name_temp, occ_time_name)
+            for (var_name, var_vals), var_partials in zip(var_blocks.items(), 
+                                                          block_partials):
+                var_partials = {key: part.reshape(part.shape[:1] + var_vals.shape[1:]) 
+                                for key, part in var_partials.items()}
                 
-    elif time_freq == TIME_FREQUENCIES_COMPLETE[1]:  # seasonal
+                if group_codes is None:
+                    partials[var_name] = var_partials
+                else:
+                    _, partials[var_name] = merge_partial_aggregates(group_codes, 
+                                                                     partials[var_name],
+                                                                     chunk_group_codes, 
+                                                                     var_partials)
+            
+            group_codes = (chunk_group_codes if group_codes is None 
+                           else np.union1d(group_codes, chunk_group_codes))
+    
+    return group_codes, partials
+
+
+def _time_dependent_vars(obj, date_key: str) -> dict:
+    """Get the variables of an xarray object that depend on time, by name."""
+    if get_type_str(obj, lowercase=True) == "dataarray":
+        return {obj.name: obj}
+    return {var_name: var for var_name, var in obj.data_vars.items() 
+            if date_key in var.dims}
+
+
+def _static_vars(obj: xr.Dataset, date_key: str) -> list[str]:
+    """Get the names of the data variables of a Dataset not depending on time."""
+    return [var_name for var_name, var in obj.data_vars.items() 
+            if date_key not in var.dims]
+
+
+def _build_xarray_output(obj, 
+                         date_key: str, 
+                         climat_vals: dict[str, np.ndarray], 
+                         occ_time_name: str | None, 
+                         climat_dates: np.ndarray | pd.DatetimeIndex | None):
+    """
+    Build the output xarray object from the reduced values.
+    
+    If `occ_time_name` is None, the (single) group dimension is dropped;
+    otherwise, it replaces the time dimension under that name, 
+    with `climat_dates` as its coordinate. Dataset variables that do not
+    depend on time (e.g. orography) are carried over unchanged.
+    """
+    obj_vars = _time_dependent_vars(obj, date_key)
+    non_time_coords = {coord_name: coord for coord_name, coord in obj.coords.items() 
+                       if date_key not in coord.dims}
+    
+    climat_vars = {}
+    for var_name, var_vals in climat_vals.items():
+        var = obj_vars[var_name]
+        other_dims = [dim for dim in var.dims if dim != date_key]
+        if np.issubdtype(var.dtype, np.floating):
+            var_vals = var_vals.astype(var.dtype, copy=False)
+        
+        if occ_time_name is None:
+            climat_vars[var_name] = xr.DataArray(var_vals[0], 
+                                                 dims=other_dims, 
+                                                 attrs=var.attrs)
+        else:
+            climat_vars[var_name] = xr.DataArray(var_vals, 
+                                                 dims=[occ_time_name] + other_dims, 
+                                                 coords={occ_time_name: climat_dates},
+                                                 attrs=var.attrs)
+    
+    if get_type_str(obj, lowercase=True) == "dataarray":
+        obj_climat = climat_vars[obj.name].rename(obj.name)
+    else:
+        obj_climat = xr.Dataset({var_name: climat_vars.get(var_name, var) 
+                                 for var_name, var in obj.data_vars.items()}, 
+                                attrs=obj.attrs)
+        
+    return obj_climat.assign_coords({coord_name: coord 
+                                     for coord_name, coord in non_time_coords.items()
+                                     if set(coord.dims) <= set(obj_climat.dims)})
+
+
+def _format_xarray_time_dimension(obj_climat, 
+                                  time_freq: str, 
+                                  keep_std_dates: bool, 
+                                  season_months: list[int] | None, 
+                                  latest_year: int, 
+                                  date_key: str,
+                                  calendar_index):
+    """
+    Format the (reduced) time coordinate for seasonal and yearly 
+    xarray climatologies.
+    """
+    if time_freq == "seasonal":
         if keep_std_dates:
-            seas_end_dayofmonth = calendar.monthcalendar(latest_year, season_months[-1])[-1][-1]
+            seas_end_dayofmonth = calendar.monthrange(latest_year, 
+                                                      season_months[-1])[-1]
             climat_dates = pd.Timestamp(latest_year, season_months[-1], seas_end_dayofmonth)
             occ_time_name = date_key
         else:
             occ_time_name = time_freq[:-2]
             climat_dates = "".join([MONTH_NUMBER_DICT[m] for m in season_months])
+            
+    elif time_freq == "yearly":
+        climat_dates = pd.Timestamp(int(calendar_index.year.max()), 12, 31)
+        occ_time_name = date_key
     
-    # Update the time array
+    # Update the time coordinate
     obj_climat = obj_climat.assign_coords({occ_time_name: climat_dates})
     
     return obj_climat
 
 
-def _rename_xarray_dimension(obj_climat, occ_time_name_temp: str, occ_time_name: str):
+def _combine_statistics(climat_objs: dict, 
+                        statistic: str | list[str], 
+                        output_layout: str, 
+                        obj_type: str,
+                        static_vars: list[str] | None = None):
     """
-    Rename dimension in xarray objects.
+    Lay out the climatologies of several statistics into a single object.
     
-    This function attempts to rename a dimension in an xarray object using
-    multiple approaches to handle different xarray structures and versions.
+    A single statistic given as a string is returned as is. Dataset 
+    variables not depending on time (`static_vars`) are kept once, unchanged.
+    """
+    if isinstance(statistic, str):
+        return climat_objs[statistic]
+    elif obj_type == "dataframe":
+        return _combine_dataframe_statistics(climat_objs, output_layout)
+    else:
+        return _combine_xarray_statistics(climat_objs, output_layout, static_vars)
+
+
+def _combine_dataframe_statistics(climat_objs: dict[str, pd.DataFrame], 
+                                  output_layout: str) -> pd.DataFrame:
+    """
+    Combine DataFrame climatologies of several statistics.
+    
+    The wide layout has a '<column>_<statistic>' column per value column 
+    and statistic; the long one stacks the statistics row-wise, 
+    labelled in a 'statistic' column next to the dates.
+    """
+    climat_frames = list(climat_objs.values())
+    
+    if output_layout == "wide":
+        value_cols = climat_frames[0].columns[1:]
+        return pd.concat([climat_frames[0].iloc[:, :1]] 
+                         + [climat_objs[stat][col].rename(f"{col}_{stat}") 
+                            for col in value_cols for stat in climat_objs], 
+                         axis=1)
+    else:
+        for stat, climat_df in climat_objs.items():
+            climat_df.insert(1, "statistic", stat)
+        return pd.concat(climat_frames, ignore_index=True)
+
+
+def _combine_xarray_statistics(climat_objs: dict, 
+                               output_layout: str, 
+                               static_vars: list[str] | None = None):
+    """
+    Combine xarray climatologies of several statistics.
+    
+    The wide layout is a Dataset with a '<variable>_<statistic>' variable
+    per variable and statistic; the long one concatenates the statistics
+    along a new leading 'statistic' dimension. Variables in `static_vars`
+    are neither suffixed nor concatenated.
+    """
+    static_vars = static_vars or []
+    if output_layout == "wide":
+        first_obj = next(iter(climat_objs.values()))
+        if get_type_str(first_obj, lowercase=True) == "dataarray":
+            return xr.Dataset({(stat if climat_da.name is None 
+                                else f"{climat_da.name}_{stat}"): climat_da 
+                               for stat, climat_da in climat_objs.items()},
+                              attrs=first_obj.attrs)
+        climat_vars = {}
+        for var_name in first_obj.data_vars:
+            if var_name in static_vars:
+                climat_vars[var_name] = first_obj[var_name]
+            else:
+                climat_vars.update({f"{var_name}_{stat}": climat_objs[stat][var_name] 
+                                    for stat in climat_objs})
+        return xr.Dataset(climat_vars, attrs=first_obj.attrs)
+    else:
+        concat_kwargs = {}
+        if static_vars:
+            first_obj = next(iter(climat_objs.values()))
+            concat_kwargs["data_vars"] = [var_name for var_name in first_obj.data_vars
+                                          if var_name not in static_vars]
+        return xr.concat(list(climat_objs.values()), 
+                         dim=pd.Index(list(climat_objs), name="statistic"),
+                         **concat_kwargs)
+
+
+# Incremental climatologies #
+#---------------------------#
+
+class ClimatologyAccumulator:
+    """
+    Incremental climatology over calendar keys (month, day or hour of year).
+    
+    Holds mergeable partial aggregates per calendar key (count, sum, 
+    mean and sum of squared deviations updated à la Welford/Chan, min and max),
+    so that a climatology can be updated with new data at a cost proportional
+    to the new data only, instead of recomputing it over the whole archive.
     
     Parameters
     ----------
-    obj_climat : xarray.Dataset | xarray.DataArray
-        The xarray object whose dimension needs to be renamed.
-    occ_time_name_temp : str
-        Current (temporary) name of the time dimension.
-    occ_time_name : str
-        Desired new name for the time dimension.
+    time_freq : {"monthly", "daily", "hourly"}
+        Time frequency of the climatology.
         
-    Returns
-    -------
-    xarray.Dataset | xarray.DataArray
-        The xarray object with renamed dimension.
+    Attributes
+    ----------
+    time_freq : str
+        Time frequency of the climatology.
+    obj_type : str | None
+        Type of the objects accumulated so far ('dataframe', 'dataset' or 
+        'dataarray'), None until the first update.
+    date_key : str | None
+        Name of the date column or time dimension.
+    group_codes : numpy.ndarray | None
+        Sorted calendar codes of the keys accumulated so far.
+    years : numpy.ndarray
+        Years covered by the accumulated data.
         
+    Examples
+    --------
+    >>> acc = ClimatologyAccumulator("daily")
+    >>> acc.update(archive_df).update(new_month_df)
+    >>> climat_df = acc.result("mean")
+    >>> acc.save("t2m_daily_climat.npz")
+    >>> acc = ClimatologyAccumulator.load("t2m_daily_climat.npz")
+    >>> acc = ClimatologyAccumulator.from_file("station_archive.parquet", "daily")
+    
     Notes
     -----
-    The function uses multiple fallback approaches:
-    1. First tries rename_dims() and rename()
-    2. If that fails, tries swap_dims() twice
-    3. Silently continues if all approaches fail
-    
-    This robust approach handles different xarray versions and object states.
-    """
-    try:
-        # Rename the analogous dimension of 'time' on dimension list
-        obj_climat = obj_climat.rename_dims({occ_time_name_temp: occ_time_name})
-    except:
-        # Rename the analogous dimension name of 'time' to standard
-        obj_climat = obj_climat.rename({occ_time_name_temp: occ_time_name})
-        
-    try:
-        # Rename the analogous dimension of 'time' on dimension list
-        obj_climat = obj_climat.swap_dims({occ_time_name_temp: occ_time_name})
-    except:
-        try:
-            # Rename the analogous dimension name of 'time' to standard
-            obj_climat = obj_climat.swap_dims({occ_time_name_temp: occ_time_name})
-        except:
-            pass
+    The result of accumulating several objects equals that of 
+    `climat_periodic_statistics` on their concatenation along time 
+    (for the same time frequency), including the ddof convention of each
+    object type (1 for pandas, 0 for xarray).
+    """
     
-    return obj_climat
+    def __init__(self, time_freq: str):
+        if time_freq not in CALENDAR_CODE_FACTORS:
+            format_args_accum = ("time-frequency", time_freq, 
+                                 list(CALENDAR_CODE_FACTORS))
+            raise ValueError(format_string(UNSUPPORTED_OPTION_ERROR_TEMPLATE, 
+                                           format_args_accum))
+        
+        self.time_freq = time_freq
+        self.obj_type = None
+        self.date_key = None
+        self.group_codes = None
+        self.years = np.array([], dtype=int)
+        self._partials = {}
+        self._template = None
+        
+    def update(self, obj, n_workers: int | None = None):
+        """
+        Accumulate new data.
+        
+        Parameters
+        ----------
+        obj : pandas.DataFrame | xarray.Dataset | xarray.DataArray
+            New data, with the same columns or variables as the data
+            accumulated so far. Dask-backed xarray objects are reduced
+            chunk by chunk along time.
+        n_workers : int | None
+            Number of worker processes among which the reduction is split,
+            as in `climat_periodic_statistics`. 
+            Default is None (serial execution).
+            
+        Returns
+        -------
+        ClimatologyAccumulator
+            The accumulator itself, updated in place.
+        """
+        obj_type = get_type_str(obj, lowercase=True)
+        date_key = _get_time_dimension(obj, obj_type)
+        calendar_index = get_calendar_index(obj[date_key])
+        codes = calendar_index.codes(self.time_freq)
+        if len(codes) == 0:
+            return self
+        
+        if obj_type == "dataframe":
+            template = list(obj.columns)
+            sort_order, _, _ = calendar_index.group_offsets(self.time_freq)
+            data_vals = obj.iloc[:, 1:].to_numpy(dtype=np.float64)
+            group_codes, [df_partials] = parallel_group_partial_aggregates(
+                [data_vals], codes, n_workers, sort_order=sort_order
+            )
+            partials = {col: {key: part[:, col_idx] 
+                              for key, part in df_partials.items()}
+                        for col_idx, col in enumerate(obj.columns[1:])}
+        else:
+            template = obj.isel({date_key: slice(0, 0)})
+            group_codes, partials = _xarray_partial_aggregates(obj, date_key, 
+                                                               codes, n_workers)
+        
+        self._merge_state(obj_type, date_key, template, group_codes, partials, 
+                          np.unique(calendar_index.year).astype(int))
+        return self
+    
+    def merge(self, other: "ClimatologyAccumulator"):
+        """
+        Merge the state of another accumulator into this one.
+        
+        Parameters
+        ----------
+        other : ClimatologyAccumulator
+            Accumulator of the same time frequency and object layout, 
+            e.g. built over another period or by another process.
+            
+        Returns
+        -------
+        ClimatologyAccumulator
+            The accumulator itself, updated in place.
+        """
+        if other.time_freq != self.time_freq:
+            raise ValueError("Cannot merge accumulators of different time frequencies "
+                             f"('{self.time_freq}' and '{other.time_freq}').")
+        
+        if other.group_codes is not None:
+            self._merge_state(other.obj_type, other.date_key, other._template, 
+                              other.group_codes, other._partials, other.years)
+        return self
+    
+    def result(self, 
+               statistic: str | list[str], 
+               keep_std_dates: bool = False, 
+               output_layout: str = "wide"):
+        """
+        Compute the climatology from the accumulated state.
+        
+        Parameters
+        ----------
+        statistic : {"max", "min", "mean", "std", "sum"} | list[str]
+            The statistic to calculate, or a list of them.
+        keep_std_dates : bool
+            If True, calendar keys are labelled with standard dates of the
+            latest (preferably leap) year accumulated; otherwise with 
+            hour, day or month of year indices. Default value is False.
+        output_layout : {"wide", "long"}
+            Layout of the output when a list of statistics is given,
+            as in `climat_periodic_statistics`. Default is "wide".
+            
+        Returns
+        -------
+        obj_climat : pandas.DataFrame | xarray.Dataset | xarray.DataArray
+            Climatology, laid out as by `climat_periodic_statistics`.
+        """
+        _validate_inputs(self.time_freq, None, statistic, output_layout)
+        if self.group_codes is None:
+            raise ValueError("No data has been accumulated yet.")
+        
+        statistics = [statistic] if isinstance(statistic, str) else list(statistic)
+        latest_year = _get_latest_year(self.years)
+        climat_dates = _calendar_key_labels(self.group_codes, self.time_freq, 
+                                            keep_std_dates, latest_year)
+        
+        if self.obj_type == "dataframe":
+            value_cols = self._template[1:]
+            climat_obj_cols = [self.date_key] + [col+"_climat" for col in value_cols]
+            if not keep_std_dates:
+                climat_obj_cols[0] = CALENDAR_KEY_NAMES[self.time_freq]
+            climat_objs = {}
+            for stat in statistics:
+                climat_vals = np.column_stack([
+                    finalise_partial_aggregates(self._partials[col], stat)
+                    for col in value_cols
+                ])
+                climat_objs[stat] = _format_dataframe_output(climat_vals, 
+                                                             climat_dates, 
+                                                             climat_obj_cols)
+        else:
+            if keep_std_dates:
+                occ_time_name = self.date_key
+            else:
+                occ_time_name = CALENDAR_KEY_NAMES[self.time_freq]
+            climat_objs = {}
+            for stat in statistics:
+                climat_vals = {var_name: finalise_partial_aggregates(var_partials, 
+                                                                     stat, ddof=0)
+                               for var_name, var_partials in self._partials.items()}
+                climat_objs[stat] = _build_xarray_output(self._template, self.date_key, 
+                                                         climat_vals, 
+                                                         occ_time_name, climat_dates)
+            
+        if self.obj_type == "dataset":
+            static_vars = _static_vars(self._template, self.date_key)
+        else:
+            static_vars = []
+        return _combine_statistics(climat_objs, statistic, output_layout, 
+                                   self.obj_type, static_vars)
+    
+    def save(self, path: str) -> None:
+        """
+        Save the accumulated state to disk, as a NumPy .npz archive.
+        
+        Parameters
+        ----------
+        path : str
+            Output file path.
+            
+        Notes
+        -----
+        Variable and global attributes of xarray objects are stored as JSON;
+        values that are not JSON-serialisable are stored as strings.
+        """
+        if self.group_codes is None:
+            raise ValueError("No data has been accumulated yet.")
+        
+        var_names = list(self._partials)
+        arrays = dict(group_codes=self.group_codes, years=self.years)
+        for var_idx, var_name in enumerate(var_names):
+            for key in PARTIAL_AGGREGATE_KEYS:
+                arrays[f"partial_{var_idx}_{key}"] = self._partials[var_name][key]
+        
+        meta = dict(time_freq=self.time_freq, 
+                    obj_type=self.obj_type, 
+                    date_key=self.date_key,
+                    var_names=var_names)
+        
+        if self.obj_type == "dataframe":
+            meta["columns"] = self._template
+        else:
+            template_vars = _time_dependent_vars(self._template, self.date_key)
+            meta["sizes"] = dict(self._template.sizes)
+            meta["attrs"] = self._template.attrs
+            meta["var_layout"] = [dict(dims=template_vars[var_name].dims, 
+                                       dtype=template_vars[var_name].dtype.str,
+                                       attrs=template_vars[var_name].attrs) 
+                                  for var_name in var_names]
+            meta["coords"] = []
+            template_coords = self._template.coords.items()
+            for coord_idx, (coord_name, coord) in enumerate(template_coords):
+                if self.date_key not in coord.dims:
+                    meta["coords"].append(dict(name=coord_name, dims=coord.dims))
+                    coord_vals = coord.values
+                    if coord_vals.dtype == object:
+                        coord_vals = coord_vals.astype(str)
+                    arrays[f"coord_{coord_idx}"] = coord_vals
+                    meta["coords"][-1]["key"] = f"coord_{coord_idx}"
+                    
+            # Dataset variables that do not depend on time, kept as they are
+            meta["static_vars"] = []
+            if self.obj_type == "dataset":
+                template_data_vars = self._template.data_vars.items()
+                for static_idx, (var_name, var) in enumerate(template_data_vars):
+                    if var_name not in template_vars:
+                        meta["static_vars"].append(dict(name=var_name, 
+                                                        dims=var.dims, 
+                                                        attrs=var.attrs,
+                                                        key=f"static_{static_idx}"))
+                        arrays[f"static_{static_idx}"] = var.values
+        
+        arrays["meta"] = np.array(json.dumps(meta, default=_json_default))
+        np.savez(path, **arrays)
+        
+    @classmethod
+    def from_file(cls,
+                  file_path: str,
+                  time_freq: str,
+                  columns: list[str] | None = None,
+                  batch_size: int = 1_000_000,
+                  file_format: str | None = None,
+                  dayfirst: bool = False,
+                  yearfirst: bool = False,
+                  **read_kwargs) -> "ClimatologyAccumulator":
+        """
+        Accumulate a CSV or Parquet table file read in batches of rows, 
+        so that climatologies of files larger than memory can be computed.
+        
+        Parameters
+        ----------
+        file_path : str
+            Path to the table file, with a date column.
+        time_freq : {"monthly", "daily", "hourly"}
+            Time frequency of the climatology.
+        columns : list[str] | None, optional
+            Subset of columns to accumulate (the date column is always read).
+            Default is None, taking every numeric column.
+        batch_size : int, optional
+            Maximum number of rows read at once. Defaults to 1 000 000.
+        file_format : {"csv", "parquet"} | None, optional
+            Format of the file. Defaults to None, inferring it from the 
+            file extension. Parquet files require 'pyarrow'.
+        dayfirst : bool, default False
+            Whether to parse ambiguous date strings with the day first.
+        yearfirst : bool, default False
+            Whether to parse ambiguous date strings with the year first.
+        **read_kwargs
+            Additional keyword arguments for `pandas.read_csv` (CSV files only).
+            
+        Returns
+        -------
+        ClimatologyAccumulator
+            Accumulator over the whole file, whose `result` is the same as
+            `climat_periodic_statistics` on the file loaded at once.
+        """
+        accum = cls(time_freq)
+        
+        file_cols = get_table_columns(file_path, file_format, **read_kwargs)
+        date_key = find_dt_key(pd.DataFrame(columns=file_cols))
+        if columns is None:
+            read_cols = None
+        else:
+            missing_cols = [col for col in columns if col not in file_cols]
+            if missing_cols:
+                raise ValueError(f"Columns not found in the file: {missing_cols}.")
+            read_cols = [date_key, *[col for col in columns if col != date_key]]
+        
+        value_cols = None
+        for batch in iter_table_batches(file_path, batch_size, read_cols, file_format, 
+                                        **read_kwargs):
+            # Numeric columns, as found in the first batch
+            if value_cols is None:
+                value_cols = [col for col in batch.columns 
+                              if col != date_key 
+                              and pd.api.types.is_numeric_dtype(batch[col])]
+            
+            dates = batch[date_key]
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                dates = parse_dt_string(dates, 
+                                        module="pandas", 
+                                        dayfirst=dayfirst, 
+                                        yearfirst=yearfirst)
+            batch = pd.DataFrame({date_key: dates, 
+                                  **{col: batch[col] for col in value_cols}})
+            accum.update(batch[batch[date_key].notna()])
+            
+        return accum
+    
+    @classmethod
+    def load(cls, path: str) -> "ClimatologyAccumulator":
+        """
+        Load an accumulator saved with `save`.
+        
+        Parameters
+        ----------
+        path : str
+            Path to the .npz archive.
+            
+        Returns
+        -------
+        ClimatologyAccumulator
+            Accumulator with the restored state, ready to be updated further.
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(archive["meta"].item())
+            accum = cls(meta["time_freq"])
+            accum.obj_type = meta["obj_type"]
+            accum.date_key = meta["date_key"]
+            accum.group_codes = archive["group_codes"]
+            accum.years = archive["years"]
+            accum._partials = {var_name: {key: archive[f"partial_{var_idx}_{key}"] 
+                                          for key in PARTIAL_AGGREGATE_KEYS}
+                               for var_idx, var_name in enumerate(meta["var_names"])}
+            
+            if accum.obj_type == "dataframe":
+                accum._template = meta["columns"]
+            else:
+                sizes = meta["sizes"]
+                template_vars = {}
+                for var_name, layout in zip(meta["var_names"], meta["var_layout"]):
+                    var_vals = np.empty([sizes[dim] for dim in layout["dims"]], 
+                                        dtype=layout["dtype"])
+                    template_vars[var_name] = xr.DataArray(var_vals,
+                                                           dims=layout["dims"],
+                                                           attrs=layout["attrs"])
+                coords = {coord["name"]: (coord["dims"], archive[coord["key"]]) 
+                          for coord in meta["coords"]}
+                
+                if accum.obj_type == "dataarray":
+                    var_name = meta["var_names"][0]
+                    accum._template = (template_vars[var_name].rename(var_name)
+                                       .assign_coords(coords))
+                else:
+                    static_vars = {var["name"]: xr.DataArray(archive[var["key"]], 
+                                                             dims=var["dims"], 
+                                                             attrs=var["attrs"])
+                                   for var in meta.get("static_vars", [])}
+                    accum._template = xr.Dataset(template_vars | static_vars, 
+                                                 coords=coords, 
+                                                 attrs=meta["attrs"])
+                    
+        return accum
+    
+    def _merge_state(self, 
+                     obj_type, 
+                     date_key, 
+                     template, 
+                     group_codes, 
+                     partials, 
+                     years) -> None:
+        """Merge partial aggregates into the accumulated state, checking the layout."""
+        if self.group_codes is None:
+            self.obj_type = obj_type
+            self.date_key = date_key
+            self._template = template
+            self.group_codes = group_codes
+            self._partials = dict(partials)
+        else:
+            if obj_type != self.obj_type or list(partials) != list(self._partials):
+                raise ValueError("Cannot accumulate data with a different layout: "
+                                 f"expected a {self.obj_type} "
+                                 f"with {list(self._partials)}, "
+                                 f"got a {obj_type} with {list(partials)}.")
+            
+            for var_name, var_partials in partials.items():
+                _, self._partials[var_name] = merge_partial_aggregates(
+                    self.group_codes, self._partials[var_name], 
+                    group_codes, var_partials
+                )
+            self.group_codes = np.union1d(self.group_codes, group_codes)
+            
+        self.years = np.union1d(self.years, years).astype(int)
+        
+
+def _json_default(value):
+    """Serialise NumPy values and other non-JSON types found in metadata."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
 
 
 #--------------------------#
@@ -554,11 +1310,15 @@ UNSUPPORTED_OPTION_ERROR_TEMPLATE = "Unsupported {} '{}'. Options are {}."
 SEASON_MONTH_FMT_ERROR_TEMPLATE = """Parameter 'season_months' must contain exactly \
 3 integers representing months. For example: [12, 1, 2]."""
 
-# Date and time format strings #
-DAYTIME_FMT_STR = BASIC_TIME_FORMAT_STRS["D"]
-
 # Statistics #
 STATISTICS = ["max", "min", "sum", "mean", "std"]
 
-# Time frequency abbreviations #
-FREQ_ABBRS = ["Y", "S", "M", "D", "H"]
+# Output layouts for several statistics #
+OUTPUT_LAYOUTS = ["wide", "long"]
+
+# Calendar key names for non-standard dates #
+CALENDAR_KEY_NAMES = {
+    "monthly": "month_of_year",
+    "daily": "day_of_year",
+    "hourly": "hour_of_year"
+}
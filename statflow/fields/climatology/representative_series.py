@@ -14,7 +14,11 @@ import pandas as pd
 
 from paramlib.global_parameters import COMMON_DELIMITER_LIST
 from statflow.core.interpolation_methods import polynomial_fitting
-from statflow.core.time_series import periodic_statistics
+from statflow.utils.helpers import (
+    YEAR_CODE_FACTOR,
+    get_calendar_index,
+    group_partial_aggregates
+)
 
 #-------------------------#
 # Define custom functions #
@@ -131,30 +135,30 @@ def calculate_HDY(hourly_df: pd.DataFrame,
     # Initialise the HDY DataFrame to store results
     hdy_df = pd.DataFrame(columns=varlist)
 
-    # Extract unique years and months
-    hist_years = pd.unique(hourly_df.date.dt.year)
-    months = pd.unique(hourly_df.date.dt.month)
+    # Decode the dates once, then extract unique months
+    calendar_index = get_calendar_index(hourly_df.date)
+    months = pd.unique(calendar_index.month)
+    
+    # Daily keys (year, month and day) of each record
+    day_codes = calendar_index.codes("daily", include_year=True)
+    primary_vals = (hourly_df.filter(items=varlist_primary[1:])
+                    .to_numpy(dtype=np.float64))
 
     # List to store selected years for each month
     hdy_years = []
 
     for m in months:
-        try:
-            # Filter data for the current month and calculate monthly statkit
-            hdata_MONTH = hourly_df[hourly_df.date.dt.month == m].filter(items=varlist_primary).reset_index(drop=drop_new_idx_col)
-            hdata_MONTH_rank_phi = hdata_MONTH.copy()
-            
-            # Step a: Calculate daily means for the primary variables
-            hdata_MONTH_dm_bymonth = periodic_statistics(hourly_df[hourly_df.date.dt.month == m], varlist_primary, 'day', 'mean')
-            
-            
-
-        except ValueError as e:
-            print(f"Error in periodic_statistics for month {m}: {e}")
-            continue  # Skip the current month if there's an error
+        month_pos = np.flatnonzero(calendar_index.month == m)
+        
+        # Step a: Calculate daily means for the primary variables
+        day_codes_month, partials = group_partial_aggregates(primary_vals[month_pos], 
+                                                             day_codes[month_pos])
+        hdata_MONTH_dm_bymonth = pd.DataFrame(partials["mean"], 
+                                              columns=varlist_primary[1:])
+        day_years = day_codes_month // YEAR_CODE_FACTOR
 
-        # Get unique days for the current month
-        no_of_days = len(pd.unique(hdata_MONTH_rank_phi.date.dt.day))
+        # Get the number of days for the current month (all years)
+        no_of_days = len(day_codes_month)
 
         # Step a: Calculate rankings for each day by each primary variable
         dict_rank = {}
@@ -168,18 +172,20 @@ def calculate_HDY(hourly_df: pd.DataFrame,
             # Step b: Calculate cumulative probabilities (phi)
             phi = (var_rank - 0.5) / no_of_days
             dict_phi[var] = phi
-
-            # Store calculated phi values
-            hdata_MONTH_rank_phi[var] = phi
         
-        # Step c: Group data by year and calculate year-specific ranks
+        # Step c: Group data by year and compare each year's cumulative
+        # distribution with the long-term one, at the same daily values
         dict_rank_per_year = {}
-        for year in hist_years:
-            year_data = hdata_MONTH_rank_phi[hdata_MONTH_rank_phi.date.dt.year == year]
-            dict_rank_per_year[year] = {
-                var: np.sum(np.abs(year_data[var] - dict_phi[var]))
-                for var in varlist_primary[1:]
-            }
+        for year in np.unique(day_years):
+            year_mask = day_years == year
+            dict_rank_per_year[year] = {}
+            
+            for var in varlist_primary[1:]:
+                year_vals = hdata_MONTH_dm_bymonth[var].to_numpy()[year_mask]
+                year_rank = np.argsort(np.argsort(year_vals)) + 1
+                year_phi = (year_rank - 0.5) / year_mask.sum()
+                dict_rank_per_year[year][var] = np.sum(np.abs(year_phi 
+                                                              - dict_phi[var][year_mask]))
 
         # Step d: Calculate total sum of deviations (Fs_sum) for each year
         Fs_sum = {}
@@ -187,13 +193,13 @@ def calculate_HDY(hourly_df: pd.DataFrame,
             Fs_sum[year] = sum(ranks.values())
 
         # Step e: Rank the years based on the Fs_sum and choose the best year for the current month
-        selected_year = min(Fs_sum, key=Fs_sum.get)
+        selected_year = int(min(Fs_sum, key=Fs_sum.get))
         hdy_years.append(selected_year)
 
         # Extract the hourly data for the selected year and append it to the HDY DataFrame
         hourly_data_sel = \
-        hourly_df[(hourly_df.date.dt.year == selected_year) 
-                  & (hourly_df.date.dt.month == m)].filter(items=varlist)\
+        hourly_df.iloc[month_pos[calendar_index.year[month_pos] == selected_year]]\
+                 .filter(items=varlist)\
                  .reset_index(drop=drop_new_idx_col)
         hdy_df = pd.concat([hdy_df, hourly_data_sel], axis=0)
 
@@ -323,21 +329,28 @@ def hdy_interpolation(hdy_df: pd.DataFrame,
     if "ws10" in varlist_to_interpolate:
         varlist_to_interpolate.remove("ws10")
 
+    # Decode the dates once
+    calendar_index = get_calendar_index(hdy_interp.date)
+    hdy_months = pd.unique(calendar_index.month)
+
     for i in range(len(hdy_years) - 1):
         # Extract time slices for interpolation between consecutive months
-        days_slice_prev = hdy_interp[(hdy_interp.date.dt.year == hdy_years[i]) &
-                                     (hdy_interp.date.dt.month == hdy_interp.date.dt.month[i])]
-
-        days_slice_next = hdy_interp[(hdy_interp.date.dt.year == hdy_years[i + 1]) &
-                                     (hdy_interp.date.dt.month == hdy_interp.date.dt.month[i + 1])]
+        prev_mask = ((calendar_index.year == hdy_years[i]) 
+                     & (calendar_index.month == hdy_months[i]))
+        next_mask = ((calendar_index.year == hdy_years[i + 1]) 
+                     & (calendar_index.month == hdy_months[i + 1]))
 
         # Handle time ranges as integers (hours), split the input range strings
         pml1, pml2 = map(int, previous_month_last_time_range.split(SPLIT_DELIM))
         nmf1, nmf2 = map(int, next_month_first_time_range.split(SPLIT_DELIM))
 
         # Extract the time slices based on the provided ranges
-        df_slice1 = days_slice_prev[(days_slice_prev.date.dt.hour >= pml1) & (days_slice_prev.date.dt.hour <= pml2)]
-        df_slice2 = days_slice_next[(days_slice_next.date.dt.hour >= nmf1) & (days_slice_next.date.dt.hour <= nmf2)]
+        df_slice1 = hdy_interp[prev_mask 
+                               & (calendar_index.hour >= pml1) 
+                               & (calendar_index.hour <= pml2)]
+        df_slice2 = hdy_interp[next_mask 
+                               & (calendar_index.hour >= nmf1) 
+                               & (calendar_index.hour <= nmf2)]
 
         # Concatenate and reset indices for interpolation
         df_slice_to_fit = pd.concat([df_slice1, df_slice2]).reset_index(drop=drop_date_idx_col)
@@ -21,8 +21,8 @@ xarray Datasets.
 # Import modules #
 #----------------#
 
+import numpy as np
 import pandas as pd
-import xarray as xr
 
 #------------------------#
 # Import project modules #
@@ -32,6 +32,7 @@ from filewise.general.introspection_utils import get_type_str
 from pygenutils.strings.text_formatters import format_string, print_format_string
 from pygenutils.time_handling.date_and_time_utils import find_dt_key
 from statflow.fields.climatology.periodic_climat_stats import climat_periodic_statistics
+from statflow.utils.helpers import CALENDAR_CODE_FACTORS, get_calendar_index
 
 #------------------#
 # Define functions #
@@ -40,29 +41,6 @@ from statflow.fields.climatology.periodic_climat_stats import climat_periodic_st
 # Internal functions #
 #--------------------#
 
-def _unique_sorted(items):
-    """
-    Returns a sorted list of unique items.
-    
-    Parameters
-    ----------
-    items : list
-        List of items to deduplicate and sort.
-        
-    Returns
-    -------
-    list
-        Sorted list of unique items.
-        
-    Examples
-    --------
-    >>> _unique_sorted([3, 1, 4, 1, 5, 9, 2, 6, 5])
-    [1, 2, 3, 4, 5, 6, 9]
-    >>> _unique_sorted(['c', 'a', 'b', 'a'])
-    ['a', 'b', 'c']
-    """
-    return sorted(set(items))
-
 def _validate_inputs(delta_type, preference, delta_value, statistic=None):
     """Validate input parameters."""
     if delta_type not in DELTA_TYPES:
@@ -184,7 +162,8 @@ def _rename_xarray_dimension(obj, old_dim, new_dim):
 
 def _calculate_deltas(observed_series, reanalysis_series, time_freq, statistic, 
                      keep_std_dates, drop_date_idx_col, season_months, delta_type, 
-                     preference, obj_type_observed, obj_type_reanalysis, date_key):
+                     preference, obj_type_observed, obj_type_reanalysis, date_key,
+                     n_workers=None):
     """Calculate deltas between observed and reanalysis series."""
     # Calculate statistical climatologies
     format_args_delta3 = (
@@ -201,7 +180,8 @@ def _calculate_deltas(observed_series, reanalysis_series, time_freq, statistic,
                                             time_freq,
                                             keep_std_dates,
                                             drop_date_idx_col,
-                                            season_months)
+                                            season_months,
+                                            n_workers=n_workers)
     
     format_args_delta4 = (
         "Calculating reanalysis climatologies...",
@@ -217,7 +197,8 @@ def _calculate_deltas(observed_series, reanalysis_series, time_freq, statistic,
                                              time_freq,
                                              keep_std_dates,
                                              drop_date_idx_col,
-                                             season_months)
+                                             season_months,
+                                             n_workers=n_workers)
     
     # Calculate deltas
     if ((obj_type_observed, obj_type_reanalysis) == ("dataframe", "dataframe")):
@@ -278,17 +259,9 @@ def _apply_deltas(delta_obj, delta_cols, time_freq, delta_type, preference,
                  obj_type_observed, obj_type_reanalysis, date_key, delta_format, 
                  season_months, observed_series, reanalysis_series):
     """Apply deltas to the chosen series."""
-    # Extract time components
-    months_delta = _unique_sorted(delta_obj[date_key].dt.month)
-    days_delta = _unique_sorted(delta_obj[date_key].dt.day)
-    hours_delta = _unique_sorted(delta_obj[date_key].dt.hour)
-    
-    # Determine frequency abbreviation
-    freq_abbr = _get_frequency_abbreviation(time_freq, delta_obj, date_key, 
-                                           obj_type_observed, obj_type_reanalysis)
-    
-    # Create a copy of the object to be corrected
-    obj_aux = reanalysis_series.copy() if preference == "observed" else observed_series.copy()
+    # Create a (deep) copy of the object to be corrected, 
+    # so that the input data is not modified in place
+    obj_aux = (reanalysis_series if preference == "observed" else observed_series).copy(deep=True)
     
     # Apply deltas based on time frequency
     if time_freq == "seasonal":
@@ -296,227 +269,146 @@ def _apply_deltas(delta_obj, delta_cols, time_freq, delta_type, preference,
                                         obj_type_observed, obj_type_reanalysis, 
                                         date_key, delta_format, season_months)
     
-    elif time_freq == "monthly":
-        obj_aux = _apply_monthly_deltas(obj_aux, delta_obj, delta_cols, delta_type, 
-                                       obj_type_observed, obj_type_reanalysis, 
-                                       date_key, delta_format, months_delta)
-    
-    elif time_freq == "daily":
-        obj_aux = _apply_daily_deltas(obj_aux, delta_obj, delta_cols, delta_type, 
-                                     obj_type_observed, obj_type_reanalysis, 
-                                     date_key, delta_format, months_delta, days_delta)
-    
-    elif time_freq == "hourly":
-        obj_aux = _apply_hourly_deltas(obj_aux, delta_obj, delta_cols, delta_type, 
-                                      obj_type_observed, obj_type_reanalysis, 
-                                      date_key, delta_format, months_delta, days_delta, 
-                                      hours_delta)
+    elif time_freq in ["monthly", "daily", "hourly"]:
+        obj_aux = _apply_calendar_deltas(obj_aux, delta_obj, delta_cols, delta_type, 
+                                         obj_type_observed, obj_type_reanalysis, 
+                                         date_key, delta_format, time_freq)
     
     return obj_aux.copy()
 
 
-def _get_frequency_abbreviation(time_freq, delta_obj, date_key, obj_type_observed, obj_type_reanalysis):
-    """
-    Get the frequency abbreviation for the time frequency.
-    
-    Parameters
-    ----------
-    time_freq : str
-        Time frequency string ('seasonal', 'monthly', 'daily', 'hourly').
-    delta_obj : pandas.DataFrame | xarray.Dataset | xarray.DataArray
-        Delta object containing time information.
-    date_key : str
-        Name of the date/time column or dimension.
-    obj_type_observed : str
-        Type of the observed series object ('dataframe', 'dataset', 'dataarray').
-    obj_type_reanalysis : str
-        Type of the reanalysis series object ('dataframe', 'dataset', 'dataarray').
-        
-    Returns
-    -------
-    str
-        Frequency abbreviation string for pandas/xarray operations.
-        
-    Notes
-    -----
-    For seasonal frequency, returns the time_freq string itself.
-    For other frequencies, infers the frequency from the time series data.
-    """
-    if time_freq == "seasonal":
-        return time_freq
-    else:
-        if ((obj_type_observed, obj_type_reanalysis) == ("DataFrame", "DataFrame")): 
-            return pd.infer_freq(delta_obj[date_key])
-        elif ((obj_type_observed, obj_type_reanalysis) == ("dataset", "dataset"))\
-            or ((obj_type_observed, obj_type_reanalysis) == ("dataarray", "dataarray")):
-            return xr.infer_freq(delta_obj[date_key])
-
-
 def _apply_seasonal_deltas(obj_aux, delta_obj, delta_cols, delta_type, 
                           obj_type_observed, obj_type_reanalysis, date_key, 
                           delta_format, season_months):
     """Apply deltas for seasonal time frequency."""
-    obj2correct = obj_aux[obj_aux[date_key].dt.month.isin(season_months)]
+    season_mask = np.isin(get_calendar_index(obj_aux[date_key]).month, season_months)
     
     # Get the actual delta value for display
-    if ((obj_type_observed, obj_type_reanalysis) == ("DataFrame", "DataFrame")):
+    if ((obj_type_observed, obj_type_reanalysis) == ("dataframe", "dataframe")):
         actual_delta = delta_obj.iloc[0, 1]  # First row, second column (after date)
     else:
-        actual_delta = float(delta_obj.values[0])
+        actual_delta = _first_delta_value(delta_obj, obj_type_observed)
         
     format_args_delta_seasonal = (
-        "delta",
-        delta_type,
-        f"{delta_type} ({delta_format.format(actual_delta)})"
+        f"Applying {delta_type} delta ({delta_format.format(actual_delta)})...",
+        "seasonal",
+        season_months,
+        "N/P",
+        "N/P"
     )
     print_format_string(DELTA_APPLICATION_INFO_TEMPLATE, format_args_delta_seasonal)
     
-    if ((obj_type_observed, obj_type_reanalysis) == ("DataFrame", "DataFrame")):    
+    if ((obj_type_observed, obj_type_reanalysis) == ("dataframe", "dataframe")):
+        rows = obj_aux.index[season_mask]
         if delta_type == "absolute":    
-            obj_aux.loc[obj2correct.index, delta_cols]\
-            += delta_obj.loc[:, delta_cols].values
+            obj_aux.loc[rows, delta_cols] += delta_obj.loc[:, delta_cols].values
         else:
-            obj_aux.loc[obj2correct.index, delta_cols]\
-            *= delta_obj.loc[:, delta_cols].values
+            obj_aux.loc[rows, delta_cols] *= delta_obj.loc[:, delta_cols].values
             
     elif ((obj_type_observed, obj_type_reanalysis) == ("dataset", "dataset"))\
         or ((obj_type_observed, obj_type_reanalysis) == ("dataarray", "dataarray")):
+        season_sel = {date_key: np.flatnonzero(season_mask)}
+        delta_vals = delta_obj.drop_vars(date_key, errors="ignore")
         if delta_type == "absolute":
-            obj_aux.loc[obj2correct.time] += delta_obj.values
+            obj_aux[season_sel] = obj_aux[season_sel] + delta_vals
         else:
-            obj_aux.loc[obj2correct.time] *= delta_obj.values
+            obj_aux[season_sel] = obj_aux[season_sel] * delta_vals
     
     return obj_aux
 
 
-def _apply_monthly_deltas(obj_aux, delta_obj, delta_cols, delta_type, 
-                         obj_type_observed, obj_type_reanalysis, date_key, 
-                         delta_format, months_delta):
-    """Apply deltas for monthly time frequency."""
-    for m in months_delta:            
-        obj2correct = obj_aux[obj_aux[date_key].dt.month==m]
-        obj_delta = delta_obj[delta_obj[date_key].dt.month==m]
+def _first_delta_value(delta_obj, obj_type):
+    """Get the first delta value of an xarray object, for display."""
+    if obj_type == "dataset":
+        delta_obj = next(iter(delta_obj.data_vars.values()))
+    return float(delta_obj.values.flat[0])
+
+
+def _apply_calendar_deltas(obj_aux, delta_obj, delta_cols, delta_type, 
+                           obj_type_observed, obj_type_reanalysis, date_key, 
+                           delta_format, time_freq):
+    """
+    Apply deltas for monthly, daily and hourly time frequencies.
+    
+    Each date of the object to be corrected is matched to its delta
+    through the calendar keys of their (cached) calendar indices,
+    and all deltas are then applied in a single operation,
+    instead of masking the whole object once per month, day and hour.
+    
+    Parameters
+    ----------
+    obj_aux : pandas.DataFrame | xarray.Dataset | xarray.DataArray
+        Object to be corrected.
+    delta_obj : pandas.DataFrame | xarray.Dataset | xarray.DataArray
+        Climatological deltas, with standard dates.
+    delta_cols : list[str] | None
+        Columns to be corrected (DataFrames only).
+    delta_type : {"absolute", "relative"}
+        Whether the deltas are added or multiplied.
+    obj_type_observed : str
+        Type of the observed series object.
+    obj_type_reanalysis : str
+        Type of the reanalysis series object.
+    date_key : str
+        Name of the date/time column or dimension.
+    delta_format : str
+        Format string for displaying delta values.
+    time_freq : {"monthly", "daily", "hourly"}
+        Time frequency of the deltas.
         
-        # Get the actual delta value for display
-        if ((obj_type_observed, obj_type_reanalysis) == ("DataFrame", "DataFrame")):
-            actual_delta = obj_delta.iloc[0, 1]  # First row, second column (after date)
+    Returns
+    -------
+    pandas.DataFrame | xarray.Dataset | xarray.DataArray
+        The corrected object.
+    """
+    aux_codes = get_calendar_index(obj_aux[date_key]).codes(time_freq)
+    delta_codes = get_calendar_index(delta_obj[date_key]).codes(time_freq)
+    
+    # Match each date to be corrected with the position of its delta
+    delta_order = np.argsort(delta_codes, kind="stable")
+    sorted_delta_codes = delta_codes[delta_order]
+    match_pos = np.searchsorted(sorted_delta_codes, aux_codes).clip(max=len(delta_codes) - 1)
+    matched = sorted_delta_codes[match_pos] == aux_codes
+    aux_pos = np.flatnonzero(matched)
+    delta_pos = delta_order[match_pos[matched]]
+    
+    # Report the applied deltas
+    month_factor, day_factor, hour_factor = CALENDAR_CODE_FACTORS[time_freq]
+    is_dataframe = (obj_type_observed, obj_type_reanalysis) == ("dataframe", "dataframe")
+    
+    for pos in np.unique(delta_pos):
+        code = delta_codes[pos]
+        if is_dataframe:
+            actual_delta = delta_obj.iloc[pos, 1]  # Second column (after date)
         else:
-            actual_delta = float(obj_delta.values[0])
+            actual_delta = _first_delta_value(delta_obj[{date_key: pos}], obj_type_observed)
             
-        format_args_delta_monthly = (
-            "delta",
-            delta_type,
-            f"{delta_type} ({delta_format.format(actual_delta)})"
+        format_args_delta_calendar = (
+            f"Applying {delta_type} delta ({delta_format.format(actual_delta)})...",
+            time_freq,
+            code // month_factor,
+            (code % month_factor) // day_factor if day_factor else "N/P",
+            (code % day_factor) // hour_factor if hour_factor else "N/P"
         )
-        print_format_string(DELTA_APPLICATION_INFO_TEMPLATE, format_args_delta_monthly)
-        
-        if ((obj_type_observed, obj_type_reanalysis) == ("DataFrame", "DataFrame")):
-            if delta_type == "absolute":
-                obj_aux.loc[obj2correct.index, delta_cols]\
-                += obj_delta.loc[:, delta_cols].values
-            else:
-                obj_aux.loc[obj2correct.index, delta_cols]\
-                *= obj_delta.loc[:, delta_cols].values
-                
-        elif ((obj_type_observed, obj_type_reanalysis) == ("dataset", "dataset"))\
-            or ((obj_type_observed, obj_type_reanalysis) == ("dataarray", "dataarray")):
-            if delta_type == "absolute":
-                obj_aux.loc[obj2correct.time] += obj_delta.values
-            else:
-                obj_aux.loc[obj2correct.time] *= obj_delta.values
+        print_format_string(DELTA_APPLICATION_INFO_TEMPLATE, format_args_delta_calendar)
     
-    return obj_aux
-
-
-def _apply_daily_deltas(obj_aux, delta_obj, delta_cols, delta_type, 
-                       obj_type_observed, obj_type_reanalysis, date_key, 
-                       delta_format, months_delta, days_delta):
-    """Apply deltas for daily time frequency."""
-    for m in months_delta: 
-        for d in days_delta:
-            obj2correct = obj_aux[(obj_aux[date_key].dt.month==m)&
-                                  (obj_aux[date_key].dt.day==d)]
-            
-            obj_delta = delta_obj[(delta_obj[date_key].dt.month==m)&
-                                  (delta_obj[date_key].dt.day==d)]
+    # Delta application
+    if is_dataframe:
+        rows = obj_aux.index[aux_pos]
+        delta_vals = delta_obj.loc[:, delta_cols].to_numpy()[delta_pos]
+        if delta_type == "absolute":
+            obj_aux.loc[rows, delta_cols] += delta_vals
+        else:
+            obj_aux.loc[rows, delta_cols] *= delta_vals
             
-            # Delta application
-            if len(obj2correct) > 0 and len(obj_delta) > 0:
-                # Get the actual delta value for display
-                if ((obj_type_observed, obj_type_reanalysis) == ("DataFrame", "DataFrame")):
-                    actual_delta = obj_delta.iloc[0, 1]  # First row, second column (after date)
-                else:
-                    actual_delta = float(obj_delta.values[0])
-                    
-                format_args_delta_daily = (
-                    "delta",
-                    delta_type,
-                    f"{delta_type} ({delta_format.format(actual_delta)})"
-                )
-                print_format_string(DELTA_APPLICATION_INFO_TEMPLATE, format_args_delta_daily)
-                
-                if ((obj_type_observed, obj_type_reanalysis) == ("DataFrame", "DataFrame")):
-                    if delta_type == "absolute":
-                        obj_aux.loc[obj2correct.index, delta_cols] \
-                        += obj_delta.loc[:, delta_cols].values
-                    else:
-                        obj_aux.loc[obj2correct.index, delta_cols] \
-                        *= obj_delta.loc[:, delta_cols].values
-                        
-                elif ((obj_type_observed, obj_type_reanalysis) == ("dataset", "dataset"))\
-                    or ((obj_type_observed, obj_type_reanalysis) == ("dataarray", "dataarray")):
-                    if delta_type == "absolute":
-                        obj_aux.loc[obj2correct.time] += obj_delta.values
-                    else:
-                        obj_aux.loc[obj2correct.time] *= obj_delta.values
-    
-    return obj_aux
-
-
-def _apply_hourly_deltas(obj_aux, delta_obj, delta_cols, delta_type, 
-                        obj_type_observed, obj_type_reanalysis, date_key, 
-                        delta_format, months_delta, days_delta, hours_delta):
-    """Apply deltas for hourly time frequency."""
-    for m in months_delta:
-        for d in days_delta:
-            for h in hours_delta:
-                obj2correct = obj_aux[(obj_aux[date_key].dt.month==m)&
-                                      (obj_aux[date_key].dt.day==d)&
-                                      (obj_aux[date_key].dt.hour==h)]
-                                   
-                obj_delta = delta_obj[(delta_obj[date_key].dt.month==m)&
-                                      (delta_obj[date_key].dt.day==d)&
-                                      (delta_obj[date_key].dt.hour==h)]
-               
-                # Delta application
-                if len(obj2correct) > 0 and len(obj_delta) > 0:
-                    # Get the actual delta value for display
-                    if ((obj_type_observed, obj_type_reanalysis) == ("DataFrame", "DataFrame")):
-                        actual_delta = obj_delta.iloc[0, 1]  # First row, second column (after date)
-                    else:
-                        actual_delta = float(obj_delta.values[0])
-                        
-                    format_args_delta_hourly = (
-                        "delta",
-                        delta_type,
-                        f"{delta_type} ({delta_format.format(actual_delta)})"
-                    )
-                    print_format_string(DELTA_APPLICATION_INFO_TEMPLATE, format_args_delta_hourly)
-                    
-                    if ((obj_type_observed, obj_type_reanalysis) == ("DataFrame", "DataFrame")):
-                        if delta_type == "absolute":
-                            obj_aux.loc[obj2correct.index, delta_cols] \
-                            += obj_delta.loc[:, delta_cols].values
-                        else:
-                            obj_aux.loc[obj2correct.index, delta_cols] \
-                            *= obj_delta.loc[:, delta_cols].values
-                            
-                    elif ((obj_type_observed, obj_type_reanalysis) == ("dataset", "dataset"))\
-                        or ((obj_type_observed, obj_type_reanalysis) == ("dataarray", "dataarray")):
-                        if delta_type == "absolute":
-                            obj_aux.loc[obj2correct.time] += obj_delta.values
-                        else:
-                            obj_aux.loc[obj2correct.time] *= obj_delta.values
+    elif ((obj_type_observed, obj_type_reanalysis) == ("dataset", "dataset"))\
+        or ((obj_type_observed, obj_type_reanalysis) == ("dataarray", "dataarray")):
+        aux_sel = {date_key: aux_pos}
+        delta_vals = delta_obj[{date_key: delta_pos}].assign_coords({date_key: obj_aux[date_key].values[aux_pos]})
+        if delta_type == "absolute":
+            obj_aux[aux_sel] = obj_aux[aux_sel] + delta_vals
+        else:
+            obj_aux[aux_sel] = obj_aux[aux_sel] * delta_vals
     
     return obj_aux
 
@@ -533,7 +425,8 @@ def calculate_and_apply_deltas(observed_series,
                                keep_std_dates=True, 
                                drop_date_idx_col=False,
                                season_months=None,
-                               delta_value=2):
+                               delta_value=2,
+                               n_workers=None):
     """
     Function that calculates simple deltas between two objects
     and then applies to any of them.
@@ -590,6 +483,11 @@ def calculate_and_apply_deltas(observed_series,
         If "auto", it uses the best format with 2 significant digits, 
         choosing between scientific notation and floating-point.
         Defaults to 2.
+    n_workers : int, optional
+        Number of worker processes among which the climatology calculations
+        are split by variable and spatial tile, sharing the input through
+        shared memory (see 'climat_periodic_statistics').
+        Defaults to None (serial execution).
     
     Returns
     -------
@@ -621,7 +519,7 @@ def calculate_and_apply_deltas(observed_series,
                                              time_freq, statistic, keep_std_dates, 
                                              drop_date_idx_col, season_months, 
                                              delta_type, preference, obj_type_observed, 
-                                             obj_type_reanalysis, date_key)
+                                             obj_type_reanalysis, date_key, n_workers)
     
     # Apply deltas to the chosen series
     delta_corrected_obj = _apply_deltas(delta_obj, delta_cols, time_freq, 
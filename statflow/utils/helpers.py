@@ -159,29 +159,1265 @@ optimised.
 # Import modules #
 #----------------#
 
-# Standard library imports will go here
-# import os
-# import sys
-# from typing import Union, Optional, Any, Tuple, List, Dict
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from multiprocessing import shared_memory
 
-# Third-party imports will go here
-# import numpy as np
-# import pandas as pd
-# import scipy as sp
-# import xarray as xr
+import numpy as np
+import pandas as pd
 
 #------------------------#
 # Import project modules #
 #------------------------#
 
-# Project-specific imports will go here
-# from filewise.general.introspection_utils import get_caller_args, get_type_str
-# from pygenutils.arrays_and_lists.data_manipulation import flatten_list
-# from pygenutils.strings.text_formatters import format_string
-# from paramlib.global_parameters import BASIC_TIME_FORMAT_STRS
+from paramlib.global_parameters import MONTH_NUMBER_DICT
 
 #------------------#
 # Define functions #
 #------------------#
 
-# Helper functions will be implemented here following the guidelines above
\ No newline at end of file
+# Grouped reductions #
+#--------------------#
+
+def group_partial_aggregates(values: np.ndarray,
+                             codes: np.ndarray,
+                             is_sorted: bool = False,
+                             sort_order: np.ndarray | None = None
+                             ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Reduce an array along its first axis into mergeable per-group partial
+    aggregates, in a single grouping pass.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Data array whose first axis is the one to be grouped
+        (e.g. time for (time, lat, lon) fields or (time, variable) tables).
+        NaN values are skipped.
+    codes : numpy.ndarray
+        One-dimensional integer group label for each position of the first axis.
+    is_sorted : bool, optional
+        Whether `codes` is already non-decreasing, in which case the sorting
+        step is skipped and the data is reduced in place order.
+        Defaults to False.
+    sort_order : numpy.ndarray | None, optional
+        Precomputed stable sorting permutation of `codes`
+        (e.g. from `CalendarIndex.group_offsets`), used instead of sorting again.
+        Defaults to None.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, dict[str, numpy.ndarray]]
+        group_codes : numpy.ndarray
+            Sorted unique group codes.
+        partials : dict[str, numpy.ndarray]
+            Partial aggregates 'count', 'sum', 'mean', 'm2' (sum of squared
+            deviations from the group mean), 'min' and 'max', each one with
+            shape (n_groups, *values.shape[1:]).
+
+    Notes
+    -----
+    Groups are reduced through segment boundaries (`numpy.ufunc.reduceat`),
+    so the cost is a single sort of the group codes (skipped if they are 
+    already in order, e.g. period codes of sorted dates) plus one pass
+    over the data for each aggregate, irrespective of the number of groups.
+    Accumulation is carried out in double precision.
+    """
+    values = np.asarray(values)
+    codes = np.asarray(codes)
+    
+    if len(codes) != len(values):
+        raise ValueError("Group codes and values must have the same length "
+                         f"along the first axis, got {len(codes)} and {len(values)}.")
+    
+    # Sort the data by group code, unless already sorted
+    if not is_sorted and sort_order is None:
+        is_sorted = bool((codes[1:] >= codes[:-1]).all())
+    if not is_sorted:
+        if sort_order is None:
+            sort_order = np.argsort(codes, kind="stable")
+        codes = codes[sort_order]
+        
+    # Segment boundaries
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    lengths = np.diff(np.r_[starts, len(codes)])
+    group_codes = codes[starts]
+    
+    # Reduce each segment along the last, contiguous axis, which is 
+    # considerably faster than along a strided first axis
+    value_shape = values.shape[1:]
+    work = np.ascontiguousarray(values.reshape(len(values), -1).T, dtype=np.float64)
+    if not is_sorted:
+        work = work[:, sort_order]
+    valid = ~np.isnan(work)
+    all_valid = valid.all()
+    
+    count = np.add.reduceat(valid, starts, axis=-1, dtype=np.int64)
+    total = np.add.reduceat(work if all_valid else np.where(valid, work, 0),
+                            starts, axis=-1)
+    
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+        
+    deviations = np.repeat(mean, lengths, axis=-1)
+    np.subtract(work, deviations, out=deviations)
+    if not all_valid:
+        deviations[~valid] = 0
+    np.square(deviations, out=deviations)
+    m2 = np.add.reduceat(deviations, starts, axis=-1)
+    
+    minimum = np.minimum.reduceat(work if all_valid else np.where(valid, work, np.inf),
+                                  starts, axis=-1)
+    maximum = np.maximum.reduceat(work if all_valid else np.where(valid, work, -np.inf),
+                                  starts, axis=-1)
+    empty = count == 0
+    minimum[empty] = np.nan
+    maximum[empty] = np.nan
+    
+    # Back to the (group, *value_shape) layout
+    count, total, mean, m2, minimum, maximum = [
+        np.ascontiguousarray(aggregate.T).reshape(len(starts), *value_shape)
+        for aggregate in [count, total, mean, m2, minimum, maximum]
+    ]
+    partials = dict(count=count, sum=total, mean=mean, m2=m2, min=minimum, max=maximum)
+    return group_codes, partials
+
+
+def merge_partial_aggregates(codes_a: np.ndarray,
+                             partials_a: dict[str, np.ndarray],
+                             codes_b: np.ndarray,
+                             partials_b: dict[str, np.ndarray]
+                             ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Merge two sets of per-group partial aggregates.
+
+    Groups present in both sets are combined with the pairwise update
+    of Chan et al. for the mean and the sum of squared deviations,
+    so the result is the same as reducing the union of the underlying data.
+
+    Parameters
+    ----------
+    codes_a : numpy.ndarray
+        Sorted unique group codes of the first set.
+    partials_a : dict[str, numpy.ndarray]
+        Partial aggregates of the first set, as returned by `group_partial_aggregates`.
+    codes_b : numpy.ndarray
+        Sorted unique group codes of the second set.
+    partials_b : dict[str, numpy.ndarray]
+        Partial aggregates of the second set.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, dict[str, numpy.ndarray]]
+        group_codes : numpy.ndarray
+            Sorted union of the group codes.
+        partials : dict[str, numpy.ndarray]
+            Merged partial aggregates.
+    """
+    group_codes = np.union1d(codes_a, codes_b)
+    pos_a = np.searchsorted(group_codes, codes_a)
+    pos_b = np.searchsorted(group_codes, codes_b)
+    
+    # Start from the first set, scattered onto the union of groups
+    value_shape = partials_a["sum"].shape[1:]
+    partials = _empty_partial_aggregates(len(group_codes), value_shape)
+    for key in PARTIAL_AGGREGATE_KEYS:
+        partials[key][pos_a] = partials_a[key]
+        
+    # Combine the second set into it
+    count_a = partials["count"][pos_b]
+    mean_a = partials["mean"][pos_b]
+    count_b = partials_b["count"]
+    mean_b = partials_b["mean"]
+    count = count_a + count_b
+    
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = np.where((count_a > 0) & (count_b > 0), mean_b - mean_a, 0)
+        mean = np.where(count_a > 0, mean_a + delta * count_b / count, mean_b)
+        m2 = (partials["m2"][pos_b] + partials_b["m2"] 
+              + delta**2 * count_a * count_b / np.maximum(count, 1))
+        
+    partials["count"][pos_b] = count
+    partials["sum"][pos_b] += partials_b["sum"]
+    partials["mean"][pos_b] = mean
+    partials["m2"][pos_b] = m2
+    partials["min"][pos_b] = np.fmin(partials["min"][pos_b], partials_b["min"])
+    partials["max"][pos_b] = np.fmax(partials["max"][pos_b], partials_b["max"])
+    
+    return group_codes, partials
+
+
+def coarsen_partial_aggregates(group_codes: np.ndarray,
+                               partials: dict[str, np.ndarray],
+                               coarse_codes: np.ndarray
+                               ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Merge per-group partial aggregates into coarser groups 
+    (e.g. days into months, or months into years), without revisiting 
+    the underlying data.
+
+    Parameters
+    ----------
+    group_codes : numpy.ndarray
+        Sorted unique codes of the fine groups.
+    partials : dict[str, numpy.ndarray]
+        Partial aggregates of the fine groups, as returned by 
+        `group_partial_aggregates`.
+    coarse_codes : numpy.ndarray
+        Coarse group code of each fine group, which must be non-decreasing
+        along the fine groups (as when truncating sorted dates).
+
+    Returns
+    -------
+    tuple[numpy.ndarray, dict[str, numpy.ndarray]]
+        group_codes : numpy.ndarray
+            Sorted unique coarse group codes.
+        partials : dict[str, numpy.ndarray]
+            Partial aggregates of the coarse groups, the same as those 
+            obtained by grouping the underlying data by the coarse codes.
+    """
+    coarse_codes = np.asarray(coarse_codes)
+    if len(coarse_codes) != len(group_codes):
+        raise ValueError("Coarse codes must be given for each of the "
+                         f"{len(group_codes)} groups, got {len(coarse_codes)}.")
+    if (coarse_codes[1:] < coarse_codes[:-1]).any():
+        raise ValueError("Coarse codes must be non-decreasing along the groups.")
+        
+    starts = np.flatnonzero(np.r_[True, coarse_codes[1:] != coarse_codes[:-1]])
+    lengths = np.diff(np.r_[starts, len(coarse_codes)])
+    
+    count = np.add.reduceat(partials["count"], starts, axis=0)
+    total = np.add.reduceat(partials["sum"], starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+        
+    # Segmented form of the pairwise update: each group contributes its own
+    # sum of squared deviations plus the one of its mean from the coarse mean
+    filled = partials["count"] > 0
+    deviations = np.where(filled, 
+                          partials["mean"] - np.repeat(mean, lengths, axis=0), 
+                          0)
+    m2 = np.add.reduceat(partials["m2"] + partials["count"] * deviations**2, 
+                         starts, axis=0)
+    
+    coarse_partials = dict(count=count, 
+                           sum=total, 
+                           mean=mean, 
+                           m2=m2,
+                           min=np.fmin.reduceat(partials["min"], starts, axis=0),
+                           max=np.fmax.reduceat(partials["max"], starts, axis=0))
+    return coarse_codes[starts], coarse_partials
+
+
+def _empty_partial_aggregates(n_groups: int, 
+                              value_shape: tuple) -> dict[str, np.ndarray]:
+    """Partial aggregates of groups without any data."""
+    shape = (n_groups, *value_shape)
+    return dict(count=np.zeros(shape, dtype=np.int64),
+                sum=np.zeros(shape),
+                mean=np.full(shape, np.nan),
+                m2=np.zeros(shape),
+                min=np.full(shape, np.nan),
+                max=np.full(shape, np.nan))
+
+
+def finalise_partial_aggregates(partials: dict[str, np.ndarray],
+                                statistic: str,
+                                ddof: int = 1) -> np.ndarray:
+    """
+    Turn partial aggregates into the requested statistic.
+
+    Parameters
+    ----------
+    partials : dict[str, numpy.ndarray]
+        Partial aggregates as returned by `group_partial_aggregates`.
+    statistic : {"max", "min", "sum", "mean", "std"}
+        The statistic to derive.
+    ddof : int, optional
+        Delta degrees of freedom for the standard deviation.
+        Defaults to 1, as in pandas.
+
+    Returns
+    -------
+    numpy.ndarray
+        Statistic per group. Groups without valid data yield NaN,
+        except for the sum, which yields zero (pandas and xarray convention).
+    """
+    if statistic in ["mean", "sum", "min", "max"]:
+        return partials[statistic]
+    elif statistic == "std":
+        dof = partials["count"] - ddof
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(dof > 0, np.sqrt(partials["m2"] / dof), np.nan)
+    else:
+        raise ValueError(f"Unsupported statistic '{statistic}'. "
+                         f"Options are {PARTIAL_AGGREGATE_STATISTICS}.")
+
+
+def segment_reduce(values: np.ndarray,
+                   starts: np.ndarray,
+                   statistic: str,
+                   ddof: int = 1) -> np.ndarray:
+    """
+    Reduce contiguous segments of an array along its first axis 
+    into a single statistic.
+
+    Unlike `group_partial_aggregates`, only the aggregates needed 
+    for the requested statistic are computed, and the data is neither 
+    sorted nor copied when it holds no NaN values.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Data array whose first axis is segmented. NaN values are skipped.
+    starts : numpy.ndarray
+        Increasing start position of each segment, the first one being 0;
+        each segment runs until the next start.
+    statistic : {"max", "min", "sum", "mean", "std"}
+        The statistic to compute.
+    ddof : int, optional
+        Delta degrees of freedom for the standard deviation.
+        Defaults to 1, as in pandas.
+
+    Returns
+    -------
+    numpy.ndarray
+        Statistic per segment, in double precision, with shape 
+        (len(starts), *values.shape[1:]). Segments without valid data 
+        yield NaN, except for the sum, which yields zero.
+    """
+    if statistic not in PARTIAL_AGGREGATE_STATISTICS:
+        raise ValueError(f"Unsupported statistic '{statistic}'. "
+                         f"Options are {PARTIAL_AGGREGATE_STATISTICS}.")
+    
+    # Segments are reduced along the last, contiguous axis, which is
+    # considerably faster than along a strided first axis
+    work = np.ascontiguousarray(np.moveaxis(np.asarray(values), 0, -1), 
+                                dtype=np.float64)
+    valid = ~np.isnan(work)
+    all_valid = valid.all()
+    
+    if statistic in ["min", "max"]:
+        # fmin/fmax skip NaNs, yielding NaN only for all-NaN segments
+        reducer = np.fmin if statistic == "min" else np.fmax
+        return np.moveaxis(reducer.reduceat(work, starts, axis=-1), -1, 0)
+    
+    total = np.add.reduceat(work if all_valid else np.where(valid, work, 0),
+                            starts, axis=-1)
+    if statistic == "sum":
+        return np.moveaxis(total, -1, 0)
+    
+    lengths = np.diff(np.r_[starts, work.shape[-1]])
+    if all_valid:
+        count = lengths
+    else:
+        count = np.add.reduceat(valid, starts, axis=-1, dtype=np.int64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+    if statistic == "mean":
+        return np.moveaxis(mean, -1, 0)
+    
+    # Two-pass variance, squaring the deviations in place in a single buffer
+    deviations = np.repeat(mean, lengths, axis=-1)
+    np.subtract(work, deviations, out=deviations)
+    if not all_valid:
+        deviations[~valid] = 0
+    np.square(deviations, out=deviations)
+    m2 = np.add.reduceat(deviations, starts, axis=-1)
+    dof = count - ddof
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.where(dof > 0, np.sqrt(m2 / np.maximum(dof, 1)), np.nan)
+    return np.moveaxis(std, -1, 0)
+
+
+# Parallel grouped reductions #
+#-----------------------------#
+
+def parallel_group_partial_aggregates(blocks: list[np.ndarray],
+                                      codes: np.ndarray,
+                                      n_workers: int | None = None,
+                                      sort_order: np.ndarray | None = None,
+                                      executor: ProcessPoolExecutor | None = None
+                                      ) -> tuple[np.ndarray, 
+                                                 list[dict[str, np.ndarray]]]:
+    """
+    Reduce several two-dimensional blocks into per-group partial aggregates,
+    splitting their columns into tiles over a process pool.
+
+    The blocks (e.g. one per variable, with the flattened spatial
+    dimensions as columns) are copied once into a shared memory buffer,
+    which every worker attaches to by name, so the input data is not
+    pickled per worker. Each worker reduces a contiguous tile of columns,
+    and the tiles are reassembled in column order, so the result is
+    identical to the serial one regardless of the scheduling.
+
+    Parameters
+    ----------
+    blocks : list[numpy.ndarray]
+        Two-dimensional arrays with the grouped axis first, all with
+        the same number of rows.
+    codes : numpy.ndarray
+        One-dimensional integer group label for each row.
+    n_workers : int | None, optional
+        Number of worker processes. If None or 1, the blocks are
+        reduced serially in the current process. Defaults to None.
+    sort_order : numpy.ndarray | None, optional
+        Precomputed stable sorting permutation of `codes`.
+        Defaults to None, sorting the codes unless already in order.
+    executor : concurrent.futures.ProcessPoolExecutor | None, optional
+        Pool of at least `n_workers` processes to run the tiles on, so that 
+        successive calls (e.g. one per time chunk) reuse the same workers.
+        Defaults to None, starting a pool for this call only.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, list[dict[str, numpy.ndarray]]]
+        group_codes : numpy.ndarray
+            Sorted unique group codes.
+        partials : list[dict[str, numpy.ndarray]]
+            Partial aggregates of each block, as returned by
+            `group_partial_aggregates`.
+    """
+    codes = np.asarray(codes)
+    if sort_order is None and (codes[1:] < codes[:-1]).any():
+        sort_order = np.argsort(codes, kind="stable")
+    n_cols = [block.shape[1] for block in blocks]
+    
+    if not n_workers or n_workers <= 1 or sum(n_cols) < 2:
+        results = [group_partial_aggregates(block, codes, sort_order=sort_order) 
+                   for block in blocks]
+        return results[0][0], [block_partials for _, block_partials in results]
+    
+    # Copy the blocks side by side into shared memory
+    dtype = np.result_type(*[block.dtype for block in blocks], np.float32)
+    shape = (len(codes), sum(n_cols))
+    shm_size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+    shm = shared_memory.SharedMemory(create=True, size=shm_size)
+    
+    try:
+        shared_arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        col_bounds = np.r_[0, np.cumsum(n_cols)]
+        for block, start, stop in zip(blocks, col_bounds[:-1], col_bounds[1:]):
+            shared_arr[:, start:stop] = block
+        del shared_arr
+        
+        # One contiguous tile of columns per worker
+        n_tiles = min(n_workers, shape[1])
+        tile_bounds = np.linspace(0, shape[1], n_tiles + 1).astype(int)
+        if executor is None:
+            pool_context = ProcessPoolExecutor(max_workers=n_tiles)
+        else:
+            pool_context = nullcontext(executor)
+        with pool_context as pool:
+            futures = [pool.submit(_tile_partial_aggregates, shm.name, shape, dtype.str,
+                                   codes, sort_order, start, stop)
+                       for start, stop in zip(tile_bounds[:-1], tile_bounds[1:])]
+            tile_results = [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+        
+    # Reassemble the tiles in column order and split them back into blocks
+    group_codes = tile_results[0][0]
+    partials = {key: np.concatenate([tile_partials[key] 
+                                     for _, tile_partials in tile_results], 
+                                    axis=1)
+                for key in PARTIAL_AGGREGATE_KEYS}
+    block_partials = [{key: partials[key][:, start:stop] 
+                       for key in PARTIAL_AGGREGATE_KEYS}
+                      for start, stop in zip(col_bounds[:-1], col_bounds[1:])]
+    
+    return group_codes, block_partials
+
+
+def _tile_partial_aggregates(shm_name: str,
+                             shape: tuple[int, int],
+                             dtype: str,
+                             codes: np.ndarray,
+                             sort_order: np.ndarray | None,
+                             start: int,
+                             stop: int) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Reduce a tile of columns of a shared memory array (worker side)."""
+    shm = _attach_shared_memory(shm_name)
+    try:
+        shared_arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        if sort_order is None:
+            tile = shared_arr[:, start:stop].copy()
+        else:
+            tile = shared_arr[sort_order, start:stop]
+            codes = codes[sort_order]
+        del shared_arr
+    finally:
+        shm.close()
+    return group_partial_aggregates(tile, codes, is_sorted=True)
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing shared memory block without tracking it,
+    since its owner is in charge of unlinking it.
+    
+    Before Python 3.13 attaching always registers the block with the
+    resource tracker. Pool workers (forked, spawned or started by a fork
+    server) share the tracker of the parent process, where the block is
+    already registered, so the registration is left as is: unregistering
+    it would remove the owner's one, and its unlink would then make the
+    tracker fail with a KeyError.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+# Order statistics #
+#------------------#
+
+def batched_quantiles(samples: np.ndarray, quantiles: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolated quantiles of many samples at once, e.g. of the 
+    moving windows of every grid cell, from a single vectorised sort.
+
+    Parameters
+    ----------
+    samples : numpy.ndarray
+        Samples along the last axis, any number of leading (batch) axes. 
+        NaN values are skipped, each sample using its own number of valid 
+        values (all-NaN samples yield NaN).
+    quantiles : numpy.ndarray
+        One-dimensional array of quantiles to compute, between 0 and 1.
+
+    Returns
+    -------
+    numpy.ndarray
+        Quantiles with shape (len(quantiles), *samples.shape[:-1]).
+
+    Notes
+    -----
+    Samples are sorted along contiguous memory in a single call, which 
+    vectorised sorting makes faster than partitioning around several order
+    statistics, and quantiles are interpolated between order statistics 
+    as in `numpy.percentile`'s default method.
+    """
+    n_samples = samples.shape[-1]
+    nan_mask = np.isnan(samples)
+    
+    # A single (vectorised) sort of every batch of samples
+    samples = np.sort(samples, axis=-1)
+    
+    if not nan_mask.any():
+        # Same number of samples everywhere: common order statistics
+        positions = quantiles * (n_samples - 1)
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.minimum(lower + 1, n_samples - 1)
+        
+        weights = (positions - lower).astype(samples.dtype)
+        weights = weights.reshape((-1,) + (1,) * (samples.ndim - 1))
+        lower_vals = np.moveaxis(samples[..., lower], -1, 0)
+        upper_vals = np.moveaxis(samples[..., upper], -1, 0)
+        
+    else:
+        # Order statistics depending on the number of valid samples 
+        # of each cell, NaNs being sorted last
+        n_valid = n_samples - nan_mask.sum(axis=-1, keepdims=True)
+        positions = quantiles.reshape((-1,) + (1,) * samples.ndim) * (n_valid - 1)
+        lower = np.clip(np.floor(positions).astype(np.int64), 0, n_samples - 1)
+        upper = np.clip(lower + 1, 0, np.maximum(n_valid - 1, 0))
+        
+        weights = (positions - lower).astype(samples.dtype)[..., 0]
+        lower_vals = np.stack([np.take_along_axis(samples, lower_q, axis=-1) 
+                               for lower_q in lower])[..., 0]
+        upper_vals = np.stack([np.take_along_axis(samples, upper_q, axis=-1) 
+                               for upper_q in upper])[..., 0]
+        
+    return lower_vals + weights * (upper_vals - lower_vals)
+
+
+# Run-length encoding #
+#---------------------#
+
+def run_length_encode(mask: np.ndarray, 
+                      axis: int = 0) -> tuple[np.ndarray, np.ndarray, 
+                                              np.ndarray, np.ndarray]:
+    """
+    Find the runs of consecutive True values of a boolean array along an axis
+    (e.g. threshold exceedances along time for every grid cell), all at once.
+
+    Parameters
+    ----------
+    mask : numpy.ndarray
+        Boolean array, e.g. of shape (time, lat, lon).
+    axis : int, optional
+        Axis along which runs are found. Default is 0 (time first).
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        cells : numpy.ndarray
+            Flat index of the cell (position over the remaining axes, 
+            in C order) of each run.
+        starts : numpy.ndarray
+            Position along `axis` at which each run starts.
+        lengths : numpy.ndarray
+            Length of each run.
+        counts : numpy.ndarray
+            Number of runs per cell, with the shape of `mask` without `axis`.
+
+    Notes
+    -----
+    Runs are sorted by cell and then by start, and found through the 
+    transitions of the mask padded with False at both ends, in a single 
+    vectorised scan over the data.
+    """
+    mask = np.moveaxis(np.asarray(mask, dtype=bool), axis, -1)
+    cell_shape = mask.shape[:-1]
+    mask_2d = mask.reshape(int(np.prod(cell_shape)), mask.shape[-1])
+    
+    # Transitions (as if padded with False at both ends): 
+    # at run starts and right after run ends
+    transitions = np.empty((mask_2d.shape[0], mask_2d.shape[1] + 1), dtype=bool)
+    transitions[:, 0] = mask_2d[:, 0] if mask_2d.shape[1] else False
+    transitions[:, -1] = mask_2d[:, -1] if mask_2d.shape[1] else False
+    np.not_equal(mask_2d[:, 1:], mask_2d[:, :-1], out=transitions[:, 1:-1])
+    
+    # Within each cell, starts and ends alternate, so a single scan 
+    # of the flattened transitions yields them in pairs
+    row_length = transitions.shape[1]
+    flat_positions = np.flatnonzero(transitions)
+    cells, starts = np.divmod(flat_positions[0::2], row_length)
+    lengths = flat_positions[1::2] - flat_positions[0::2]
+    counts = np.bincount(cells, minlength=mask_2d.shape[0]).reshape(cell_shape)
+    
+    return cells, starts, lengths, counts
+
+
+def run_length_statistics(mask: np.ndarray,
+                          statistic: str | list[str],
+                          min_length: int | list[int] = 1,
+                          axis: int = 0) -> np.ndarray | list[np.ndarray]:
+    """
+    Reduce the runs of consecutive True values of a boolean array along an axis
+    into a statistic per cell, e.g. the longest spell of days above a threshold
+    for every grid cell.
+
+    Parameters
+    ----------
+    mask : numpy.ndarray
+        Boolean array, e.g. of shape (time, lat, lon).
+    statistic : {"max_length", "n_occurrences", "n_runs"} | list[str]
+        Statistic of the runs lasting at least `min_length` steps, 
+        or a list of them, all computed over the same pass:
+        - "max_length": length of the longest run (0 if there is none),
+        - "n_occurrences": number of steps belonging to such runs,
+        - "n_runs": number of such runs.
+    min_length : int | list[int], optional
+        Minimum length of the runs taken into account, or one per statistic. 
+        Default is 1 (all runs).
+    axis : int, optional
+        Axis along which runs are found. Default is 0 (time first).
+
+    Returns
+    -------
+    numpy.ndarray | list[numpy.ndarray]
+        Integer statistic per cell, with the shape of `mask` without `axis`
+        (zero-dimensional for one-dimensional masks), or a list of them.
+        
+    Notes
+    -----
+    Masks with few cells are run-length encoded at once (`run_length_encode`).
+    Masks with at least `RUN_LENGTH_STEPPING_MIN_CELLS` cells are instead 
+    stepped through along `axis`, updating the current run length of every
+    cell at each step, which avoids materialising every run of large grids
+    and reads the time-first layout in place. Counts of all True values
+    (n_occurrences of runs of any length) are taken directly.
+    """
+    statistics = [statistic] if isinstance(statistic, str) else list(statistic)
+    min_lengths = np.broadcast_to(min_length, len(statistics)).tolist()
+    for stat in statistics:
+        if stat not in RUN_LENGTH_STATISTICS:
+            raise ValueError(f"Unsupported statistic '{stat}'. "
+                             f"Options are {RUN_LENGTH_STATISTICS}.")
+    
+    mask = np.moveaxis(np.asarray(mask, dtype=bool), axis, 0)
+    requests = list(zip(statistics, min_lengths))
+    results = {}
+    for stat, length in requests:
+        if stat == "n_occurrences" and length <= 1:
+            results[stat, length] = mask.sum(axis=0, dtype=np.int32)
+    
+    run_requests = [request for request in requests if request not in results]
+    if run_requests:
+        n_cells = int(np.prod(mask.shape[1:]))
+        if n_cells >= RUN_LENGTH_STEPPING_MIN_CELLS:
+            results.update(_step_run_lengths(mask.reshape(len(mask), n_cells), 
+                                             run_requests))
+        else:
+            cells, _, lengths, counts = run_length_encode(mask, axis=0)
+            results.update({(stat, length): reduce_run_lengths(cells, lengths, counts, 
+                                                               stat, length)
+                            for stat, length in run_requests})
+    
+    outputs = [np.asarray(results[request], dtype=np.int64).reshape(mask.shape[1:]) 
+               for request in requests]
+    return outputs[0] if isinstance(statistic, str) else outputs
+
+
+def reduce_run_lengths(cells: np.ndarray,
+                       lengths: np.ndarray,
+                       counts: np.ndarray,
+                       statistic: str,
+                       min_length: int = 1) -> np.ndarray:
+    """
+    Reduce runs already encoded by `run_length_encode` into a statistic 
+    per cell, so that a single encoding serves several statistics.
+
+    Parameters
+    ----------
+    cells, lengths, counts : numpy.ndarray
+        Cell and length of each run and number of runs per cell, 
+        as returned by `run_length_encode`.
+    statistic : {"max_length", "n_occurrences", "n_runs"}
+        Statistic of the runs lasting at least `min_length` steps,
+        as in `run_length_statistics`.
+    min_length : int, optional
+        Minimum length of the runs taken into account. Default is 1 (all runs).
+
+    Returns
+    -------
+    numpy.ndarray
+        Integer statistic per cell, with the shape of `counts`.
+    """
+    if statistic not in RUN_LENGTH_STATISTICS:
+        raise ValueError(f"Unsupported statistic '{statistic}'. "
+                         f"Options are {RUN_LENGTH_STATISTICS}.")
+    
+    if min_length > 1:
+        long_runs = lengths >= min_length
+        cells, lengths = cells[long_runs], lengths[long_runs]
+    n_cells = counts.size
+    
+    if statistic == "n_runs":
+        result = np.bincount(cells, minlength=n_cells)
+    elif statistic == "n_occurrences":
+        result = np.bincount(cells, weights=lengths, minlength=n_cells).astype(np.int64)
+    else:
+        # Runs are sorted by cell, so each cell's runs form a segment
+        result = np.zeros(n_cells, dtype=np.int64)
+        if len(cells):
+            seg_starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+            result[cells[seg_starts]] = np.maximum.reduceat(lengths, seg_starts)
+            
+    return result.reshape(counts.shape)
+
+
+def _step_run_lengths(mask_2d: np.ndarray, 
+                      requests: list[tuple[str, int]]
+                      ) -> dict[tuple[str, int], np.ndarray]:
+    """
+    Run statistics of a (step, cell) mask, stepping along its first axis
+    while keeping the current run length of every cell: runs are accounted 
+    for as they close, and the longest one is tracked as it grows.
+    """
+    n_cells = mask_2d.shape[1]
+    run = np.zeros(n_cells, dtype=np.int32)
+    longest = np.zeros(n_cells, dtype=np.int32)
+    closing = np.empty(n_cells, dtype=bool)
+    
+    closing_requests = [request for request in requests if request[0] != "max_length"]
+    closed = {request: np.zeros(n_cells, dtype=np.int64) 
+              for request in closing_requests}
+    
+    # A final step without runs closes those still open
+    no_runs = np.zeros(n_cells, dtype=bool)
+    for step in range(len(mask_2d) + 1):
+        row = mask_2d[step] if step < len(mask_2d) else no_runs
+        
+        # Runs of the previous step (long enough) ending at this one
+        for stat, length in closing_requests:
+            np.greater_equal(run, max(length, 1), out=closing)
+            np.greater(closing, row, out=closing)
+            if stat == "n_runs":
+                closed[stat, length] += closing
+            else:
+                np.add(closed[stat, length], run, 
+                       out=closed[stat, length], where=closing)
+                
+        run += 1
+        run *= row
+        np.maximum(longest, run, out=longest)
+    
+    # The longest run does not depend on the minimum length, unless none reaches it
+    results = dict(closed)
+    for stat, length in requests:
+        if stat == "max_length":
+            results[stat, length] = np.where(longest >= length, longest, 0)
+    return results
+
+
+# Table file streaming #
+#-----------------------#
+
+def iter_table_batches(file_path: str,
+                       batch_size: int = 1_000_000,
+                       columns: list[str] | None = None,
+                       file_format: str | None = None,
+                       **read_kwargs) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV or Parquet table file in batches of rows, 
+    so that files larger than memory can be processed batch by batch.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the table file.
+    batch_size : int, optional
+        Maximum number of rows per batch. Defaults to 1 000 000.
+    columns : list[str] | None, optional
+        Columns to read. Defaults to None, reading all of them.
+    file_format : {"csv", "parquet"} | None, optional
+        Format of the file. Defaults to None, inferring it from 
+        the file extension (see `TABLE_FILE_EXTENSIONS`).
+    **read_kwargs
+        Additional keyword arguments for `pandas.read_csv` (CSV files only),
+        e.g. the separator.
+
+    Yields
+    ------
+    pandas.DataFrame
+        Consecutive batches of rows.
+
+    Raises
+    ------
+    ValueError
+        If the file format is unsupported.
+    ImportError
+        If a Parquet file is given and 'pyarrow' is not installed.
+    """
+    file_format = _get_table_format(file_path, file_format)
+    if file_format == "csv":
+        with pd.read_csv(file_path, chunksize=batch_size, usecols=columns, 
+                         **read_kwargs) as reader:
+            yield from reader
+    else:
+        parquet_file = _open_parquet_file(file_path)
+        for record_batch in parquet_file.iter_batches(batch_size=batch_size, 
+                                                      columns=columns):
+            yield record_batch.to_pandas()
+
+
+def get_table_columns(file_path: str, 
+                      file_format: str | None = None, 
+                      **read_kwargs) -> list[str]:
+    """
+    Get the column names of a CSV or Parquet table file, 
+    reading only its header or schema.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the table file.
+    file_format : {"csv", "parquet"} | None, optional
+        Format of the file. Defaults to None, inferring it from the file extension.
+    **read_kwargs
+        Additional keyword arguments for `pandas.read_csv` (CSV files only).
+
+    Returns
+    -------
+    list[str]
+        Column names, in file order.
+    """
+    file_format = _get_table_format(file_path, file_format)
+    if file_format == "csv":
+        return pd.read_csv(file_path, nrows=0, **read_kwargs).columns.tolist()
+    else:
+        return _open_parquet_file(file_path).schema_arrow.names
+
+
+def _get_table_format(file_path: str, file_format: str | None) -> str:
+    """Validate the table file format, or infer it from the file extension."""
+    if file_format is None:
+        file_name = str(file_path).lower()
+        file_format = next((fmt for fmt, extensions in TABLE_FILE_EXTENSIONS.items()
+                            if file_name.endswith(tuple(extensions))), None)
+        if file_format is None:
+            raise ValueError(f"Could not infer the table format of '{file_path}'. "
+                             f"Supported extensions are {TABLE_FILE_EXTENSIONS}.")
+    elif file_format not in TABLE_FILE_EXTENSIONS:
+        raise ValueError(f"Unsupported table file format '{file_format}'. "
+                         f"Options are {list(TABLE_FILE_EXTENSIONS)}.")
+    return file_format
+
+
+def _open_parquet_file(file_path: str):
+    """Open a Parquet file for batched reading, importing pyarrow lazily."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as err:
+        raise ImportError("Reading Parquet files requires 'pyarrow'. "
+                          "Install it with 'pip install pyarrow'.") from err
+    return pq.ParquetFile(file_path)
+
+
+# Calendar indexing #
+#-------------------#
+
+class CalendarIndex:
+    """
+    Compact calendar decomposition of a time axis.
+
+    The date components are decoded once from the underlying datetime64
+    array using integer arithmetic, and stored as small integer arrays,
+    so that repeated calendar selections and groupings over the same
+    time axis do not go through the datetime accessors again.
+
+    Parameters
+    ----------
+    dates : pandas.Series | pandas.DatetimeIndex | xarray.DataArray | numpy.ndarray
+        Array of dates.
+
+    Attributes
+    ----------
+    year : numpy.ndarray
+        Year of each date (int16).
+    month : numpy.ndarray
+        Month of each date (int8).
+    day : numpy.ndarray
+        Day of the month of each date (int8).
+    hour : numpy.ndarray
+        Hour of each date (int8).
+    dayofyear : numpy.ndarray
+        Day of the year of each date (int16).
+
+    Notes
+    -----
+    Instances are best obtained through `get_calendar_index`,
+    which caches them per time axis.
+    """
+    
+    def __init__(self, dates):
+        dt_arr = _to_datetime64(dates)
+        day_arr = dt_arr.astype("datetime64[D]")
+        month_arr = dt_arr.astype("datetime64[M]")
+        year_arr = dt_arr.astype("datetime64[Y]")
+        
+        self.year = (year_arr.astype(np.int64) + 1970).astype(np.int16)
+        self.month = (month_arr.astype(np.int64) % 12 + 1).astype(np.int8)
+        month_days = (day_arr - month_arr.astype("datetime64[D]")).astype(np.int64)
+        self.day = (month_days + 1).astype(np.int8)
+        self.hour = (dt_arr - day_arr).astype("timedelta64[h]").astype(np.int8)
+        year_days = (day_arr - year_arr.astype("datetime64[D]")).astype(np.int64)
+        self.dayofyear = (year_days + 1).astype(np.int16)
+        
+        # Group offsets, computed on demand
+        self._group_offsets = {}
+        
+    def __len__(self) -> int:
+        return len(self.year)
+    
+    def codes(self, time_freq: str, include_year: bool = False) -> np.ndarray:
+        """
+        Encode each date as an integer calendar key.
+
+        Keys are built as month*10000 + day*100 + hour, restricted to the
+        components relevant to the time frequency, so that their numerical
+        order matches the calendar order.
+
+        Parameters
+        ----------
+        time_freq : {"monthly", "daily", "hourly"}
+            Time frequency of the keys.
+        include_year : bool, optional
+            If True, the year is prepended to the keys (year*1000000 + ...),
+            which then identify absolute periods instead of calendar positions.
+            Defaults to False.
+
+        Returns
+        -------
+        numpy.ndarray
+            Calendar keys, int32 (int64 if the year is included).
+        """
+        if time_freq not in CALENDAR_CODE_FACTORS:
+            raise ValueError(f"Unsupported time frequency '{time_freq}'. "
+                             f"Options are {list(CALENDAR_CODE_FACTORS)}.")
+            
+        month_factor, day_factor, hour_factor = CALENDAR_CODE_FACTORS[time_freq]
+        codes = self.month.astype(np.int32) * month_factor
+        if day_factor:
+            codes += self.day.astype(np.int32) * day_factor
+        if hour_factor:
+            codes += self.hour.astype(np.int32) * hour_factor
+        if include_year:
+            codes = codes + self.year.astype(np.int64) * YEAR_CODE_FACTOR
+        return codes
+    
+    def group_offsets(self,
+                      time_freq: str,
+                      include_year: bool = False
+                      ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sorting permutation and segment offsets of the calendar keys.
+
+        Parameters
+        ----------
+        time_freq : {"monthly", "daily", "hourly"}
+            Time frequency of the keys.
+        include_year : bool, optional
+            Whether the keys include the year. Defaults to False.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            sort_order : numpy.ndarray
+                Stable permutation that sorts the dates by calendar key.
+            offsets : numpy.ndarray
+                Start position of each group in the sorted order,
+                followed by the total length.
+            group_codes : numpy.ndarray
+                Sorted unique calendar keys.
+        """
+        key = (time_freq, include_year)
+        if key not in self._group_offsets:
+            codes = self.codes(time_freq, include_year)
+            sort_order = np.argsort(codes, kind="stable")
+            sorted_codes = codes[sort_order]
+            starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+            offsets = np.r_[starts, len(codes)]
+            self._group_offsets[key] = (sort_order, offsets, sorted_codes[starts])
+        return self._group_offsets[key]
+    
+    def season_codes(self, 
+                     seasons: list[list[int]], 
+                     include_year: bool = False) -> np.ndarray:
+        """
+        Encode each date as the index of the season it belongs to.
+
+        Seasons are looked up from the month of each date through a
+        month-to-season table, so a whole set of seasons is labelled at once.
+
+        Parameters
+        ----------
+        seasons : list[list[int]]
+            Non-overlapping seasons, each one as the list of its month 
+            numbers in calendar order (e.g. [[12, 1, 2], [3, 4, 5]]).
+        include_year : bool, optional
+            If True, the season year is prepended to the keys 
+            (season_year*1000000 + season index), which then identify 
+            absolute seasons. The season year is that of the season's last 
+            month, so that e.g. December is assigned to the following 
+            winter (DJF). Defaults to False.
+
+        Returns
+        -------
+        numpy.ndarray
+            Season keys (int64), -1 for dates outside every season.
+        """
+        season_of_month, year_offset = _season_lookup(seasons)
+        codes = season_of_month[self.month]
+        if include_year:
+            season_years = self.year.astype(np.int64) + year_offset[self.month]
+            codes = np.where(codes >= 0, season_years * YEAR_CODE_FACTOR + codes, -1)
+        return codes
+    
+    def group_positions(self, 
+                        time_freq: str, 
+                        code: int, 
+                        include_year: bool = False) -> np.ndarray:
+        """
+        Positions of the dates matching a calendar key, in time order.
+
+        Parameters
+        ----------
+        time_freq : {"monthly", "daily", "hourly"}
+            Time frequency of the key.
+        code : int
+            Calendar key, as given by `codes`.
+        include_year : bool, optional
+            Whether the key includes the year. Defaults to False.
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer positions, empty if the key is not present.
+        """
+        sort_order, offsets, group_codes = self.group_offsets(time_freq, include_year)
+        i = np.searchsorted(group_codes, code)
+        if i == len(group_codes) or group_codes[i] != code:
+            return np.empty(0, dtype=np.int64)
+        return sort_order[offsets[i]:offsets[i+1]]
+
+
+def get_calendar_index(dates) -> CalendarIndex:
+    """
+    Return the calendar index of a time axis, building it only once.
+
+    Indices are cached by the content hash of the datetime64 array,
+    so that every call over the same timestamps (even through different
+    containers or copies) reuses the same decomposition. The least
+    recently used entries are evicted beyond `CALENDAR_INDEX_CACHE_SIZE`.
+
+    Parameters
+    ----------
+    dates : pandas.Series | pandas.DatetimeIndex | xarray.DataArray | numpy.ndarray
+        Array of dates.
+
+    Returns
+    -------
+    CalendarIndex
+        Calendar index of the dates.
+    """
+    dt_arr = _to_datetime64(dates)
+    digest = hashlib.blake2b(np.ascontiguousarray(dt_arr).view(np.uint8), 
+                             digest_size=16).digest()
+    key = (len(dt_arr), digest)
+    
+    if key in _CALENDAR_INDEX_CACHE:
+        _CALENDAR_INDEX_CACHE.move_to_end(key)
+    else:
+        _CALENDAR_INDEX_CACHE[key] = CalendarIndex(dt_arr)
+        if len(_CALENDAR_INDEX_CACHE) > CALENDAR_INDEX_CACHE_SIZE:
+            _CALENDAR_INDEX_CACHE.popitem(last=False)
+    return _CALENDAR_INDEX_CACHE[key]
+
+
+def normalise_season_set(season_months) -> dict[str, list[int]]:
+    """
+    Normalise a season or a set of seasons into labelled month lists.
+
+    Parameters
+    ----------
+    season_months : list[int] | list[list[int]] | dict[str, list[int]]
+        Month numbers of a single season (e.g. [12, 1, 2]), a list of
+        seasons (e.g. [[12, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10, 11]]),
+        or seasons keyed by their label (e.g. `STANDARD_SEASONS`).
+
+    Returns
+    -------
+    dict[str, list[int]]
+        Month numbers of each season, keyed by their label, which defaults
+        to the acronym of the month initials (e.g. 'DJF').
+
+    Raises
+    ------
+    ValueError
+        If a season is empty, a month number is out of range,
+        seasons overlap or their labels are repeated.
+    """
+    if isinstance(season_months, dict):
+        season_set = {label: list(months) for label, months in season_months.items()}
+    else:
+        season_list = list(season_months)
+        if season_list and np.ndim(season_list[0]) == 0:
+            season_list = [season_list]
+        season_set = {"".join(MONTH_NUMBER_DICT[month] for month in months): 
+                      list(months)
+                      for months in season_list}
+        if len(season_set) != len(season_list):
+            raise ValueError("Season labels must be unique; pass the seasons "
+                             "as a dictionary keyed by their labels instead.")
+    
+    for label, months in season_set.items():
+        if not months or not all(1 <= month <= 12 for month in months):
+            raise ValueError(f"Season '{label}' must contain month numbers "
+                             f"between 1 and 12, got {months}.")
+    
+    # Also checks that the seasons do not overlap
+    _season_lookup(list(season_set.values()))
+    return season_set
+
+
+def season_end_dates(seasons: list[list[int]], 
+                     season_idx: np.ndarray, 
+                     season_years: np.ndarray) -> np.ndarray:
+    """
+    Last day of each given season.
+
+    Parameters
+    ----------
+    seasons : list[list[int]]
+        Month numbers of each season, in calendar order.
+    season_idx : numpy.ndarray
+        Index of the season (in `seasons`) of each date to compute.
+    season_years : numpy.ndarray
+        Season year (year of the season's last month) of each date.
+
+    Returns
+    -------
+    numpy.ndarray
+        Last day of each season, as datetime64[ns].
+    """
+    last_months = np.array([months[-1] for months in seasons])[np.asarray(season_idx)]
+    years = np.asarray(season_years, dtype=np.int64)
+    month_offsets = (years - 1970) * 12 + last_months - 1
+    month_starts = month_offsets.astype("datetime64[M]")
+    return ((month_starts + 1).astype("datetime64[D]") - 1).astype("datetime64[ns]")
+
+
+def _season_lookup(seasons: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Month-to-season lookup tables (indexed by month number): season index
+    (-1 for months outside every season) and offset from the calendar year
+    to the season year, which is 1 for the months of a season preceding 
+    its wrap around the end of the year (e.g. December in DJF).
+    """
+    season_of_month = np.full(13, -1, dtype=np.int64)
+    year_offset = np.zeros(13, dtype=np.int64)
+    
+    for season_idx, months in enumerate(seasons):
+        for pos, month in enumerate(months):
+            if season_of_month[month] >= 0:
+                raise ValueError(f"Month {month} belongs to more than one season.")
+            season_of_month[month] = season_idx
+            year_offset[month] = int(any(later_month < month 
+                                         for later_month in months[pos+1:]))
+            
+    return season_of_month, year_offset
+
+
+def _to_datetime64(dates) -> np.ndarray:
+    """Get the datetime64[ns] array underlying a date container."""
+    return np.asarray(dates).astype("datetime64[ns]", copy=False).ravel()
+
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Partial aggregates and statistics derivable from them #
+PARTIAL_AGGREGATE_KEYS = ["count", "sum", "mean", "m2", "min", "max"]
+PARTIAL_AGGREGATE_STATISTICS = ["max", "min", "sum", "mean", "std"]
+
+# Calendar code factors (month, day, hour) per time frequency #
+CALENDAR_CODE_FACTORS = {
+    "monthly": (1, 0, 0),
+    "daily": (100, 1, 0),
+    "hourly": (10000, 100, 1)
+}
+YEAR_CODE_FACTOR = 1000000
+
+# Standard meteorological seasons #
+STANDARD_SEASONS = {
+    "DJF": [12, 1, 2],
+    "MAM": [3, 4, 5],
+    "JJA": [6, 7, 8],
+    "SON": [9, 10, 11]
+}
+
+# Statistics of runs of consecutive True values #
+RUN_LENGTH_STATISTICS = ["max_length", "n_occurrences", "n_runs"]
+
+# Minimum number of cells stepped through along the run axis #
+RUN_LENGTH_STEPPING_MIN_CELLS = 1024
+
+# Table file extensions per format #
+TABLE_FILE_EXTENSIONS = {
+    "csv": [".csv", ".csv.gz", ".csv.bz2", ".csv.xz", ".csv.zip"],
+    "parquet": [".parquet", ".pq"]
+}
+
+# Calendar index cache #
+CALENDAR_INDEX_CACHE_SIZE = 16
+_CALENDAR_INDEX_CACHE = OrderedDict()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Consistency checks between the chunked and whole-array decompositions 
+of cumulative data.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+import numpy as np
+import pytest
+
+from statflow.core.time_series import (
+    decompose_cumulative_data,
+    decompose_cumulative_data_chunked
+)
+
+#------------------#
+# Define functions #
+#------------------#
+
+def _cumulative_array(shape, reset_period=None, reset_offset=0, seed=0):
+    """Build accumulations of random increments, optionally restarting periodically."""
+    increments = np.random.default_rng(seed).uniform(0, 5, size=shape)
+    if reset_period is None:
+        return np.cumsum(increments, axis=0)
+    cumulative = np.empty_like(increments)
+    total = np.zeros(shape[1:])
+    for step in range(shape[0]):
+        if (step - reset_offset) % reset_period == 0:
+            total = np.zeros(shape[1:])
+        total = total + increments[step]
+        cumulative[step] = total
+    return cumulative
+
+
+@pytest.mark.parametrize("shape", [(25,), (25, 3, 4)])
+@pytest.mark.parametrize("chunk_size", [1, 3, 4, 7, 25, 30])
+@pytest.mark.parametrize("reset_period, reset_offset", [(None, 0), (6, 0), (6, 2)])
+def test_chunked_matches_whole_array(shape, chunk_size, reset_period, reset_offset):
+    cumulative = _cumulative_array(shape, reset_period, reset_offset)
+    kwargs = dict(reset_period=reset_period, reset_offset=reset_offset)
+
+    expected = decompose_cumulative_data(cumulative, **kwargs)
+    result = decompose_cumulative_data_chunked(cumulative, chunk_size, **kwargs)
+
+    np.testing.assert_allclose(result, expected)
+    if reset_period is None:
+        np.testing.assert_allclose(np.cumsum(result, axis=0), cumulative)
+
+
+@pytest.mark.parametrize("shape", [(10,), (10, 2, 3)])
+def test_chunked_fill_value(shape):
+    cumulative = _cumulative_array(shape)
+    cumulative[5] -= 100  # Spurious drop
+
+    expected = decompose_cumulative_data(cumulative, fill_value=0)
+    result = decompose_cumulative_data_chunked(cumulative, 4, fill_value=0)
+
+    np.testing.assert_allclose(result, expected)
+    assert (result >= 0).all()
+
+
+def test_chunked_along_last_axis():
+    cumulative = np.moveaxis(_cumulative_array((25, 3, 4)), 0, -1)
+
+    expected = decompose_cumulative_data(cumulative, axis=-1)
+    result = decompose_cumulative_data_chunked(cumulative, 7, axis=-1)
+
+    np.testing.assert_allclose(result, expected)
+
+
+def test_restarts_give_cumulative_values():
+    cumulative = np.array([1, 3, 6, 2, 2, 5])
+    expected = np.array([1., 2., 3., 2., 0., 3.])
+
+    np.testing.assert_allclose(decompose_cumulative_data(cumulative, reset_period=3),
+                               expected)
+    np.testing.assert_allclose(decompose_cumulative_data_chunked(cumulative, 4,
+                                                                 reset_period=3),
+                               expected)
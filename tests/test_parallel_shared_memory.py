@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Regression checks for the shared memory process pools of the parallel 
+grouped reductions.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+#------------------#
+# Define functions #
+#------------------#
+
+PARALLEL_CLIMATOLOGY_SCRIPT = textwrap.dedent("""
+    import multiprocessing
+    import sys
+
+    import numpy as np
+    import pandas as pd
+
+    from statflow.fields.climatology.periodic_climat_stats import (
+        climat_periodic_statistics
+    )
+
+    if __name__ == "__main__":
+        multiprocessing.set_start_method(sys.argv[1])
+        dates = pd.date_range("2000-01-01", periods=1000, freq="D")
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"date": dates,
+                           "tas": rng.normal(size=1000),
+                           "pr": rng.normal(size=1000)})
+        for _ in range(3):
+            climat_periodic_statistics(df, "mean", "daily", n_workers=2)
+""")
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_parallel_climatology_leaves_resource_tracker_clean(tmp_path, start_method):
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"Start method '{start_method}' not available on this platform.")
+    
+    script_path = tmp_path / "parallel_climatology.py"
+    script_path.write_text(PARALLEL_CLIMATOLOGY_SCRIPT)
+    # The script runs outside the repository, so statflow must be importable
+    # from the repository and the paths of the test session when not installed
+    python_path = os.pathsep.join([str(REPOSITORY_ROOT), *sys.path])
+    env = {**os.environ, "PYTHONPATH": python_path}
+    completed = subprocess.run([sys.executable, "-W", "ignore", str(script_path),
+                                start_method],
+                               capture_output=True, text=True, timeout=300,
+                               cwd=REPOSITORY_ROOT, env=env)
+    
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stderr == ""
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[1]